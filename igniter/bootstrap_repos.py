@@ -3,6 +3,8 @@
 from __future__ import annotations
 import logging as log
 import os
+import hmac
+import json
 import re
 import shutil
 import sys
@@ -11,6 +13,7 @@ from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -54,6 +57,162 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+class ValidationStampCache:
+    """Local cache of successful validations of OpenPype versions.
+
+    Full validation calculates sha256 of each file of a version which is
+    slow on network-mounted repositories. After successful validation is
+    stored stamp with size and modification time of each file and digest
+    of 'checksums' file. When stamp matches current state of the version
+    the hashing is skipped.
+
+    Stamps are signed with a key stored next to them so stamps copied
+    from elsewhere or modified by hand are ignored.
+
+    Args:
+        cache_dir (Path): Directory where stamps are stored.
+
+    """
+
+    key_filename = ".stamp_key"
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = Path(cache_dir)
+        self._key = None
+
+    @staticmethod
+    def get_file_stats(path: Path, file_names: List[str]) -> dict:
+        """Get size and modification time of files.
+
+        Args:
+            path (Path): Root directory of files.
+            file_names (list[str]): Relative paths to files.
+
+        Returns:
+            dict: Size and modification time by file name.
+
+        Raises:
+            OSError: When file does not exist or can't be accessed.
+
+        """
+        stats = {}
+        for file_name in file_names:
+            stat = os.stat(path / file_name)
+            stats[file_name] = [stat.st_size, stat.st_mtime_ns]
+        return stats
+
+    def is_valid(self, path: Path, checksums_digest: Union[str, None],
+                 file_stats: dict) -> bool:
+        """Check if version was already validated in the same state.
+
+        Args:
+            path (Path): Path to version directory or zip file.
+            checksums_digest (Union[str, None]): Sha256 of 'checksums' file.
+            file_stats (dict): Current stats from 'get_file_stats'.
+
+        Returns:
+            bool: Stamp exists and matches current state.
+
+        """
+        stamp_path = self._get_stamp_path(path)
+        try:
+            with open(stamp_path, "r") as stream:
+                stamp = json.load(stream)
+        except (OSError, ValueError):
+            return False
+
+        data = stamp.get("data")
+        signature = stamp.get("signature")
+        if not isinstance(data, dict) or not signature:
+            return False
+
+        expected_signature = self._sign(data)
+        if (
+            expected_signature is None
+            or not hmac.compare_digest(expected_signature, signature)
+        ):
+            return False
+
+        return (
+            data.get("path") == str(path)
+            and data.get("checksums_digest") == checksums_digest
+            and data.get("files") == file_stats
+        )
+
+    def store(self, path: Path, checksums_digest: Union[str, None],
+              file_stats: dict) -> None:
+        """Store stamp of successfully validated version.
+
+        Failures are ignored as stamp is only an optimization.
+
+        Args:
+            path (Path): Path to version directory or zip file.
+            checksums_digest (Union[str, None]): Sha256 of 'checksums' file.
+            file_stats (dict): Stats from 'get_file_stats'.
+
+        """
+        data = {
+            "path": str(path),
+            "checksums_digest": checksums_digest,
+            "files": file_stats
+        }
+        signature = self._sign(data, create_key=True)
+        if signature is None:
+            return
+
+        stamp_path = self._get_stamp_path(path)
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".tmp_", suffix=".json", dir=self._cache_dir
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump({"data": data, "signature": signature}, stream)
+            os.replace(tmp_path, stamp_path)
+        except OSError:
+            return
+
+    def _get_stamp_path(self, path: Path) -> Path:
+        path_hash = hashlib.sha256(str(path).encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{path_hash}.json"
+
+    def _get_key(self, create: bool = False) -> Union[bytes, None]:
+        if self._key is not None:
+            return self._key
+
+        key_path = self._cache_dir / self.key_filename
+        try:
+            self._key = key_path.read_bytes()
+            return self._key
+        except OSError:
+            if not create:
+                return None
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            key = os.urandom(32)
+            fd = os.open(
+                key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            )
+            with os.fdopen(fd, "wb") as stream:
+                stream.write(key)
+        except FileExistsError:
+            # Other process created the key meanwhile
+            key = key_path.read_bytes()
+        except OSError:
+            return None
+
+        self._key = key
+        return key
+
+    def _sign(self, data: dict, create_key: bool = False
+              ) -> Union[str, None]:
+        key = self._get_key(create_key)
+        if not key:
+            return None
+        content = json.dumps(data, sort_keys=True).encode("utf-8")
+        return hmac.new(key, content, hashlib.sha256).hexdigest()
+
+
 class OpenPypeVersion(semver.VersionInfo):
     """Class for storing information about OpenPype version.
 
@@ -561,6 +720,9 @@ class BootstrapRepos:
         self.openpype_filter = [
             "openpype", "schema", "LICENSE"
         ]
+        self.validation_cache = ValidationStampCache(
+            Path(user_data_dir("openpype", "pypeclub")) / "validation_stamps"
+        )
 
         # dummy progress reporter
         def empty_progress(x: int):
@@ -872,13 +1034,44 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        validation_cache = None
+        if not os.getenv("OPENPYPE_DONT_CACHE_VERSION_VALIDATION"):
+            validation_cache = self.validation_cache
+
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            return self._validate_zip(path, validation_cache)
+        return self._validate_dir(path, validation_cache)
 
     @staticmethod
-    def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+    def _validate_zip(path: Path,
+                      validation_cache: ValidationStampCache = None
+                      ) -> tuple:
+        """Validate content of zip file.
+
+        Args:
+            path (Path): Path to zip file to validate.
+            validation_cache (ValidationStampCache, optional): Cache of
+                previous successful validations.
+
+        Returns:
+            tuple(bool, str): returns status and reason as a bool
+                and str in a tuple.
+
+        """
+        # Zip file is stamped as one file, content of archive is not
+        #   checked without full validation
+        stamp_args = None
+        if validation_cache is not None:
+            try:
+                file_stats = validation_cache.get_file_stats(
+                    path.parent, [path.name])
+                stamp_args = (path, None, file_stats)
+            except OSError:
+                stamp_args = None
+
+            if stamp_args and validation_cache.is_valid(*stamp_args):
+                return True, "All ok (cached)"
+
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
@@ -916,14 +1109,24 @@ class BootstrapRepos:
                 if h.hexdigest() != file_checksum:
                     return False, f"Invalid checksum on {file_name}"
 
+        if stamp_args:
+            validation_cache.store(*stamp_args)
         return True, "All ok"
 
     @staticmethod
-    def _validate_dir(path: Path) -> tuple:
+    def _validate_dir(path: Path,
+                      validation_cache: ValidationStampCache = None
+                      ) -> tuple:
         """Validate checksums in a given path.
 
+        If stamp of previous validation matches size and modification time
+        of all files, checksums are not calculated again. Otherwise are
+        checksums calculated in parallel.
+
         Args:
             path (Path): path to folder to validate.
+            validation_cache (ValidationStampCache, optional): Cache of
+                previous successful validations.
 
         Returns:
             tuple(bool, str): returns status and reason as a bool
@@ -935,6 +1138,8 @@ class BootstrapRepos:
             # FIXME: This should be set to False sometimes in the future
             return True, "Cannot read checksums for archive."
         checksums_data = checksums_file.read_text()
+        checksums_digest = hashlib.sha256(
+            checksums_data.encode("utf-8")).hexdigest()
         checksums = [
             tuple(line.split(":"))
             for line in checksums_data.split("\n") if line
@@ -953,18 +1158,48 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
+        file_stats = None
+        if validation_cache is not None:
+            try:
+                file_stats = validation_cache.get_file_stats(
+                    path, [file[1] for file in checksums])
+            except OSError:
+                file_stats = None
+
+            if file_stats is not None and validation_cache.is_valid(
+                path, checksums_digest, file_stats
+            ):
+                return True, "All ok (cached)"
+
         # calculate and compare checksums
-        for file_checksum, file_name in checksums:
+        file_names = []
+        for _, file_name in checksums:
             if platform.system().lower() == "windows":
                 file_name = file_name.replace("/", "\\")
+            file_names.append(file_name)
+
+        def _checksum(file_name):
             try:
-                current = sha256sum((path / file_name).as_posix())
+                return sha256sum((path / file_name).as_posix())
             except FileNotFoundError:
-                return False, f"Missing file [ {file_name} ]"
+                return None
+
+        # Hashing is mostly waiting for IO (especially on network drives)
+        #   and 'hashlib' releases GIL so threads are enough
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            current_checksums = executor.map(_checksum, file_names)
+            for (file_checksum, _), file_name, current in zip(
+                checksums, file_names, current_checksums
+            ):
+                if current is None:
+                    return False, f"Missing file [ {file_name} ]"
 
-            if file_checksum != current:
-                return False, f"Invalid checksum on {file_name}"
+                if file_checksum != current:
+                    return False, f"Invalid checksum on {file_name}"
 
+        if file_stats is not None:
+            validation_cache.store(path, checksums_digest, file_stats)
         return True, "All ok"
 
     @staticmethod
@@ -38,6 +38,9 @@ class AliasedGroup(click.Group):
               help=("Change OpenPype log level (debug - critical or 0-50)"))
 @click.option("--automatic-tests", is_flag=True, expose_value=False,
               help=("Run in automatic tests mode"))
+@click.option("--trace-startup", is_flag=True, expose_value=False,
+              help=("Record startup timings to json trace"
+                    " (see OPENPYPE_STARTUP_TRACE)"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
@@ -373,6 +376,17 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.option("--project", help="Project name", required=True)
+def rebuild_last_version_index(project):
+    """Rebuild index of last versions of subsets in project.
+
+    Index is maintained on publish but must be built for existing projects
+    or rebuilt when versions were changed by external tools.
+    """
+    PypeCommands().rebuild_last_version_index(project)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
@@ -6,6 +6,8 @@ from .entities import (
     get_projects,
     get_project,
     get_whole_project,
+    get_whole_project_page,
+    iter_whole_project,
 
     get_asset_by_id,
     get_asset_by_name,
@@ -21,6 +23,8 @@ from .entities import (
     get_version_by_id,
     get_version_by_name,
     get_versions,
+    get_versions_page,
+    iter_versions,
     get_hero_version_by_id,
     get_hero_version_by_subset_id,
     get_hero_versions,
@@ -34,6 +38,8 @@ from .entities import (
     get_representation_by_id,
     get_representation_by_name,
     get_representations,
+    get_representations_page,
+    iter_representations,
     get_representation_parents,
     get_representations_parents,
     get_archived_representations,
@@ -45,6 +51,13 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    EntityCache,
+    entity_cache_session,
+    get_active_entity_cache,
+    invalidate_entity_caches,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -62,6 +75,8 @@ __all__ = (
     "get_projects",
     "get_project",
     "get_whole_project",
+    "get_whole_project_page",
+    "iter_whole_project",
 
     "get_asset_by_id",
     "get_asset_by_name",
@@ -77,6 +92,8 @@ __all__ = (
     "get_version_by_id",
     "get_version_by_name",
     "get_versions",
+    "get_versions_page",
+    "iter_versions",
     "get_hero_version_by_id",
     "get_hero_version_by_subset_id",
     "get_hero_versions",
@@ -90,6 +107,8 @@ __all__ = (
     "get_representation_by_id",
     "get_representation_by_name",
     "get_representations",
+    "get_representations_page",
+    "iter_representations",
     "get_representation_parents",
     "get_representations_parents",
     "get_archived_representations",
@@ -100,6 +119,11 @@ __all__ = (
 
     "get_workfile_info",
 
+    "EntityCache",
+    "entity_cache_session",
+    "get_active_entity_cache",
+    "invalidate_entity_caches",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
@@ -4,3 +4,13 @@ if not AYON_SERVER_ENABLED:
     from .mongo.entities import *
 else:
     from .server.entities import *
+
+from .entity_cache import cached_entity_getter
+
+# Functions use entity cache if there is active 'entity_cache_session'
+get_asset_by_id = cached_entity_getter("asset", get_asset_by_id)
+get_subset_by_id = cached_entity_getter("subset", get_subset_by_id)
+get_version_by_id = cached_entity_getter("version", get_version_by_id)
+get_representation_by_id = cached_entity_getter(
+    "representation", get_representation_by_id
+)
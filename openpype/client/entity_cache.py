@@ -0,0 +1,384 @@
+"""Optional cache of project entities for 'openpype.client' functions.
+
+Cache is not used unless it is explicitly activated with
+'entity_cache_session'. While session is active, functions getting single
+entity by id ('get_asset_by_id', 'get_subset_by_id', 'get_version_by_id'
+and 'get_representation_by_id') from 'openpype.client' use the cache
+and entities can be prefetched in bulk before they're needed.
+
+Example:
+    >>> from openpype.client import get_version_by_id
+    >>> with entity_cache_session() as cache:
+    ...     cache.prefetch(project_name, version_ids=version_ids)
+    ...     for version_id in version_ids:
+    ...         version_doc = get_version_by_id(project_name, version_id)
+
+Cached entities are invalidated when are changed by 'OperationsSession'
+in current process. Changes made by other processes are not detected so
+session should not be kept for a long time or 'lifetime' should be set.
+"""
+
+import copy
+import time
+import threading
+import contextlib
+import collections
+
+from openpype import AYON_SERVER_ENABLED
+
+_MISSING = object()
+
+
+def _get_backend():
+    if AYON_SERVER_ENABLED:
+        from .server import entities
+    else:
+        from .mongo import entities
+    return entities
+
+
+def _project_fields(entity, fields):
+    """Reduce entity to requested fields like database projection does.
+
+    Args:
+        entity (dict[str, Any]): Full entity document.
+        fields (Union[Iterable[str], None]): Requested fields.
+
+    Returns:
+        dict[str, Any]: Copy of entity reduced to fields.
+    """
+    if not fields:
+        return copy.deepcopy(entity)
+
+    output = {"_id": entity["_id"]}
+    for field in fields:
+        src = entity
+        keys = field.split(".")
+        for key in keys:
+            if not isinstance(src, dict) or key not in src:
+                src = _MISSING
+                break
+            src = src[key]
+
+        if src is _MISSING:
+            continue
+
+        dst = output
+        for key in keys[:-1]:
+            dst = dst.setdefault(key, {})
+        dst[keys[-1]] = copy.deepcopy(src)
+    return output
+
+
+class EntityCache(object):
+    """LRU cache of entities by project and id.
+
+    Only full entities are stored. Requested fields are extracted from
+    cached entities so one cached entity can serve any query by id.
+
+    Args:
+        max_entities (Optional[int]): Maximum number of cached entities of
+            one project. Least recently used entities are removed.
+        lifetime (Optional[float]): Seconds after which cached entity is
+            outdated. Entities don't outdate if is 'None'.
+    """
+
+    default_max_entities = 10000
+    # Function name and filter argument for each entity type
+    _fetch_info = {
+        "asset": ("get_assets", "asset_ids", {}),
+        "subset": ("get_subsets", "subset_ids", {}),
+        "version": ("get_versions", "version_ids", {"hero": True}),
+        "representation": (
+            "get_representations",
+            "representation_ids",
+            {"archived": True}
+        ),
+    }
+
+    def __init__(self, max_entities=None, lifetime=None):
+        if max_entities is None:
+            max_entities = self.default_max_entities
+        self._max_entities = max_entities
+        self._lifetime = lifetime
+        self._entities_by_project = collections.defaultdict(
+            collections.OrderedDict
+        )
+        self._lock = threading.Lock()
+
+    def _get_key(self, entity_type, entity_id):
+        return entity_type, str(entity_id)
+
+    def get(self, project_name, entity_type, entity_id):
+        """Get cached entity.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Type of entity e.g. 'asset' or 'version'.
+            entity_id (Union[str, ObjectId]): Entity id.
+
+        Returns:
+            Union[dict[str, Any], None, Any]: Cached entity, 'None' if
+                entity does not exist or '_MISSING' if is not cached.
+        """
+        key = self._get_key(entity_type, entity_id)
+        with self._lock:
+            entities = self._entities_by_project.get(project_name)
+            if not entities or key not in entities:
+                return _MISSING
+
+            entity, cached_time = entities[key]
+            if (
+                self._lifetime is not None
+                and time.time() - cached_time > self._lifetime
+            ):
+                entities.pop(key)
+                return _MISSING
+
+            # Move to the end of ordered dict (Python 2 compatible)
+            entities[key] = entities.pop(key)
+            return entity
+
+    def set(self, project_name, entity_type, entity_id, entity):
+        """Store entity to cache.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Type of entity e.g. 'asset' or 'version'.
+            entity_id (Union[str, ObjectId]): Entity id.
+            entity (Union[dict[str, Any], None]): Full entity or 'None'
+                if entity does not exist.
+        """
+        key = self._get_key(entity_type, entity_id)
+        with self._lock:
+            entities = self._entities_by_project[project_name]
+            entities.pop(key, None)
+            entities[key] = (entity, time.time())
+            while len(entities) > self._max_entities:
+                entities.popitem(last=False)
+
+    def invalidate(self, project_name, entity_ids=None):
+        """Remove entities from cache.
+
+        Args:
+            project_name (str): Project name.
+            entity_ids (Optional[Iterable[Union[str, ObjectId]]]): Ids of
+                entities to remove. All entities of project are removed
+                if is 'None'.
+        """
+        with self._lock:
+            if entity_ids is None:
+                self._entities_by_project.pop(project_name, None)
+                return
+
+            entities = self._entities_by_project.get(project_name)
+            if not entities:
+                return
+
+            entity_ids = {str(entity_id) for entity_id in entity_ids}
+            for key in tuple(entities.keys()):
+                if key[1] in entity_ids:
+                    entities.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entities_by_project.clear()
+
+    def get_entities(self, project_name, entity_type, entity_ids):
+        """Get entities by ids and fetch those which are not cached.
+
+        All missing entities are fetched with single query.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Type of entity, one of 'asset', 'subset',
+                'version' or 'representation'.
+            entity_ids (Iterable[Union[str, ObjectId]]): Entity ids.
+
+        Returns:
+            dict[str, Union[dict[str, Any], None]]: Cached full entities
+                by stringified id. Value is 'None' if entity does not exist.
+        """
+        output = {}
+        missing_ids = {}
+        for entity_id in entity_ids:
+            if entity_id is None:
+                continue
+            entity = self.get(project_name, entity_type, entity_id)
+            if entity is _MISSING:
+                missing_ids[str(entity_id)] = entity_id
+            else:
+                output[str(entity_id)] = entity
+
+        if missing_ids:
+            func_name, filter_key, kwargs = self._fetch_info[entity_type]
+            func = getattr(_get_backend(), func_name)
+            kwargs = dict(kwargs)
+            kwargs[filter_key] = list(missing_ids.values())
+            for entity in func(project_name, **kwargs):
+                entity_id = str(entity["_id"])
+                missing_ids.pop(entity_id, None)
+                self.set(project_name, entity_type, entity_id, entity)
+                output[entity_id] = entity
+
+            # Remember entities which don't exist
+            for entity_id in missing_ids:
+                self.set(project_name, entity_type, entity_id, None)
+                output[entity_id] = None
+        return output
+
+    def get_entity(self, project_name, entity_type, entity_id, fields=None):
+        """Get single entity reduced to fields.
+
+        Args:
+            project_name (str): Project name.
+            entity_type (str): Type of entity.
+            entity_id (Union[str, ObjectId]): Entity id.
+            fields (Optional[Iterable[str]]): Fields that should be returned.
+                All fields are returned if 'None' is passed.
+
+        Returns:
+            Union[dict[str, Any], None]: Copy of entity or 'None' if entity
+                does not exist.
+        """
+        if not entity_id:
+            return None
+        entity = self.get_entities(
+            project_name, entity_type, [entity_id]
+        ).get(str(entity_id))
+        if entity is None:
+            return None
+        return _project_fields(entity, fields)
+
+    def prefetch(
+        self,
+        project_name,
+        asset_ids=None,
+        subset_ids=None,
+        version_ids=None,
+        representation_ids=None
+    ):
+        """Fetch multiple entities with one query per entity type.
+
+        Args:
+            project_name (str): Project name.
+            asset_ids (Optional[Iterable[Union[str, ObjectId]]]): Asset ids.
+            subset_ids (Optional[Iterable[Union[str, ObjectId]]]): Subset
+                ids.
+            version_ids (Optional[Iterable[Union[str, ObjectId]]]): Version
+                ids. Hero versions are included.
+            representation_ids (Optional[Iterable[Union[str, ObjectId]]]):
+                Representation ids.
+        """
+        for entity_type, entity_ids in (
+            ("asset", asset_ids),
+            ("subset", subset_ids),
+            ("version", version_ids),
+            ("representation", representation_ids),
+        ):
+            if entity_ids:
+                self.get_entities(project_name, entity_type, entity_ids)
+
+
+class _CacheSessions(object):
+    """Active cache sessions.
+
+    Session stack is stored per thread so session opened in one thread is
+    not used by functions called from other threads. All caches are also
+    registered globally to be able to invalidate them from any thread.
+    """
+
+    lock = threading.Lock()
+    all_caches = []
+    _local = threading.local()
+
+    @classmethod
+    def get_stack(cls):
+        stack = getattr(cls._local, "caches", None)
+        if stack is None:
+            stack = []
+            cls._local.caches = stack
+        return stack
+
+
+@contextlib.contextmanager
+def entity_cache_session(max_entities=None, lifetime=None):
+    """Activate entity cache for 'openpype.client' functions.
+
+    Session is active only in the thread where it was created. Sessions
+    can be nested, the most recent session is used.
+
+    Args:
+        max_entities (Optional[int]): Maximum number of cached entities of
+            one project.
+        lifetime (Optional[float]): Seconds after which cached entity is
+            outdated.
+
+    Yields:
+        EntityCache: Activated cache.
+    """
+    cache = EntityCache(max_entities, lifetime)
+    stack = _CacheSessions.get_stack()
+    stack.append(cache)
+    with _CacheSessions.lock:
+        _CacheSessions.all_caches.append(cache)
+    try:
+        yield cache
+    finally:
+        stack.remove(cache)
+        with _CacheSessions.lock:
+            _CacheSessions.all_caches.remove(cache)
+
+
+def get_active_entity_cache():
+    """Currently active entity cache of current thread.
+
+    Returns:
+        Union[EntityCache, None]: Cache of the most recent session or 'None'
+            if there is no active session.
+    """
+    stack = _CacheSessions.get_stack()
+    if stack:
+        return stack[-1]
+    return None
+
+
+def invalidate_entity_caches(project_name, entity_ids=None):
+    """Invalidate entities in all active caches of all threads.
+
+    Args:
+        project_name (str): Project name.
+        entity_ids (Optional[Iterable[Union[str, ObjectId]]]): Ids of changed
+            entities. All entities of project are invalidated if is 'None'.
+    """
+    with _CacheSessions.lock:
+        caches = list(_CacheSessions.all_caches)
+
+    if entity_ids is not None:
+        entity_ids = list(entity_ids)
+
+    for cache in caches:
+        cache.invalidate(project_name, entity_ids)
+
+
+def cached_entity_getter(entity_type, func):
+    """Wrap function getting single entity by id to use active cache.
+
+    Args:
+        entity_type (str): Type of entity returned by function.
+        func (Callable): Function with arguments 'project_name', entity id
+            and 'fields'.
+
+    Returns:
+        Callable: Wrapped function.
+    """
+
+    def wrapper(project_name, entity_id, fields=None):
+        cache = get_active_entity_cache()
+        if cache is None:
+            return func(project_name, entity_id, fields=fields)
+        return cache.get_entity(project_name, entity_type, entity_id, fields)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
@@ -16,6 +16,9 @@ from .mongo import get_project_database, get_project_connection
 
 PatternType = type(re.compile(""))
 
+# Key on subset document where id and name of its last version is stored
+LAST_VERSION_INDEX_KEY = "lastVersion"
+
 
 def _prepare_fields(fields, required_fields=None):
     if not fields:
@@ -68,6 +71,94 @@ def convert_ids(in_ids):
     return list(_output)
 
 
+def _add_page_token_filter(query_filter, page_token):
+    """Add filter of documents after page token to query filter."""
+
+    if page_token is None:
+        return query_filter
+
+    id_filter = {"$gt": convert_id(page_token)}
+    query_filter = dict(query_filter)
+    current_id_filter = query_filter.get("_id")
+    if current_id_filter is None:
+        query_filter["_id"] = id_filter
+
+    elif (
+        isinstance(current_id_filter, dict)
+        and "$gt" not in current_id_filter
+    ):
+        current_id_filter = dict(current_id_filter)
+        current_id_filter.update(id_filter)
+        query_filter["_id"] = current_id_filter
+
+    else:
+        query_filter = {"$and": [query_filter, {"_id": id_filter}]}
+    return query_filter
+
+
+def _get_documents_page(
+    project_name, query_filter, fields, page_size, page_token
+):
+    """Page of documents sorted by id.
+
+    Args:
+        project_name (str): Name of project where to look for documents.
+        query_filter (Union[dict[str, Any], None]): Query filter. Empty page
+            is returned if is 'None'.
+        fields (Optional[Iterable[str]]): Fields that should be returned.
+        page_size (int): Maximum number of documents in page.
+        page_token (Union[str, None]): Token of previous page.
+
+    Returns:
+        tuple[list[dict[str, Any]], Union[str, None]]: Documents of page
+            and token of next page. Token is 'None' when there are no more
+            documents.
+    """
+
+    if query_filter is None:
+        return [], None
+
+    if page_size < 1:
+        raise ValueError("Page size must be positive number")
+
+    conn = get_project_connection(project_name)
+    cursor = (
+        conn.find(
+            _add_page_token_filter(query_filter, page_token),
+            # Projection always contains '_id' which is used for page token
+            _prepare_fields(fields),
+            batch_size=page_size
+        )
+        .sort("_id", 1)
+        .limit(page_size)
+    )
+    docs = list(cursor)
+    next_page_token = None
+    if len(docs) == page_size:
+        next_page_token = str(docs[-1]["_id"])
+    return docs, next_page_token
+
+
+def _iter_documents(
+    project_name, query_filter, fields, batch_size, page_token
+):
+    """Iterate over documents page by page.
+
+    Only one page is kept in memory at a time and each page is queried
+    separately so iteration is not affected by cursor timeout.
+    """
+
+    while True:
+        docs, page_token = _get_documents_page(
+            project_name, query_filter, fields, batch_size, page_token
+        )
+        for doc in docs:
+            yield doc
+
+        if page_token is None:
+            break
+
+
 def get_projects(active=True, inactive=False, fields=None):
     """Yield all project entity documents.
 
@@ -150,6 +241,54 @@ def get_whole_project(project_name):
     return conn.find({})
 
 
+def get_whole_project_page(
+    project_name, fields=None, page_size=1000, page_token=None
+):
+    """Page of documents from project.
+
+    Memory bounded alternative of 'get_whole_project' which can be resumed
+    from page token of previous page.
+
+    Args:
+        project_name (str): Name of project.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+        page_size (Optional[int]): Maximum number of documents in page.
+        page_token (Optional[str]): Token of previous page.
+
+    Returns:
+        tuple[list[dict[str, Any]], Union[str, None]]: Documents of page and
+            token of next page. Token is 'None' on last page.
+    """
+
+    return _get_documents_page(
+        project_name, {}, fields, page_size, page_token
+    )
+
+
+def iter_whole_project(
+    project_name, fields=None, batch_size=1000, page_token=None
+):
+    """Iterate over all documents of project in batches.
+
+    Memory bounded alternative of 'get_whole_project'.
+
+    Args:
+        project_name (str): Name of project.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+        batch_size (Optional[int]): Number of documents queried at once.
+        page_token (Optional[str]): Start after page with this token.
+
+    Returns:
+        Iterable[dict[str, Any]]: Project documents sorted by id.
+    """
+
+    return _iter_documents(
+        project_name, {}, fields, batch_size, page_token
+    )
+
+
 def get_asset_by_id(project_name, asset_id, fields=None):
     """Receive asset data by its id.
 
@@ -640,15 +779,20 @@ def version_is_latest(project_name, version_id):
     return last_version["_id"] == version_id
 
 
-def _get_versions(
-    project_name,
+def _get_versions_query_filter(
     subset_ids=None,
     version_ids=None,
     versions=None,
     standard=True,
-    hero=False,
-    fields=None
+    hero=False
 ):
+    """Prepare query filter for versions.
+
+    Returns:
+        Union[dict[str, Any], None]: Query filter or 'None' if query would
+            not return any version.
+    """
+
     version_types = []
     if standard:
         version_types.append("version")
@@ -657,7 +801,7 @@ def _get_versions(
         version_types.append("hero_version")
 
     if not version_types:
-        return []
+        return None
     elif len(version_types) == 1:
         query_filter = {"type": version_types[0]}
     else:
@@ -666,24 +810,41 @@ def _get_versions(
     if subset_ids is not None:
         subset_ids = convert_ids(subset_ids)
         if not subset_ids:
-            return []
+            return None
         query_filter["parent"] = {"$in": subset_ids}
 
     if version_ids is not None:
         version_ids = convert_ids(version_ids)
         if not version_ids:
-            return []
+            return None
         query_filter["_id"] = {"$in": version_ids}
 
     if versions is not None:
         versions = list(versions)
         if not versions:
-            return []
+            return None
 
         if len(versions) == 1:
             query_filter["name"] = versions[0]
         else:
             query_filter["name"] = {"$in": versions}
+    return query_filter
+
+
+def _get_versions(
+    project_name,
+    subset_ids=None,
+    version_ids=None,
+    versions=None,
+    standard=True,
+    hero=False,
+    fields=None
+):
+    query_filter = _get_versions_query_filter(
+        subset_ids, version_ids, versions, standard, hero
+    )
+    if query_filter is None:
+        return []
 
     conn = get_project_connection(project_name)
 
@@ -729,6 +890,68 @@ def get_versions(
     )
 
 
+def get_versions_page(
+    project_name,
+    version_ids=None,
+    subset_ids=None,
+    versions=None,
+    hero=False,
+    fields=None,
+    page_size=1000,
+    page_token=None
+):
+    """Page of version entities filtered by entered filters.
+
+    Filters are same as in 'get_versions'.
+
+    Args:
+        page_size (Optional[int]): Maximum number of versions in page.
+        page_token (Optional[str]): Token of previous page.
+
+    Returns:
+        tuple[list[dict[str, Any]], Union[str, None]]: Versions of page and
+            token of next page. Token is 'None' on last page.
+    """
+
+    query_filter = _get_versions_query_filter(
+        subset_ids, version_ids, versions, standard=True, hero=hero
+    )
+    return _get_documents_page(
+        project_name, query_filter, fields, page_size, page_token
+    )
+
+
+def iter_versions(
+    project_name,
+    version_ids=None,
+    subset_ids=None,
+    versions=None,
+    hero=False,
+    fields=None,
+    batch_size=1000,
+    page_token=None
+):
+    """Iterate over version entities in batches.
+
+    Filters are same as in 'get_versions'. Only one batch is kept in
+    memory at a time.
+
+    Args:
+        batch_size (Optional[int]): Number of versions queried at once.
+        page_token (Optional[str]): Start after page with this token.
+
+    Returns:
+        Iterable[dict[str, Any]]: Versions sorted by id.
+    """
+
+    query_filter = _get_versions_query_filter(
+        subset_ids, version_ids, versions, standard=True, hero=hero
+    )
+    return _iter_documents(
+        project_name, query_filter, fields, batch_size, page_token
+    )
+
+
 def get_hero_version_by_subset_id(project_name, subset_id, fields=None):
     """Hero version by subset id.
 
@@ -855,6 +1078,91 @@ def get_output_link_versions(project_name, version_id, fields=None):
     return conn.find(query_filter, _prepare_fields(fields))
 
 
+def _aggregate_last_versions(conn, subset_ids, active=None):
+    """Find last versions of subsets from all their versions.
+
+    Args:
+        conn (pymongo.collection.Collection): Project collection.
+        subset_ids (list[ObjectId]): Subset ids.
+        active (Optional[bool]): If True only active versions are used.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: Id and name of last version by
+            subset id. Subsets without versions are not in output.
+    """
+
+    if not subset_ids:
+        return {}
+
+    aggregate_filter = {
+        "type": "version",
+        "parent": {"$in": subset_ids}
+    }
+    if active is False:
+        aggregate_filter["data.active"] = active
+    elif active is True:
+        aggregate_filter["$or"] = [
+            {"data.active": {"$exists": 0}},
+            {"data.active": active},
+        ]
+
+    aggregation_pipeline = [
+        # Find all versions of those subsets
+        {"$match": aggregate_filter},
+        # Sorting versions all together
+        {"$sort": {"name": 1}},
+        # Group them by "parent", but only take the last
+        {"$group": {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"},
+            "name": {"$last": "$name"}
+        }}
+    ]
+    return {
+        item["_id"]: {"_id": item["_version_id"], "name": item["name"]}
+        for item in conn.aggregate(aggregation_pipeline)
+    }
+
+
+def _get_last_versions_info(conn, subset_ids, active):
+    """Id and name of last versions of subsets.
+
+    Last version index stored on subset documents is used when possible.
+    Versions are aggregated only for subsets which are not indexed or when
+    'active' filter is used as index contains last version of all versions.
+
+    Args:
+        conn (pymongo.collection.Collection): Project collection.
+        subset_ids (list[ObjectId]): Subset ids.
+        active (Union[bool, None]): Filter by active state of versions.
+
+    Returns:
+        dict[ObjectId, dict[str, Any]]: Id and name of last version by
+            subset id.
+    """
+
+    output = {}
+    if active is None:
+        not_indexed_ids = set(subset_ids)
+        subset_docs = conn.find(
+            {"type": "subset", "_id": {"$in": subset_ids}},
+            {LAST_VERSION_INDEX_KEY: True}
+        )
+        for subset_doc in subset_docs:
+            if LAST_VERSION_INDEX_KEY not in subset_doc:
+                continue
+            subset_id = subset_doc["_id"]
+            not_indexed_ids.discard(subset_id)
+            # Value is 'None' if subset does not have any version
+            last_version_info = subset_doc[LAST_VERSION_INDEX_KEY]
+            if last_version_info:
+                output[subset_id] = last_version_info
+        subset_ids = list(not_indexed_ids)
+
+    output.update(_aggregate_last_versions(conn, subset_ids, active))
+    return output
+
+
 def get_last_versions(project_name, subset_ids, active=None, fields=None):
     """Latest versions for entered subset_ids.
 
@@ -892,50 +1200,20 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
-    }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
-
-    aggregate_filter = {
-        "type": "version",
-        "parent": {"$in": subset_ids}
-    }
-    if active is False:
-        aggregate_filter["data.active"] = active
-    elif active is True:
-        aggregate_filter["$or"] = [
-            {"data.active": {"$exists": 0}},
-            {"data.active": active},
-        ]
-
-    aggregation_pipeline = [
-        # Find all versions of those subsets
-        {"$match": aggregate_filter},
-        # Sorting versions all together
-        {"$sort": {"name": 1}},
-        # Group them by "parent", but only take the last
-        {"$group": group_item}
-    ]
-
     conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
+    last_versions_info = _get_last_versions_info(conn, subset_ids, active)
     if limit_query:
         output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
+        for subset_id, last_version_info in last_versions_info.items():
+            item_data = {"_id": last_version_info["_id"], "parent": subset_id}
             if name_needed:
-                item_data["name"] = item["name"]
+                item_data["name"] = last_version_info["name"]
             output[subset_id] = item_data
         return output
 
     version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
+        last_version_info["_id"]
+        for last_version_info in last_versions_info.values()
     ]
 
     fields = _prepare_fields(fields, ["parent"])
@@ -1130,18 +1408,23 @@ def _regex_filters(filters):
     return output
 
 
-def _get_representations(
-    project_name,
+def _get_representations_query_filter(
     representation_ids,
     representation_names,
     version_ids,
     context_filters,
     names_by_version_ids,
     standard,
-    archived,
-    fields
+    archived
 ):
-    default_output = []
+    """Prepare query filter for representations.
+
+    Returns:
+        Union[dict[str, Any], None]: Query filter or 'None' if query would
+            not return any representation.
+    """
+
+    default_output = None
     repre_types = []
     if standard:
         repre_types.append("representation")
@@ -1188,7 +1471,7 @@ def _get_representations(
 
     if context_filters is not None:
         if not context_filters:
-            return []
+            return default_output
         _flatten_filters = _flatten_dict(context_filters)
         flatten_filters = {}
         for key, value in _flatten_filters.items():
@@ -1213,6 +1496,31 @@ def _get_representations(
                 or_query = {"$or": or_query}
             and_query.append(or_query)
         query_filter["$and"] = and_query
+    return query_filter
+
+
+def _get_representations(
+    project_name,
+    representation_ids,
+    representation_names,
+    version_ids,
+    context_filters,
+    names_by_version_ids,
+    standard,
+    archived,
+    fields
+):
+    query_filter = _get_representations_query_filter(
+        representation_ids,
+        representation_names,
+        version_ids,
+        context_filters,
+        names_by_version_ids,
+        standard,
+        archived
+    )
+    if query_filter is None:
+        return []
 
     conn = get_project_connection(project_name)
 
@@ -1267,6 +1575,87 @@ def get_representations(
     )
 
 
+def get_representations_page(
+    project_name,
+    representation_ids=None,
+    representation_names=None,
+    version_ids=None,
+    context_filters=None,
+    names_by_version_ids=None,
+    archived=False,
+    standard=True,
+    fields=None,
+    page_size=1000,
+    page_token=None
+):
+    """Page of representation entities filtered by entered filters.
+
+    Filters are same as in 'get_representations'.
+
+    Args:
+        page_size (Optional[int]): Maximum number of representations in page.
+        page_token (Optional[str]): Token of previous page.
+
+    Returns:
+        tuple[list[dict[str, Any]], Union[str, None]]: Representations of
+            page and token of next page. Token is 'None' on last page.
+    """
+
+    query_filter = _get_representations_query_filter(
+        representation_ids,
+        representation_names,
+        version_ids,
+        context_filters,
+        names_by_version_ids,
+        standard,
+        archived
+    )
+    return _get_documents_page(
+        project_name, query_filter, fields, page_size, page_token
+    )
+
+
+def iter_representations(
+    project_name,
+    representation_ids=None,
+    representation_names=None,
+    version_ids=None,
+    context_filters=None,
+    names_by_version_ids=None,
+    archived=False,
+    standard=True,
+    fields=None,
+    batch_size=1000,
+    page_token=None
+):
+    """Iterate over representation entities in batches.
+
+    Filters are same as in 'get_representations'. Only one batch is kept
+    in memory at a time.
+
+    Args:
+        batch_size (Optional[int]): Number of representations queried
+            at once.
+        page_token (Optional[str]): Start after page with this token.
+
+    Returns:
+        Iterable[dict[str, Any]]: Representations sorted by id.
+    """
+
+    query_filter = _get_representations_query_filter(
+        representation_ids,
+        representation_names,
+        version_ids,
+        context_filters,
+        names_by_version_ids,
+        standard,
+        archived
+    )
+    return _iter_documents(
+        project_name, query_filter, fields, batch_size, page_token
+    )
+
+
 def get_archived_representations(
     project_name,
     representation_ids=None,
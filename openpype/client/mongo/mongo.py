@@ -285,6 +285,29 @@ def get_collection_documents(database_name, collection_name, as_json=False):
     return output
 
 
+def iter_collection_documents(
+    database_name, collection_name, batch_size=1000
+):
+    """Iterate over all documents of a collection in batches.
+
+    Args:
+        database_name (str): Name of database where to look for collection.
+        collection_name (str): Name of collection where to look for documents.
+        batch_size (Optional[int]): Number of documents received from
+            database at once.
+
+    Returns:
+        Iterable[dict[str, Any]]: Documents sorted by id.
+    """
+
+    client = OpenPypeMongoConnection.get_mongo_client()
+    return (
+        client[database_name][collection_name]
+        .find({}, batch_size=batch_size)
+        .sort("_id", 1)
+    )
+
+
 def store_collection(filepath, database_name, collection_name):
     """Store collection documents to a json file.
 
@@ -299,9 +322,17 @@ def store_collection(filepath, database_name, collection_name):
     if not os.path.isdir(dirpath):
         os.makedirs(dirpath)
 
-    content = get_collection_documents(database_name, collection_name, True)
+    # Documents are written one by one so whole collection is never
+    #   loaded in memory
     with open(filepath, "w") as stream:
-        stream.write(content)
+        stream.write("[")
+        for idx, doc in enumerate(iter_collection_documents(
+            database_name, collection_name
+        )):
+            if idx > 0:
+                stream.write(", ")
+            stream.write(documents_to_json(doc))
+        stream.write("]")
 
 
 def replace_collection_documents(docs, database_name, collection_name):
@@ -12,8 +12,14 @@ from openpype.client.operations_base import (
     DeleteOperation,
     BaseOperationsSession
 )
+from openpype.client.entity_cache import invalidate_entity_caches
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import (
+    LAST_VERSION_INDEX_KEY,
+    _aggregate_last_versions,
+    convert_ids,
+    get_project,
+)
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -303,13 +309,16 @@ def prepare_subset_update_data(old_doc, new_doc, replace=True):
     Based on compared values will create update data for
     'MongoUpdateOperation'.
 
-    Empty output means that documents are identical.
+    Empty output means that documents are identical. Last version index
+    is never changed as it is maintained by operations session.
 
     Returns:
         Dict[str, Any]: Changes between old and new document.
     """
 
-    return _prepare_update_data(old_doc, new_doc, replace)
+    changes = _prepare_update_data(old_doc, new_doc, replace)
+    changes.pop(LAST_VERSION_INDEX_KEY, None)
+    return changes
 
 
 def prepare_version_update_data(old_doc, new_doc, replace=True):
@@ -470,6 +479,146 @@ class MongoDeleteOperation(DeleteOperation):
         return DeleteOne({"_id": self.entity_id})
 
 
+def _get_last_version_index_changes(project_name, operations):
+    """Subsets of which last version may be changed by operations.
+
+    Must be called before operations are committed as parents of removed
+    versions can't be found afterwards.
+
+    Args:
+        project_name (str): Project name.
+        operations (list[AbstractOperation]): Operations of the project.
+
+    Returns:
+        tuple[set[ObjectId], set[ObjectId]]: Ids of subsets where versions
+            were only created and ids of subsets where versions were
+            changed, removed or subset was created.
+    """
+
+    created_ids = set()
+    changed_ids = set()
+    version_ids = set()
+    for operation in operations:
+        operation_name = operation.operation_name
+        if operation.entity_type == "subset":
+            # New subsets are indexed right away
+            if operation_name == "create":
+                changed_ids.add(operation.entity_id)
+            continue
+
+        if operation.entity_type != "version":
+            continue
+
+        if operation_name == "create":
+            parent_id = operation.data.get("parent")
+            if parent_id is not None:
+                created_ids.add(ObjectId(parent_id))
+
+        elif operation_name == "delete":
+            version_ids.add(operation.entity_id)
+
+        elif operation_name == "update":
+            update_data = operation.update_data
+            if "name" not in update_data and "parent" not in update_data:
+                continue
+            version_ids.add(operation.entity_id)
+            parent_id = update_data.get("parent")
+            if parent_id is not None and parent_id is not REMOVED_VALUE:
+                changed_ids.add(ObjectId(parent_id))
+
+    if version_ids:
+        collection = get_project_connection(project_name)
+        for version_doc in collection.find(
+            {"_id": {"$in": list(version_ids)}},
+            {"parent": True}
+        ):
+            changed_ids.add(version_doc["parent"])
+
+    return created_ids - changed_ids, changed_ids
+
+
+def _update_last_version_index(project_name, created_ids, changed_ids):
+    """Update last version index of subsets after versions were changed.
+
+    Args:
+        project_name (str): Project name.
+        created_ids (set[ObjectId]): Ids of subsets where versions were only
+            created.
+        changed_ids (set[ObjectId]): Ids of subsets where versions were
+            changed or removed.
+    """
+
+    subset_ids = created_ids | changed_ids
+    if not subset_ids:
+        return
+
+    collection = get_project_connection(project_name)
+    last_versions = _aggregate_last_versions(collection, list(subset_ids))
+    bulk_writes = []
+    for subset_id in subset_ids:
+        last_version = last_versions.get(subset_id)
+        query_filter = {"_id": subset_id, "type": "subset"}
+        if subset_id not in changed_ids and last_version is not None:
+            # Don't overwrite newer version created by other process
+            #   in the meantime
+            query_filter["$or"] = [
+                {LAST_VERSION_INDEX_KEY: {"$not": {"$type": "object"}}},
+                {"{}.name".format(LAST_VERSION_INDEX_KEY): {
+                    "$lt": last_version["name"]
+                }},
+            ]
+        bulk_writes.append(UpdateOne(
+            query_filter,
+            {"$set": {LAST_VERSION_INDEX_KEY: last_version}}
+        ))
+
+    collection.bulk_write(bulk_writes)
+    invalidate_entity_caches(project_name, subset_ids)
+
+
+def rebuild_last_version_index(project_name, subset_ids=None, batch_size=1000):
+    """Rebuild last version index stored on subset documents.
+
+    Index is maintained by 'MongoOperationsSession' but must be built for
+    existing projects and rebuilt if versions were changed without using
+    operations.
+
+    Args:
+        project_name (str): Project name.
+        subset_ids (Optional[Iterable[Union[str, ObjectId]]]): Rebuild index
+            only for these subsets. All subsets are used if is 'None'.
+        batch_size (Optional[int]): Number of subsets processed at once.
+
+    Returns:
+        int: Number of indexed subsets.
+    """
+
+    collection = get_project_connection(project_name)
+    subset_filter = {"type": "subset"}
+    if subset_ids is not None:
+        subset_filter["_id"] = {"$in": convert_ids(subset_ids)}
+
+    subset_ids = [
+        subset_doc["_id"]
+        for subset_doc in collection.find(subset_filter, {"_id": True})
+    ]
+    for idx in range(0, len(subset_ids), batch_size):
+        batch_ids = subset_ids[idx:idx + batch_size]
+        last_versions = _aggregate_last_versions(collection, batch_ids)
+        collection.bulk_write([
+            UpdateOne(
+                {"_id": subset_id},
+                {"$set": {
+                    LAST_VERSION_INDEX_KEY: last_versions.get(subset_id)
+                }}
+            )
+            for subset_id in batch_ids
+        ])
+
+    invalidate_entity_caches(project_name, subset_ids)
+    return len(subset_ids)
+
+
 class MongoOperationsSession(BaseOperationsSession):
     """Session storing operations that should happen in an order.
 
@@ -495,16 +644,29 @@ class MongoOperationsSession(BaseOperationsSession):
         for operation in operations:
             operations_by_project[operation.project_name].append(operation)
 
-        for project_name, operations in operations_by_project.items():
-            bulk_writes = []
-            for operation in operations:
-                mongo_op = operation.to_mongo_operation()
-                if mongo_op is not None:
-                    bulk_writes.append(mongo_op)
-
-            if bulk_writes:
+        try:
+            for project_name, project_operations in (
+                operations_by_project.items()
+            ):
+                bulk_writes = []
+                for operation in project_operations:
+                    mongo_op = operation.to_mongo_operation()
+                    if mongo_op is not None:
+                        bulk_writes.append(mongo_op)
+
+                if not bulk_writes:
+                    continue
+
+                created_ids, changed_ids = _get_last_version_index_changes(
+                    project_name, project_operations
+                )
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                _update_last_version_index(
+                    project_name, created_ids, changed_ids
+                )
+        finally:
+            self._invalidate_entity_caches(operations)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -253,6 +253,26 @@ class BaseOperationsSession(object):
         """Commit session operations."""
         pass
 
+    def _invalidate_entity_caches(self, operations):
+        """Remove changed entities from active entity caches.
+
+        Args:
+            operations (List[AbstractOperation]): Committed operations.
+        """
+        from .entity_cache import invalidate_entity_caches
+
+        entity_ids_by_project = {}
+        for operation in operations:
+            entity_id = getattr(operation, "entity_id", None)
+            if entity_id is None:
+                continue
+            entity_ids_by_project.setdefault(
+                operation.project_name, set()
+            ).add(entity_id)
+
+        for project_name, entity_ids in entity_ids_by_project.items():
+            invalidate_entity_caches(project_name, entity_ids)
+
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
 
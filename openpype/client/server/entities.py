@@ -56,6 +56,26 @@ def get_whole_project(*args, **kwargs):
     raise NotImplementedError("'get_whole_project' not implemented")
 
 
+def _page_token_not_supported(*args, **kwargs):
+    """Pagination by page token is not supported with AYON server.
+
+    Server api already streams results so 'iter_*' functions without
+    'page_token' should be used instead.
+    """
+
+    raise NotImplementedError(
+        "Pagination by page token is not supported with AYON server."
+        " Use 'iter_*' functions without 'page_token' instead."
+    )
+
+
+get_whole_project_page = _page_token_not_supported
+
+
+def iter_whole_project(*args, **kwargs):
+    raise NotImplementedError("'iter_whole_project' not implemented")
+
+
 def _get_subsets(
     project_name,
     subset_ids=None,
@@ -329,6 +349,27 @@ def get_versions(
     )
 
 
+get_versions_page = _page_token_not_supported
+
+
+def iter_versions(
+    project_name,
+    version_ids=None,
+    subset_ids=None,
+    versions=None,
+    hero=False,
+    fields=None,
+    batch_size=None,
+    page_token=None
+):
+    # Server api already streams results
+    if page_token is not None:
+        _page_token_not_supported()
+    return get_versions(
+        project_name, version_ids, subset_ids, versions, hero, fields
+    )
+
+
 def get_hero_version_by_id(project_name, version_id, fields=None):
     versions = get_hero_versions(
         project_name,
@@ -519,6 +560,38 @@ def get_representations(
         yield convert_v4_representation_to_v3(representation)
 
 
+get_representations_page = _page_token_not_supported
+
+
+def iter_representations(
+    project_name,
+    representation_ids=None,
+    representation_names=None,
+    version_ids=None,
+    context_filters=None,
+    names_by_version_ids=None,
+    archived=False,
+    standard=True,
+    fields=None,
+    batch_size=None,
+    page_token=None
+):
+    # Server api already streams results
+    if page_token is not None:
+        _page_token_not_supported()
+    return get_representations(
+        project_name,
+        representation_ids,
+        representation_names,
+        version_ids,
+        context_filters,
+        names_by_version_ids,
+        archived,
+        standard,
+        fields
+    )
+
+
 def get_representation_parents(project_name, representation):
     if not representation:
         return None
@@ -708,30 +708,39 @@ class OperationsSession(BaseOperationsSession):
 
         body_by_id = {}
         results = []
-        for project_name, operations in operations_by_project.items():
-            operations_body = []
-            for operation in operations:
-                body = operation.to_server_operation()
-                if body is not None:
-                    try:
-                        json.dumps(body)
-                    except:
-                        raise ValueError("Couldn't json parse body: {}".format(
-                            json.dumps(
-                                body, indent=4, default=failed_json_default
+        try:
+            for project_name, project_operations in (
+                operations_by_project.items()
+            ):
+                operations_body = []
+                for operation in project_operations:
+                    body = operation.to_server_operation()
+                    if body is not None:
+                        try:
+                            json.dumps(body)
+                        except:
+                            raise ValueError(
+                                "Couldn't json parse body: {}".format(
+                                    json.dumps(
+                                        body,
+                                        indent=4,
+                                        default=failed_json_default
+                                    )
+                                )
                             )
-                        ))
 
-                    body_by_id[operation.id] = body
-                    operations_body.append(body)
+                        body_by_id[operation.id] = body
+                        operations_body.append(body)
 
-            if operations_body:
-                result = self._con.post(
-                    "projects/{}/operations".format(project_name),
-                    operations=operations_body,
-                    canFail=False
-                )
-                results.append(result.data)
+                if operations_body:
+                    result = self._con.post(
+                        "projects/{}/operations".format(project_name),
+                        operations=operations_body,
+                        canFail=False
+                    )
+                    results.append(result.data)
+        finally:
+            self._invalidate_entity_caches(operations)
 
         for result in results:
             if result.get("success"):
@@ -879,3 +888,10 @@ def create_thumbnail(project_name, src_filepath, thumbnail_id=None, con=None):
     if con is None:
         con = get_server_api_connection()
     return con.create_thumbnail(project_name, src_filepath, thumbnail_id)
+
+
+def rebuild_last_version_index(*args, **kwargs):
+    # Last versions are resolved by server
+    raise NotImplementedError(
+        "'rebuild_last_version_index' not implemented"
+    )
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Index of published look textures by their hashes."""
+import os
+import hashlib
+from collections import defaultdict
+
+from openpype.lib.media_info_cache import get_media_info_cache
+from openpype.pipeline import legacy_io
+
+
+def find_paths_by_hash(texture_hash):
+    """Find the texture hash key in the dictionary.
+
+    All paths that originate from it.
+
+    Args:
+        texture_hash (str): Hash of the texture.
+
+    Return:
+        str: path to texture if found.
+
+    """
+    return find_paths_by_hashes([texture_hash]).get(texture_hash, [])
+
+
+def find_paths_by_hashes(texture_hashes, chunk_size=100):
+    """Find published paths of multiple texture hashes.
+
+    Versions are queried once per chunk of hashes instead of once per hash.
+
+    Args:
+        texture_hashes (Iterable[str]): Hashes of textures.
+        chunk_size (Optional[int]): Number of hashes in one query.
+
+    Return:
+        dict[str, list[str]]: Published paths by texture hash. Hashes
+            which were never published are not in output.
+
+    """
+    texture_hashes = list(texture_hashes)
+    output = defaultdict(list)
+    for idx in range(0, len(texture_hashes), chunk_size):
+        chunk = texture_hashes[idx:idx + chunk_size]
+        keys = ["data.sourceHashes.{0}".format(item) for item in chunk]
+        query = {
+            "type": "version",
+            "$or": [{key: {"$exists": True}} for key in keys]
+        }
+        projection = {key: True for key in keys}
+        for version_doc in legacy_io.find(query, projection):
+            source_hashes = version_doc.get("data", {}).get("sourceHashes")
+            for texture_hash in chunk:
+                path = (source_hashes or {}).get(texture_hash)
+                if path and path not in output[texture_hash]:
+                    output[texture_hash].append(path)
+    return dict(output)
+
+
+class TextureHashIndex(object):
+    """Persistent index of published paths by texture hash.
+
+    Index is stored in media information cache so published textures are
+    found without query of all versions in project. Paths are only hints
+    and are validated on disk before they're used. Index is separated
+    per project and its roots so paths of other project or of different
+    root mapping are never used.
+
+    Args:
+        project_name (str): Name of project.
+        project_root (str): Roots of project.
+        cache (Optional[MediaInfoCache]): Cache where index is stored.
+
+    """
+
+    def __init__(self, project_name, project_root, cache=None):
+        if cache is None:
+            cache = get_media_info_cache()
+        self._project_name = project_name
+        self._project_root = project_root
+        self._cache = cache
+
+    @classmethod
+    def from_context(cls, context):
+        """Index for project of publish context.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            TextureHashIndex: Index of the project.
+
+        """
+        anatomy = context.data["anatomy"]
+        roots = anatomy.roots
+        project_root = "|".join(
+            "{}={}".format(root_name, roots[root_name])
+            for root_name in sorted(roots)
+        )
+        return cls(context.data["projectName"], project_root)
+
+    def _get_key(self, texture_hash):
+        return hashlib.sha1(
+            "texture_paths|{}|{}|{}".format(
+                self._project_name, self._project_root, texture_hash
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get_paths(self, texture_hash):
+        """Indexed paths of texture hash.
+
+        Args:
+            texture_hash (str): Hash of the texture.
+
+        Returns:
+            list[str]: Known paths of the texture.
+
+        """
+        return list(self._cache.get(self._get_key(texture_hash)) or [])
+
+    def add_paths(self, texture_hash, paths):
+        """Add paths to texture hash.
+
+        Args:
+            texture_hash (str): Hash of the texture.
+            paths (Iterable[str]): Paths of the texture.
+
+        """
+        current_paths = self.get_paths(texture_hash)
+        new_paths = [path for path in paths if path not in current_paths]
+        if new_paths:
+            self._cache.set(
+                self._get_key(texture_hash), current_paths + new_paths
+            )
+
+    def find_existing_paths(self, texture_hashes):
+        """Find existing published paths of texture hashes.
+
+        Index is used first and versions in database are queried only
+        for hashes without any existing indexed path. Paths found in
+        database are added to index.
+
+        Args:
+            texture_hashes (Iterable[str]): Hashes of textures.
+
+        Returns:
+            dict[str, str]: First existing path by texture hash.
+
+        """
+        output = {}
+        missing_hashes = []
+        for texture_hash in texture_hashes:
+            path = next(
+                (
+                    path
+                    for path in self.get_paths(texture_hash)
+                    if os.path.exists(path)
+                ),
+                None
+            )
+            if path:
+                output[texture_hash] = path
+            else:
+                missing_hashes.append(texture_hash)
+
+        if not missing_hashes:
+            return output
+
+        paths_by_hash = find_paths_by_hashes(missing_hashes)
+        for texture_hash, paths in paths_by_hash.items():
+            self.add_paths(texture_hash, paths)
+            path = next((path for path in paths if os.path.exists(path)), None)
+            if path:
+                output[texture_hash] = path
+        return output
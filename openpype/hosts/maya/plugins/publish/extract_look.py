@@ -8,6 +8,8 @@ import logging
 import os
 import platform
 import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import six
 import attr
 
@@ -17,8 +19,12 @@ from maya import cmds  # noqa
 
 from openpype.lib.vendor_bin_utils import find_executable
 from openpype.lib import source_hash, run_subprocess, get_oiio_tools_path
-from openpype.pipeline import legacy_io, publish, KnownPublishError
+from openpype.pipeline import publish, KnownPublishError
 from openpype.hosts.maya.api import lib
+from openpype.hosts.maya.api.texture_index import (  # noqa: F401
+    TextureHashIndex,
+    find_paths_by_hash,
+)
 
 # Modes for transfer
 COPY = 1
@@ -39,22 +45,6 @@ class TextureResult(object):
     transfer_mode = attr.ib()
 
 
-def find_paths_by_hash(texture_hash):
-    """Find the texture hash key in the dictionary.
-
-    All paths that originate from it.
-
-    Args:
-        texture_hash (str): Hash of the texture.
-
-    Return:
-        str: path to texture if found.
-
-    """
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
-
-
 @contextlib.contextmanager
 def no_workspace_dir():
     """Force maya to a fake temporary workspace directory.
@@ -110,6 +100,39 @@ class TextureProcessor:
         """
         pass
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        """Hash of result of processing the `source` texture.
+
+        Results with the same hash are considered identical so already
+        published result can be used instead of processing the texture.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            Union[str, None]: Hash of result or None if result of processing
+                can't be reused.
+
+        """
+        return None
+
+    def get_result_colorspace(self, colorspace, color_management):
+        """Colorspace of texture after processing.
+
+        Args:
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            str: Colorspace of processed texture.
+
+        """
+        return colorspace
+
     @abstractmethod
     def process(self,
                 source,
@@ -147,6 +170,9 @@ class MakeRSTexBin(TextureProcessor):
 
     extension = ".rstexbin"
 
+    def get_texture_hash(self, source, colorspace, color_management):
+        return source_hash(source, "rstex")
+
     def process(self,
                 source,
                 colorspace,
@@ -164,8 +190,9 @@ class MakeRSTexBin(TextureProcessor):
             source
         ]
 
-        hash_args = ["rstex"]
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash = self.get_texture_hash(
+            source, colorspace, color_management
+        )
 
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
@@ -245,6 +272,52 @@ class MakeTX(TextureProcessor):
 
         self.extra_args = extra_args
 
+    def _get_conversion_args(self, colorspace, color_management):
+        """Arguments for maketx which affect the output texture.
+
+        Returns:
+            tuple[list[str], str]: Arguments and colorspace of output.
+
+        """
+        # Hardcoded default arguments for maketx conversion based on Arnold's
+        # txManager in Maya
+        args = [
+            # unpremultiply before conversion (recommended when alpha present)
+            "--unpremult",
+            # use oiio-optimized settings for tile-size, planarconfig, metadata
+            "--oiio",
+            "--filter", "lanczos3",
+        ]
+        if not color_management["enabled"]:
+            # Assume linear
+            return args, "linear"
+
+        config_path = color_management["config"]
+        if not os.path.exists(config_path):
+            raise RuntimeError("OCIO config not found at: "
+                               "{}".format(config_path))
+
+        render_colorspace = color_management["rendering_space"]
+        args.extend(["--colorconvert", colorspace, render_colorspace])
+        args.extend(["--colorconfig", config_path])
+        return args, render_colorspace
+
+    def get_texture_hash(self, source, colorspace, color_management):
+        # Source .tx files are not processed
+        if os.path.splitext(source)[1] == ".tx":
+            return None
+
+        args, _ = self._get_conversion_args(colorspace, color_management)
+        # Note: The texture hash is only reliable if we include any potential
+        # conversion arguments provide to e.g. `maketx`
+        hash_args = ["maketx"] + args + self.extra_args
+        return source_hash(source, *hash_args)
+
+    def get_result_colorspace(self, colorspace, color_management):
+        if color_management["enabled"]:
+            return color_management["rendering_space"]
+        return "linear"
+
     def process(self,
                 source,
                 colorspace,
@@ -285,46 +358,32 @@ class MakeTX(TextureProcessor):
                 transfer_mode=COPY
             )
 
-        # Hardcoded default arguments for maketx conversion based on Arnold's
-        # txManager in Maya
-        args = [
-            # unpremultiply before conversion (recommended when alpha present)
-            "--unpremult",
-            # use oiio-optimized settings for tile-size, planarconfig, metadata
-            "--oiio",
-            "--filter", "lanczos3",
-        ]
+        args, render_colorspace = self._get_conversion_args(
+            colorspace, color_management
+        )
         if color_management["enabled"]:
-            config_path = color_management["config"]
-            if not os.path.exists(config_path):
-                raise RuntimeError("OCIO config not found at: "
-                                   "{}".format(config_path))
-
-            render_colorspace = color_management["rendering_space"]
-
             self.log.info("tx: converting colorspace {0} "
                           "-> {1}".format(colorspace,
                                           render_colorspace))
-            args.extend(["--colorconvert", colorspace, render_colorspace])
-            args.extend(["--colorconfig", config_path])
-
         else:
             # Maya Color management is disabled. We cannot rely on an OCIO
             self.log.debug("tx: Maya color management is disabled. No color "
                            "conversion will be applied to .tx conversion for: "
                            "{}".format(source))
-            # Assume linear
-            render_colorspace = "linear"
 
-        # Note: The texture hash is only reliable if we include any potential
-        # conversion arguments provide to e.g. `maketx`
-        hash_args = ["maketx"] + args + self.extra_args
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash = self.get_texture_hash(
+            source, colorspace, color_management
+        )
 
         # Ensure folder exists
+        # - textures can be processed in parallel so folder may be created
+        #   by other thread in the meantime
         resources_dir = os.path.join(staging_dir, "resources")
-        if not os.path.exists(resources_dir):
+        try:
             os.makedirs(resources_dir)
+        except OSError:
+            if not os.path.isdir(resources_dir):
+                raise
 
         self.log.info("Generating .tx file for %s .." % source)
 
@@ -399,6 +458,9 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Number of textures processed at the same time, based on cpu count
+    #   if is not positive
+    texture_processing_workers = 0
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -594,6 +656,24 @@ class ExtractLook(publish.Extractor):
         else:
             force_copy = instance.data.get("forceCopy", False)
 
+        # Process each file only once with colorspace of the first resource
+        #   using it
+        colorspace_by_filepath = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                colorspace_by_filepath.setdefault(
+                    os.path.normpath(filepath), resource["color_space"]
+                )
+
+        texture_results = self._process_textures(
+            colorspace_by_filepath,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management,
+            texture_index=TextureHashIndex.from_context(instance.context)
+        )
+
         destinations_cache = {}
 
         def get_resource_destination_cached(path):
@@ -644,14 +724,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -745,40 +818,33 @@ class ExtractLook(publish.Extractor):
             resources_dir, basename + ext
         )
 
-    def _get_existing_hashed_texture(self, texture_hash):
-        """Return the first found filepath from a texture hash"""
-
-        # If source has been published before with the same settings,
-        # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
-        if existing:
-            source = next((p for p in existing if os.path.exists(p)), None)
-            if source:
-                return source
-            else:
-                self.log.warning(
-                    "Paths not found on disk, "
-                    "skipping hardlink: {}".format(existing)
-                )
-
-    def _process_texture(self,
-                         filepath,
-                         processors,
-                         staging_dir,
-                         force_copy,
-                         color_management,
-                         colorspace):
-        """Process a single texture file on disk for publishing.
+    def _get_texture_processing_workers(self):
+        workers = self.texture_processing_workers
+        if workers and workers > 0:
+            return workers
+        return max(1, multiprocessing.cpu_count() // 2)
+
+    def _process_textures(self,
+                          colorspace_by_filepath,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management,
+                          texture_index):
+        """Process texture files on disk for publishing.
 
         This will:
-            1. Check whether it's already published, if so it will do hardlink
-                (if the texture hash is found and force copy is not enabled)
-            2. It will process the texture using the supplied texture
-                processors like MakeTX and MakeRSTexBin if enabled.
-            3. Compute the destination path for the source file.
+            1. Check whether the texture result was already published, if
+                so it will do hardlink from the published file (if the
+                texture hash is found and force copy is not enabled for
+                unprocessed textures)
+            2. It will process the remaining textures using the supplied
+                texture processors like MakeTX and MakeRSTexBin if enabled.
+                Textures are processed in parallel.
 
         Args:
-            filepath (str): The source file path to process.
+            colorspace_by_filepath (dict[str, str]): Source colorspace by
+                source file path.
             processors (list): List of TextureProcessor processing the texture
             staging_dir (str): The staging directory to write to.
             force_copy (bool): Whether to force a copy even if a file hash
@@ -786,11 +852,10 @@ class ExtractLook(publish.Extractor):
                 hardlinking the existing file is allowed.
             color_management (dict): Maya's Color Management settings from
                 `lib.get_color_management_preferences`
-            colorspace (str): The source colorspace of the resources this
-                texture belongs to.
+            texture_index (TextureHashIndex): Index of published textures.
 
         Returns:
-            TextureResult: The texture result information.
+            dict[str, TextureResult]: The texture results by file path.
         """
 
         if len(processors) > 1:
@@ -798,45 +863,134 @@ class ExtractLook(publish.Extractor):
                 "More than one texture processor not supported. "
                 "Current processors enabled: {}".format(processors)
             )
+        processor = next(iter(processors), None)
 
-        for processor in processors:
-            self.log.debug("Processing texture {} with processor {}".format(
-                filepath, processor
-            ))
-
-            processed_result = processor.process(filepath,
-                                                 colorspace,
-                                                 color_management,
-                                                 staging_dir)
-            if not processed_result:
-                raise RuntimeError("Texture Processor {} returned "
-                                   "no result.".format(processor))
-            self.log.info("Generated processed "
-                          "texture: {}".format(processed_result.path))
-
-            # TODO: Currently all processors force copy instead of allowing
-            #       hardlinks using source hashes. This should be refactored
-            return processed_result
-
-        # No texture processing for this file
-        texture_hash = source_hash(filepath)
-        if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+        hashes_by_filepath = {}
+        for filepath, colorspace in colorspace_by_filepath.items():
+            if processor is None:
+                texture_hash = source_hash(filepath)
+            else:
+                texture_hash = processor.get_texture_hash(
+                    filepath, colorspace, color_management
+                )
+            hashes_by_filepath[filepath] = texture_hash
+
+        # If source has been published before with the same settings,
+        # then don't reprocess but hardlink from the original
+        existing_by_hash = {}
+        if processor is not None or not force_copy:
+            existing_by_hash = texture_index.find_existing_paths({
+                texture_hash
+                for texture_hash in hashes_by_filepath.values()
+                if texture_hash
+            })
+
+        results = {}
+        filepaths_to_process = []
+        for filepath, colorspace in colorspace_by_filepath.items():
+            texture_hash = hashes_by_filepath[filepath]
+            existing = existing_by_hash.get(texture_hash)
             if existing:
-                self.log.info("Found hash in database, preparing hardlink..")
-                return TextureResult(
-                    path=filepath,
+                self.log.info(
+                    "Found hash in database, preparing hardlink from {} for"
+                    " {}..".format(existing, filepath))
+                if processor is not None:
+                    colorspace = processor.get_result_colorspace(
+                        colorspace, color_management
+                    )
+                results[filepath] = TextureResult(
+                    path=existing,
                     file_hash=texture_hash,
                     colorspace=colorspace,
                     transfer_mode=HARDLINK
                 )
 
-        return TextureResult(
-            path=filepath,
-            file_hash=texture_hash,
-            colorspace=colorspace,
-            transfer_mode=COPY
+            elif processor is None:
+                results[filepath] = TextureResult(
+                    path=filepath,
+                    file_hash=texture_hash,
+                    colorspace=colorspace,
+                    transfer_mode=COPY
+                )
+
+            else:
+                filepaths_to_process.append(filepath)
+
+        if not filepaths_to_process:
+            return results
+
+        def process_texture(filepath):
+            return self._process_texture(
+                filepath,
+                processor,
+                staging_dir=staging_dir,
+                color_management=color_management,
+                colorspace=colorspace_by_filepath[filepath]
+            )
+
+        workers = min(
+            self._get_texture_processing_workers(),
+            len(filepaths_to_process)
         )
+        self.log.debug("Processing {} textures using {} workers".format(
+            len(filepaths_to_process), workers
+        ))
+        if workers < 2:
+            processed_results = [
+                process_texture(filepath)
+                for filepath in filepaths_to_process
+            ]
+        else:
+            # Processors only run subprocesses so threads are enough
+            pool = ThreadPool(workers)
+            try:
+                processed_results = pool.map(
+                    process_texture, filepaths_to_process
+                )
+            finally:
+                pool.close()
+                pool.join()
+
+        results.update(zip(filepaths_to_process, processed_results))
+        return results
+
+    def _process_texture(self,
+                         filepath,
+                         processor,
+                         staging_dir,
+                         color_management,
+                         colorspace):
+        """Process a single texture file with texture processor.
+
+        Can be called from other threads so must not use Maya.
+
+        Args:
+            filepath (str): The source file path to process.
+            processor (TextureProcessor): Processor processing the texture.
+            staging_dir (str): The staging directory to write to.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+            colorspace (str): The source colorspace of the resources this
+                texture belongs to.
+
+        Returns:
+            TextureResult: The texture result information.
+        """
+
+        self.log.debug("Processing texture {} with processor {}".format(
+            filepath, processor
+        ))
+
+        processed_result = processor.process(filepath,
+                                             colorspace,
+                                             color_management,
+                                             staging_dir)
+        if not processed_result:
+            raise RuntimeError("Texture Processor {} returned "
+                               "no result.".format(processor))
+        self.log.info("Generated processed "
+                      "texture: {}".format(processed_result.path))
+        return processed_result
 
 
 class ExtractModelRenderSets(ExtractLook):
@@ -0,0 +1,32 @@
+import pyblish.api
+
+from openpype.hosts.maya.api.texture_index import TextureHashIndex
+
+
+class IntegrateLookTextureHashIndex(pyblish.api.InstancePlugin):
+    """Remember published paths of look textures by their hashes.
+
+    Index is updated only after the instance was integrated so it never
+    points to paths of a publish which failed.
+
+    """
+
+    label = "Integrate Texture Hash Index"
+    hosts = ["maya"]
+    families = ["look", "mvLook", "model"]
+    order = pyblish.api.IntegratorOrder + 0.1
+
+    def process(self, instance):
+        source_hashes = instance.data.get("sourceHashes")
+        if not source_hashes:
+            return
+
+        if not instance.data.get("versionEntity"):
+            self.log.debug(
+                "Instance was not integrated. Skipping texture hash index."
+            )
+            return
+
+        texture_index = TextureHashIndex.from_context(instance.context)
+        for texture_hash, destination in source_hashes.items():
+            texture_index.add_paths(texture_hash, [destination])
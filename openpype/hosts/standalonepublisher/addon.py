@@ -12,6 +12,7 @@ STANDALONEPUBLISH_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 class StandAlonePublishAddon(OpenPypeModule, ITrayAction, IHostAddon):
     label = "Publisher (legacy)"
     name = "standalonepublisher"
+    settings_key = "standalonepublish_tool"
     host_name = "standalonepublisher"
 
     def initialize(self, modules_settings):
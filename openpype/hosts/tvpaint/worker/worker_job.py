@@ -378,7 +378,36 @@ class TVPaintCommands:
 
 
 class SenderTVPaintCommands(TVPaintCommands):
-    """Sender implementation of TVPaint Commands."""
+    """Sender implementation of TVPaint Commands.
+
+    Args:
+        workfile (str): Path to workfile.
+        job_queue_module (Optional[JobQueueModule]): Job queue module.
+        user (Optional[str]): User who sends the job. Used for fair-share
+            scheduling of jobs.
+        project_name (Optional[str]): Project of the job. Used for
+            fair-share scheduling of jobs.
+        priority (Optional[int]): Priority of the job. Default priority of
+            job queue is used if not passed.
+    """
+
+    def __init__(
+        self,
+        workfile,
+        job_queue_module=None,
+        user=None,
+        project_name=None,
+        priority=None
+    ):
+        super(SenderTVPaintCommands, self).__init__(
+            workfile, job_queue_module
+        )
+        self._scheduling_data = {
+            "user": user,
+            "project_name": project_name,
+            "priority": priority,
+        }
+
     def _prepare_workfile(self, workfile):
         """Remove job queue root from workfile path.
 
@@ -402,11 +431,15 @@ class SenderTVPaintCommands(TVPaintCommands):
 
     def to_job_data(self):
         """Convert commands to job data before sending to workers server."""
-        return {
+        job_data = {
             "workfile": self._workfile,
             "function": "commands",
             "commands": self.commands_data()
         }
+        for key, value in self._scheduling_data.items():
+            if value is not None:
+                job_data[key] = value
+        return job_data
 
     def set_result(self, result):
         commands_by_id = {
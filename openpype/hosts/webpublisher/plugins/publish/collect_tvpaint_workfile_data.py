@@ -20,6 +20,7 @@ from openpype.hosts.tvpaint.worker import (
     SenderTVPaintCommands,
     CollectSceneData
 )
+from openpype.lib import get_openpype_username
 from openpype_modules.webpublisher.lib import parse_json
 
 
@@ -29,6 +30,9 @@ class CollectTVPaintWorkfileData(pyblish.api.ContextPlugin):
     hosts = ["webpublisher"]
     targets = ["tvpaint_worker"]
 
+    # Priority of jobs sent to job queue, default priority is used if None
+    job_priority = None
+
     def process(self, context):
         # Get JobQueue module
         modules = context.data["openPypeModules"]
@@ -48,8 +52,22 @@ class CollectTVPaintWorkfileData(pyblish.api.ContextPlugin):
 
         # Prepare tvpaint command
         collect_scene_data_command = CollectSceneData()
+        # Data used by job queue to schedule jobs of users and projects
+        scheduling_data = {
+            "user": context.data.get("user") or get_openpype_username(),
+            "project_name": (
+                context.data.get("projectName")
+                or context.data.get("project_name")
+                or os.environ.get("AVALON_PROJECT")
+            ),
+            "priority": self.job_priority,
+        }
+        context.data["jobQueueSchedulingData"] = scheduling_data
+
         # Create TVPaint sender commands
-        commands = SenderTVPaintCommands(workfile_path, job_queue_module)
+        commands = SenderTVPaintCommands(
+            workfile_path, job_queue_module, **scheduling_data
+        )
         commands.add_command(collect_scene_data_command)
 
         # Send job and wait for answer
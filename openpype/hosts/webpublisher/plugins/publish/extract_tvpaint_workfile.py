@@ -57,7 +57,9 @@ class ExtractTVPaintSequences(pyblish.api.Extractor):
         job_queue_module = modules["job_queue"]
 
         tvpaint_commands = SenderTVPaintCommands(
-            workfile_path, job_queue_module
+            workfile_path,
+            job_queue_module,
+            **context.data.get("jobQueueSchedulingData", {})
         )
 
         # Change scene Start Frame to 0 to prevent frame index issues
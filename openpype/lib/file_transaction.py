@@ -1,10 +1,17 @@
 import os
+import time
 import logging
 import sys
 import errno
+import hashlib
+import threading
+import collections
+import concurrent.futures
+import shutil
 import six
 
 from openpype.lib import create_hard_link
+from openpype.lib.media_info_cache import get_media_info_cache
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -23,6 +30,54 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+CONTENT_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_file_content_hash(filepath, chunk_size=CONTENT_HASH_CHUNK_SIZE):
+    """Calculate sha256 hash of file content.
+
+    File is read in chunks so memory is not affected by size of file.
+
+    Args:
+        filepath (str): Path to file.
+        chunk_size (Optional[int]): Size of read chunks.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+    content_hash = hashlib.sha256()
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def copy_file_with_content_hash(
+    src, dst, chunk_size=CONTENT_HASH_CHUNK_SIZE
+):
+    """Copy file and calculate sha256 hash of its content during the copy.
+
+    Source file is read only once. File permissions and times are copied
+    as with 'shutil.copy2'.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path.
+        chunk_size (Optional[int]): Size of read chunks.
+
+    Returns:
+        str: Hex digest of file content.
+    """
+    content_hash = hashlib.sha256()
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            for chunk in iter(lambda: src_stream.read(chunk_size), b""):
+                content_hash.update(chunk)
+                dst_stream.write(chunk)
+    shutil.copystat(src, dst)
+    return content_hash.hexdigest()
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -47,6 +102,11 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Content of copied files can be hashed (sha256) during the copy when
+    'hash_content' is enabled. With 'dedupe_lookup' function is source
+    content hash looked up in already published files and if identical file
+    is found, it is hardlinked to destination instead of copying the bytes.
+
     Warning:
         Any folders created during the transfer will not be removed.
     """
@@ -54,7 +114,34 @@ class FileTransaction(object):
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        progress_callback=None,
+        hash_content=False,
+        dedupe_lookup=None
+    ):
+        """
+        Args:
+            log (Optional[logging.Logger]): Logger used for logging.
+            allow_queue_replacements (Optional[bool]): Allow replacement of
+                queued transfer to the same destination.
+            max_workers (Optional[int]): Maximum number of concurrent
+                transfers per destination device. Transfers are processed
+                one by one if not set or is lower than 2.
+            progress_callback (Optional[Callable[[str, int, int], None]]):
+                Function called after each transferred file with
+                destination path, number of finished transfers and number
+                of all transfers.
+            hash_content (Optional[bool]): Calculate content hash of copied
+                files during the copy.
+            dedupe_lookup (Optional[Callable[[str, int], Union[str, None]]]):
+                Function receiving content hash and size of source file
+                returning path to already existing file with the same
+                content or 'None'. Enables content hashing.
+        """
         if log is None:
             log = logging.getLogger("FileTransaction")
 
@@ -72,6 +159,20 @@ class FileTransaction(object):
 
         self._allow_queue_replacements = allow_queue_replacements
 
+        self._max_workers = max_workers or 1
+        self._progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._hash_content = hash_content or dedupe_lookup is not None
+        self._dedupe_lookup = dedupe_lookup
+        # Content hashes of transferred files by destination
+        self._content_hashes = {}
+        self._metrics = {
+            "files": 0,
+            "bytes": 0,
+            "deduplicated": 0,
+            "duration": 0.0,
+        }
+
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
 
@@ -109,6 +210,20 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
+    def set_dedupe_lookup(self, dedupe_lookup):
+        """Set function used to find already existing identical files.
+
+        Setting the function enables content hashing.
+
+        Args:
+            dedupe_lookup (Optional[Callable[[str, int], Optional[str]]]):
+                Function receiving content hash and size of source file
+                returning path to existing file with the same content.
+        """
+        self._dedupe_lookup = dedupe_lookup
+        if dedupe_lookup is not None:
+            self._hash_content = True
+
     def process(self):
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
@@ -126,25 +241,197 @@ class FileTransaction(object):
             os.rename(dst, backup)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
+        transfers = [
+            (src, dst, opts)
+            for dst, (src, opts) in self._transfers.items()
+        ]
+        start_time = time.time()
+        try:
+            if self._max_workers > 1 and len(transfers) > 1:
+                self._process_concurrent(transfers)
+            else:
+                for src, dst, opts in transfers:
+                    self._transfer(src, dst, opts, len(transfers))
+        finally:
+            self._metrics["duration"] += time.time() - start_time
+
+    def _process_concurrent(self, transfers):
+        """Process transfers in pools of workers grouped by device.
+
+        Each destination device has own pool so slow storage does not
+        block transfers to other storages. When any transfer fails are
+        pending transfers cancelled and first error in queue order is
+        raised once running transfers finished.
+        """
+        transfers_by_device = collections.OrderedDict()
+        for transfer in transfers:
+            device = self._get_device(transfer[1])
+            transfers_by_device.setdefault(device, []).append(transfer)
+
+        executors = []
+        futures = []
+        try:
+            for device_transfers in transfers_by_device.values():
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(self._max_workers, len(device_transfers))
+                )
+                executors.append(executor)
+                for src, dst, opts in device_transfers:
+                    futures.append(executor.submit(
+                        self._transfer, src, dst, opts, len(transfers)
+                    ))
+
+            concurrent.futures.wait(
+                futures,
+                return_when=concurrent.futures.FIRST_EXCEPTION
+            )
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        for future in futures:
+            if future.cancelled():
                 continue
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+
+    def _transfer(self, src, dst, opts, total):
+        path_same = self._same_paths(src, dst)
+        if path_same:
+            self.log.debug(
+                "Source and destination are same files {} -> {}".format(
+                    src, dst))
+            return
 
-            self._create_folder_for_file(dst)
+        self._create_folder_for_file(dst)
 
+        content_hash = None
+        deduplicated = False
+        try:
             if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
+                content_hash, deduplicated = self._copy(src, dst)
             elif opts["mode"] == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
 
+        except Exception:
+            # Remove partially transferred file so rollback does not have
+            #   to care about files which are not in 'transferred'
+            if os.path.exists(dst):
+                try:
+                    os.remove(dst)
+                except OSError:
+                    self.log.warning(
+                        "Failed to remove partially transferred file: "
+                        "{}".format(dst), exc_info=True)
+            raise
+
+        size = 0
+        if opts["mode"] == self.MODE_COPY and not deduplicated:
+            size = os.path.getsize(dst)
+
+        with self._lock:
             self._transferred.append(dst)
+            if content_hash is not None:
+                self._content_hashes[dst] = content_hash
+            self._metrics["files"] += 1
+            self._metrics["bytes"] += size
+            if deduplicated:
+                self._metrics["deduplicated"] += 1
+            done = len(self._transferred)
+
+        if self._progress_callback is not None:
+            self._progress_callback(dst, done, total)
+
+    def _copy(self, src, dst):
+        """Copy file with optional content hashing and deduplication.
+
+        Source file is read only once. If content hash of source is not
+        cached yet, it is calculated during the copy and the copy is
+        replaced with hardlink to identical published file afterwards.
+
+        Returns:
+            tuple[Union[str, None], bool]: Content hash of the file and if
+                file was hardlinked from existing file instead of copied.
+        """
+        if not self._hash_content:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+            return None, False
+
+        cache = get_media_info_cache()
+        cache_key = cache.get_key("content_hash", src)
+        content_hash = None
+        if cache_key is not None:
+            content_hash = cache.get(cache_key)
+
+        if content_hash is not None:
+            if self._dedupe(content_hash, src, dst):
+                return content_hash, True
+
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+            return content_hash, False
+
+        self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        content_hash = copy_file_with_content_hash(src, dst)
+        # Store hash of source so next publish of the same file does not
+        #   have to read it again
+        if cache_key is not None:
+            cache.set(cache_key, content_hash)
+
+        deduplicated = self._dedupe(content_hash, src, dst, replace=True)
+        return content_hash, deduplicated
+
+    def _dedupe(self, content_hash, src, dst, replace=False):
+        """Hardlink identical published file to destination.
+
+        Args:
+            content_hash (str): Content hash of source file.
+            src (str): Source path.
+            dst (str): Destination path.
+            replace (Optional[bool]): Destination already contains copy
+                of source which is replaced by the hardlink.
+
+        Returns:
+            bool: Destination is hardlink of published file.
+        """
+        if self._dedupe_lookup is None:
+            return False
+
+        existing = self._dedupe_lookup(content_hash, os.path.getsize(src))
+        if not existing or self._same_paths(existing, dst):
+            return False
+
+        link_path = dst
+        if replace:
+            link_path = "{}.{}.tmp".format(dst, os.getpid())
+
+        try:
+            create_hard_link(existing, link_path)
+            if replace:
+                os.replace(link_path, dst)
+
+        except OSError:
+            # e.g. different device or file system without
+            #   hardlinks support - fallback to copy
+            self.log.debug(
+                "Failed to hardlink {} -> {}. Copying.".format(
+                    existing, dst), exc_info=True)
+            if replace and os.path.exists(link_path):
+                os.remove(link_path)
+            return False
+
+        self.log.debug(
+            "Hardlinked identical published file ... {} -> {}".format(
+                existing, dst))
+        return True
 
     def finalize(self):
         # Delete any backed up files
@@ -195,6 +482,30 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def content_hashes(self):
+        """Return content hashes of transferred files by destination path.
+
+        Hashes are available only if content hashing is enabled.
+        """
+        return dict(self._content_hashes)
+
+    @property
+    def metrics(self):
+        """Return throughput metrics of processed transfers.
+
+        Returns:
+            dict[str, Union[int, float]]: Number of transferred files,
+                copied bytes, number of deduplicated files, duration of
+                processing in seconds and throughput in bytes per second.
+        """
+        output = dict(self._metrics)
+        duration = output["duration"]
+        output["bytes_per_second"] = (
+            output["bytes"] / duration if duration else 0.0
+        )
+        return output
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -206,6 +517,20 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
+    def _get_device(self, path):
+        # Find first existing parent folder to get device of destination
+        dirpath = os.path.dirname(path)
+        while dirpath and not os.path.exists(dirpath):
+            parent = os.path.dirname(dirpath)
+            if parent == dirpath:
+                break
+            dirpath = parent
+
+        try:
+            return os.stat(dirpath).st_dev
+        except OSError:
+            return None
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
         if os.path.exists(src) and os.path.exists(dst):
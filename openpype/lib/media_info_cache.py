@@ -0,0 +1,274 @@
+"""Cache of media information received from external tools.
+
+Tools like ffprobe or oiiotool are launched many times for the same files
+during single publishing. Output of these tools is cached in memory of
+current process and on disk so other processes can reuse it too.
+
+Cached values are invalidated when modification time or size of the file
+changes. Disk cache is safe to be used by multiple processes at the same
+time as each value is stored to own file which is replaced atomically.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import collections
+
+import appdirs
+
+from .env_tools import env_value_to_bool
+
+
+class MediaInfoCache(object):
+    """In-process LRU and on-disk cache of tool outputs for files.
+
+    Values are stored under key created from kind of information, optional
+    variant (e.g. arguments that affect output), normalized path, mtime
+    and size of the file. Files which can't be stat-ed (e.g. don't exist
+    or are sequence patterns) are never cached.
+
+    Args:
+        cache_dir (Optional[str]): Directory where cached values are stored.
+            Disk cache is disabled if is 'None'.
+        memory_limit (Optional[int]): Maximum number of values kept
+            in memory.
+        disk_limit (Optional[int]): Maximum number of values kept on disk.
+    """
+
+    default_memory_limit = 1024
+    default_disk_limit = 20000
+    # How often can be disk cache pruned (in seconds)
+    prune_interval = 300
+
+    def __init__(self, cache_dir=None, memory_limit=None, disk_limit=None):
+        if memory_limit is None:
+            memory_limit = self.default_memory_limit
+        if disk_limit is None:
+            disk_limit = self.default_disk_limit
+
+        self._cache_dir = cache_dir
+        self._memory_limit = memory_limit
+        self._disk_limit = disk_limit
+        self._memory_cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune = 0
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def get_key(self, kind, filepath, variant=None):
+        """Create cache key for a file.
+
+        Args:
+            kind (str): Kind of information, e.g. 'ffprobe'.
+            filepath (str): Path to file.
+            variant (Optional[str]): Additional identifier of value.
+
+        Returns:
+            Union[str, None]: Cache key or 'None' if file can't be cached.
+        """
+        filepath = os.path.normpath(os.path.abspath(filepath))
+        try:
+            stat = os.stat(filepath)
+        except (OSError, ValueError):
+            return None
+
+        if not os.path.isfile(filepath):
+            return None
+
+        key_parts = [
+            kind,
+            variant or "",
+            filepath,
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+        ]
+        return hashlib.sha1(
+            "|".join(key_parts).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key):
+        """Get cached value by key.
+
+        Args:
+            key (str): Key created with 'get_key'.
+
+        Returns:
+            Union[str, None]: Cached value or 'None' if is not cached.
+        """
+        with self._lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                return self._memory_cache[key]
+
+        value = self._read_from_disk(key)
+        if value is not None:
+            self._set_in_memory(key, value)
+        return value
+
+    def set(self, key, value):
+        """Store value under key.
+
+        Args:
+            key (str): Key created with 'get_key'.
+            value (str): Value to store.
+        """
+        self._set_in_memory(key, value)
+        self._write_to_disk(key, value)
+
+    def get_or_create(
+        self, kind, filepath, func, variant=None, is_valid=None
+    ):
+        """Get cached value or create it using passed function.
+
+        Args:
+            kind (str): Kind of information, e.g. 'ffprobe'.
+            filepath (str): Path to file.
+            func (Callable[[], str]): Function creating the value.
+            variant (Optional[str]): Additional identifier of value.
+            is_valid (Optional[Callable[[str], bool]]): Validation of created
+                value. Values which are not valid (e.g. tool reported
+                an error) are returned but not cached.
+
+        Returns:
+            str: Cached or newly created value.
+        """
+        key = self.get_key(kind, filepath, variant)
+        if key is None:
+            return func()
+
+        value = self.get(key)
+        if value is None:
+            value = func()
+            # Don't cache empty outputs which are usually result of failure
+            if value and (is_valid is None or is_valid(value)):
+                self.set(key, value)
+        return value
+
+    def clear(self):
+        """Clear in-process cache.
+
+        Values stored on disk are kept as they're invalidated by change of
+        file.
+        """
+        with self._lock:
+            self._memory_cache.clear()
+
+    def _set_in_memory(self, key, value):
+        with self._lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self._memory_limit:
+                self._memory_cache.popitem(last=False)
+
+    def _get_disk_path(self, key):
+        return os.path.join(self._cache_dir, key[:2], key + ".json")
+
+    def _read_from_disk(self, key):
+        if not self._cache_dir:
+            return None
+
+        path = self._get_disk_path(key)
+        try:
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, IOError, ValueError):
+            return None
+
+        return data.get("value")
+
+    def _write_to_disk(self, key, value):
+        if not self._cache_dir:
+            return
+
+        path = self._get_disk_path(key)
+        dirpath = os.path.dirname(path)
+        try:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath, exist_ok=True)
+
+            # Write to temp file first and replace the target file so other
+            #   processes never read partially written file
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".tmp_", suffix=".json", dir=dirpath
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump({"value": value}, stream)
+            os.replace(tmp_path, path)
+
+        except (OSError, IOError):
+            return
+
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove oldest values from disk if limit is exceeded."""
+        now = time.time()
+        if now - self._last_prune < self.prune_interval:
+            return
+        self._last_prune = now
+
+        filepaths = []
+        for root, _, filenames in os.walk(self._cache_dir):
+            for filename in filenames:
+                filepaths.append(os.path.join(root, filename))
+
+        if len(filepaths) <= self._disk_limit:
+            return
+
+        files_with_mtime = []
+        for filepath in filepaths:
+            try:
+                files_with_mtime.append((os.path.getmtime(filepath), filepath))
+            except OSError:
+                pass
+
+        files_with_mtime.sort()
+        to_remove = len(files_with_mtime) - self._disk_limit
+        for _, filepath in files_with_mtime[:to_remove]:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+
+_media_info_cache = None
+
+
+def get_default_media_info_cache_dir():
+    """Directory where media information cache is stored.
+
+    Can be changed using 'OPENPYPE_MEDIA_INFO_CACHE_DIR' environment variable.
+
+    Returns:
+        str: Path to cache directory.
+    """
+    cache_dir = os.environ.get("OPENPYPE_MEDIA_INFO_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    return os.path.join(
+        appdirs.user_cache_dir("openpype", "pypeclub"),
+        "media_info"
+    )
+
+
+def get_media_info_cache():
+    """Process-wide media information cache.
+
+    Disk cache can be disabled with 'OPENPYPE_MEDIA_INFO_DISK_CACHE'
+    environment variable set to '0'.
+
+    Returns:
+        MediaInfoCache: Cache object.
+    """
+    global _media_info_cache
+    if _media_info_cache is None:
+        cache_dir = None
+        if env_value_to_bool("OPENPYPE_MEDIA_INFO_DISK_CACHE", default=True):
+            cache_dir = get_default_media_info_cache_dir()
+        _media_info_cache = MediaInfoCache(cache_dir)
+    return _media_info_cache
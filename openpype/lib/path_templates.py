@@ -81,7 +81,16 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Parsed parts of template are cached by template string so creation of
+    template object with the same string does not parse it again.
+    """
+
+    # Cache of parsed parts by template string
+    _parts_cache = {}
+    _parts_cache_limit = 10000
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +98,27 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = self._parts_cache.get(template)
+        if parts is None:
+            parts = self.compile_template(template)
+            if len(self._parts_cache) >= self._parts_cache_limit:
+                self._parts_cache.clear()
+            self._parts_cache[template] = parts
+        self._parts = parts
+
+    @classmethod
+    def compile_template(cls, template):
+        """Parse template string to parts used for formatting.
+
+        Parts are not changed during formatting so they can be shared
+        between template objects.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +149,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -151,12 +181,43 @@ class StringTemplate(object):
             TemplateResult: Filled or partially filled template containing all
                 data needed or missing for filling template.
         """
+        return self._format(data)
+
+    def format_many(self, data_items, formatted_cache=None):
+        """Format template with multiple data at once.
+
+        Formatted values of keys are shared between data items, so values
+        which are same for all items (e.g. root, project, asset) are
+        formatted only once.
+
+        Args:
+            data_items (Iterable[dict]): Data used for formatting.
+            formatted_cache (Optional[dict]): Cache of formatted values which
+                can be shared between multiple templates.
+
+        Returns:
+            list[TemplateResult]: Results in order of passed data.
+        """
+        if formatted_cache is None:
+            formatted_cache = {}
+        return [
+            self._format(data, formatted_cache)
+            for data in data_items
+        ]
+
+    def format_many_strict(self, data_items):
+        results = self.format_many(data_items)
+        for result in results:
+            result.validate()
+        return results
+
+    def _format(self, data, formatted_cache=None):
         result = TemplatePartResult()
         for part in self._parts:
             if isinstance(part, six.string_types):
                 result.add_output(part)
             else:
-                part.format(data, result)
+                part.format(data, result, formatted_cache)
 
         invalid_types = result.invalid_types
         invalid_types.update(result.invalid_optional_types)
@@ -316,20 +377,24 @@ class TemplatesDict(object):
                     inner_queue.append(value)
         return objected_templates
 
-    def _format_value(self, value, data):
+    def _format_value(self, value, data, formatted_cache=None):
         if isinstance(value, StringTemplate):
-            return value.format(data)
+            if formatted_cache is None:
+                return value.format(data)
+            return value.format_many([data], formatted_cache)[0]
 
         if isinstance(value, dict):
-            return self._solve_dict(value, data)
+            return self._solve_dict(value, data, formatted_cache)
         return value
 
-    def _solve_dict(self, templates, data):
+    def _solve_dict(self, templates, data, formatted_cache=None):
         """ Solves templates with entered data.
 
         Args:
             templates (dict): All templates which will be formatted.
             data (dict): Containing keys to be filled into template.
+            formatted_cache (dict): Cache of formatted values shared
+                between multiple formatting calls.
 
         Returns:
             dict: With `TemplateResult` in values containing filled or
@@ -337,7 +402,7 @@ class TemplatesDict(object):
         """
         output = collections.defaultdict(dict)
         for key, value in templates.items():
-            output[key] = self._format_value(value, data)
+            output[key] = self._format_value(value, data, formatted_cache)
 
         return output
 
@@ -370,6 +435,42 @@ class TemplatesDict(object):
         output.strict = strict
         return output
 
+    def format_many(self, data_items, only_keys=True, strict=True):
+        """ Solves templates for multiple data at once.
+
+        Formatted values of keys are shared between all data and templates.
+        Data are not copied, they're expected to not change during
+        formatting.
+
+        Args:
+            data_items (Iterable[dict]): Data used for formatting.
+            only_keys (bool, optional): Decides if environ will be used to
+                fill templates or only keys in data.
+            strict (bool, optional): Value of 'strict' attribute of results.
+
+        Returns:
+            list[TemplatesResultDict]: Results in order of passed data.
+        """
+        env_data = {}
+        if only_keys is False:
+            for key, val in os.environ.items():
+                env_data["$" + key] = val
+
+        formatted_cache = {}
+        output = []
+        for in_data in data_items:
+            data = in_data
+            if env_data:
+                data = dict(env_data)
+                data.update(in_data)
+            solved = self._solve_dict(
+                self.objected_templates, data, formatted_cache
+            )
+            result = TemplatesResultDict(solved)
+            result.strict = strict
+            output.append(result)
+        return output
+
 
 class TemplateResult(str):
     """Result of template format with most of information in.
@@ -704,6 +805,17 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Resolve keys from template only once
+        key = template[1:-1]
+        # check if key expects subdictionary keys (e.g. project[name])
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -725,24 +837,22 @@ class FormattingPart:
                 return True
         return False
 
-    def format(self, data, result):
+    def format(self, data, result, formatted_cache=None):
         """Format the formattings string.
 
         Args:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
+            formatted_cache(Optional[dict]): Formatted values by template
+                and value shared between multiple formatting calls.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -784,17 +894,31 @@ class FormattingPart:
             return result
 
         if self.validate_value_type(value):
-            fill_data = {}
-            first_value = True
-            for used_key in reversed(used_keys):
-                if first_value:
-                    first_value = False
-                    fill_data[used_key] = value
-                else:
-                    _fill_data = {used_key: fill_data}
-                    fill_data = _fill_data
+            formatted_value = None
+            cache_key = None
+            if formatted_cache is not None:
+                cache_key = (self._template, type(value), value)
+                try:
+                    formatted_value = formatted_cache.get(cache_key)
+                except TypeError:
+                    # Value is not hashable
+                    cache_key = None
+
+            if formatted_value is None:
+                fill_data = {}
+                first_value = True
+                for used_key in reversed(used_keys):
+                    if first_value:
+                        first_value = False
+                        fill_data[used_key] = value
+                    else:
+                        _fill_data = {used_key: fill_data}
+                        fill_data = _fill_data
+
+                formatted_value = self.template.format(**fill_data)
+                if cache_key is not None:
+                    formatted_cache[cache_key] = formatted_value
 
-            formatted_value = self.template.format(**fill_data)
             result.add_realy_used_value(key, formatted_value)
             result.add_used_value(existence_check, formatted_value)
             result.add_output(formatted_value)
@@ -829,13 +953,13 @@ class OptionalPart:
     def __repr__(self):
         return "<Optional:{}>".format("".join([str(p) for p in self._parts]))
 
-    def format(self, data, result):
+    def format(self, data, result, formatted_cache=None):
         new_result = TemplatePartResult(True)
         for part in self._parts:
             if isinstance(part, six.string_types):
                 new_result.add_output(part)
             else:
-                part.format(data, new_result)
+                part.format(data, new_result, formatted_cache)
 
         if new_result.solved:
             result.add_output(new_result)
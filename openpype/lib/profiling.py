@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and startup trace."""
 import os
+import sys
+import json
+import time
+import atexit
+import tempfile
+import functools
+import threading
 import cProfile
 
+import six
+
 
 def do_profile(fn, to_file=None):
     """Wraps function in profiler run and print stat after it is done.
@@ -27,3 +36,190 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class StartupTrace(object):
+    """Record timings of startup phases and imports of a process.
+
+    Trace is written as json in Chrome trace event format so it can be
+    opened in 'chrome://tracing' or Perfetto UI.
+
+    Args:
+        output_path (str): Path where trace is written. Can contain
+            '{pid}' formatting key.
+    """
+
+    def __init__(self, output_path):
+        self._output_path = output_path.format(pid=os.getpid())
+        self._events = []
+        self._lock = threading.Lock()
+        self._orig_import = None
+        self._import_depth = threading.local()
+
+    @property
+    def output_path(self):
+        return self._output_path
+
+    def add_event(self, name, category, start, duration, args=None):
+        """Add complete event to trace.
+
+        Args:
+            name (str): Name of event.
+            category (str): Category of event e.g. 'phase' or 'import'.
+            start (float): Start time from 'time.time()'.
+            duration (float): Duration in seconds.
+            args (Optional[dict[str, Any]]): Additional data of event.
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": int(start * 1000000),
+            "dur": int(duration * 1000000),
+            "pid": os.getpid(),
+            "tid": threading.current_thread().ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def get_events(self):
+        with self._lock:
+            return list(self._events)
+
+    def install_import_hook(self):
+        """Record time of each first import of a python module."""
+        if self._orig_import is not None:
+            return
+
+        self._orig_import = six.moves.builtins.__import__
+        six.moves.builtins.__import__ = self._traced_import
+
+    def uninstall_import_hook(self):
+        if self._orig_import is None:
+            return
+        six.moves.builtins.__import__ = self._orig_import
+        self._orig_import = None
+
+    def _traced_import(self, name, *args, **kwargs):
+        orig_import = self._orig_import
+        # Only imports of modules which were not imported yet are traced
+        if orig_import is None or name in sys.modules:
+            return orig_import(name, *args, **kwargs)
+
+        depth = getattr(self._import_depth, "value", 0)
+        self._import_depth.value = depth + 1
+        start = time.time()
+        try:
+            return orig_import(name, *args, **kwargs)
+        finally:
+            self._import_depth.value = depth
+            self.add_event(
+                name, "import", start, time.time() - start, {"depth": depth}
+            )
+
+    def write(self):
+        """Write trace to output path."""
+        self.uninstall_import_hook()
+        data = {
+            "traceEvents": self.get_events(),
+            "metadata": {
+                "argv": list(sys.argv),
+                "executable": sys.executable,
+            }
+        }
+        dirpath = os.path.dirname(self._output_path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(self._output_path, "w") as stream:
+            json.dump(data, stream, indent=1)
+
+
+class _TracePhase(object):
+    """Context manager and decorator recording duration of a phase."""
+
+    def __init__(self, name):
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        trace = get_startup_trace()
+        if trace is not None:
+            trace.add_event(
+                self._name, "phase", self._start, time.time() - self._start
+            )
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _TracePhase(self._name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+_startup_trace = None
+
+
+def get_startup_trace_output_path():
+    """Output path of startup trace from environment.
+
+    Trace is enabled by 'OPENPYPE_STARTUP_TRACE' environment variable. Value
+    can be a path to output json file (can contain '{pid}') or '1' to use
+    a file in temp directory.
+
+    Returns:
+        Union[str, None]: Output path or 'None' if trace is disabled.
+    """
+    value = os.environ.get("OPENPYPE_STARTUP_TRACE")
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return None
+
+    if value.lower() in ("1", "true", "yes", "on"):
+        return os.path.join(
+            tempfile.gettempdir(), "openpype_startup_trace_{pid}.json"
+        )
+    return value
+
+
+def get_startup_trace():
+    """Startup trace of current process.
+
+    Trace is created on first call if is enabled by environment. Trace is
+    written automatically on process exit.
+
+    Returns:
+        Union[StartupTrace, None]: Trace object or 'None' if is disabled.
+    """
+    global _startup_trace
+    if _startup_trace is None:
+        output_path = get_startup_trace_output_path()
+        if output_path is None:
+            return None
+        _startup_trace = StartupTrace(output_path)
+        _startup_trace.install_import_hook()
+        atexit.register(_startup_trace.write)
+    return _startup_trace
+
+
+def trace_phase(name):
+    """Record duration of a phase to startup trace.
+
+    Can be used as context manager or decorator. Does nothing if startup
+    trace is disabled.
+
+    Example:
+        >>> with trace_phase("modules.initialize"):
+        ...     initialize_modules()
+
+    Args:
+        name (str): Name of phase.
+
+    Returns:
+        _TracePhase: Context manager and decorator.
+    """
+    return _TracePhase(name)
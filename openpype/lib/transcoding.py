@@ -6,10 +6,14 @@ import collections
 import tempfile
 import subprocess
 import platform
+import concurrent.futures
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
+from .media_info_cache import get_media_info_cache
 from .vendor_bin_utils import (
     get_ffmpeg_tool_path,
     get_oiio_tools_path,
@@ -78,11 +82,7 @@ def get_transcode_temp_directory():
     )
 
 
-def get_oiio_info_for_input(filepath, logger=None, subimages=False):
-    """Call oiiotool to get information about input and return stdout.
-
-    Stdout should contain xml format string.
-    """
+def _get_oiio_info_output(filepath, logger=None, subimages=False):
     args = [
         get_oiio_tools_path(),
         "--info",
@@ -93,7 +93,22 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    return run_subprocess(args, logger=logger)
+
+
+def get_oiio_info_for_input(filepath, logger=None, subimages=False):
+    """Call oiiotool to get information about input and return stdout.
+
+    Stdout should contain xml format string. Output of oiiotool is cached
+    per file (invalidated on file modification) so repeated calls for the
+    same file don't launch new process.
+    """
+    output = get_media_info_cache().get_or_create(
+        "oiio_info",
+        filepath,
+        lambda: _get_oiio_info_output(filepath, logger, subimages),
+        variant="subimages" if subimages else None
+    )
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -582,10 +597,122 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_ffmpeg_erase_attribs(input_info, logger):
+    """Attribute names that must be erased from metadata for ffmpeg.
+
+    Args:
+        input_info (dict[str, Any]): Information about input from oiiotool.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list[str]: Attribute names which should be erased.
+    """
+    output = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            output.append(attr_name)
+    return output
+
+
+def _get_frame_range_batches(input_paths):
+    """Split input paths to batches that can be converted in one process.
+
+    Each batch is a contiguous frame range of one sequence which can be
+    passed to oiiotool with '--frames' argument. Paths that are not part
+    of any sequence (or sequence with single frame) are returned as
+    batches without frame range.
+
+    Args:
+        input_paths (list[str]): Paths to input files.
+
+    Returns:
+        list[tuple[str, Union[tuple[int, int], None]]]: Batches in order of
+            input paths. First item is path (or path pattern with
+            '%0Nd' padding) and second is frame range or 'None'.
+    """
+    paths_by_dir = collections.OrderedDict()
+    for input_path in input_paths:
+        dirpath, filename = os.path.split(input_path)
+        paths_by_dir.setdefault(dirpath, []).append(filename)
+
+    batches = []
+    for dirpath, filenames in paths_by_dir.items():
+        cols, remainders = clique.assemble(
+            filenames,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=2
+        )
+        for filename in remainders:
+            batches.append((os.path.join(dirpath, filename), None))
+
+        for col in cols:
+            pattern = col.format("{head}{padding}{tail}")
+            if col.padding == 0:
+                pattern = col.format("{head}") + "%d" + col.format("{tail}")
+            pattern_path = os.path.join(dirpath, pattern)
+            for frame_range in _split_contiguous_ranges(sorted(col.indexes)):
+                batches.append((pattern_path, frame_range))
+
+    return batches
+
+
+def _split_contiguous_ranges(frames):
+    """Split sorted frames into contiguous frame ranges.
+
+    Args:
+        frames (list[int]): Sorted frame numbers.
+
+    Returns:
+        list[tuple[int, int]]: Ranges with inclusive frame start and end.
+    """
+    ranges = []
+    range_start = range_end = None
+    for frame in frames:
+        if range_start is None:
+            range_start = range_end = frame
+        elif frame == range_end + 1:
+            range_end = frame
+        else:
+            ranges.append((range_start, range_end))
+            range_start = range_end = frame
+
+    if range_start is not None:
+        ranges.append((range_start, range_end))
+    return ranges
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
+    frame_range_batch=False
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -598,16 +725,28 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Conversion processes are executed in a pool of workers so more frames are
+    converted at once. With 'frame_range_batch' enabled are contiguous frame
+    ranges of a sequence converted with single oiiotool process using
+    '--frames' argument instead of launching process per frame.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of samy type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of conversion processes
+            running at the same time. Number of cpu cores is used
+            when not set.
+        frame_range_batch (Optional[bool]): Convert contiguous frame ranges
+            of sequences in one process.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: When any of conversions failed. Message contains
+            errors in order of input paths.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -654,7 +793,15 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
-    for input_path in input_paths:
+    erase_attribs = _get_ffmpeg_erase_attribs(input_info, logger)
+
+    if frame_range_batch:
+        batches = _get_frame_range_batches(input_paths)
+    else:
+        batches = [(input_path, None) for input_path in input_paths]
+
+    oiio_cmds = []
+    for input_path, frame_range in batches:
         # Prepare subprocess arguments
         oiio_cmd = [
             get_oiio_tools_path(),
@@ -666,6 +813,10 @@ def convert_input_paths_for_ffmpeg(
         if compression:
             oiio_cmd.extend(["--compression", compression])
 
+        # Add frame definitions to arguments
+        if frame_range is not None:
+            oiio_cmd.extend(["--frames", "{}-{}".format(*frame_range)])
+
         oiio_cmd.extend([
             input_arg, input_path,
             # Tell oiiotool which channels should be put to top stack
@@ -675,35 +826,8 @@ def convert_input_paths_for_ffmpeg(
             "--subimage", "0"
         ])
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        for attr_name in erase_attribs:
+            oiio_cmd.extend(["--eraseattrib", attr_name])
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -711,21 +835,108 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
+
+    _run_conversion_commands(oiio_cmds, max_workers, logger)
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+
+def _run_conversion_commands(cmds, max_workers, logger):
+    """Run conversion commands in pool of workers.
+
+    All commands are executed even if some of them fail. Errors are
+    reported at the end in order of passed commands.
+
+    Args:
+        cmds (list[list[str]]): Commands to execute.
+        max_workers (Union[int, None]): Maximum number of processes running
+            at the same time. Number of cpu cores is used when not set.
+        logger (logging.Logger): Logger used for logging.
+
+    Raises:
+        RuntimeError: When any of commands failed.
+    """
+    def _run_cmd(cmd):
+        logger.debug("Conversion command: {}".format(" ".join(cmd)))
+        run_subprocess(cmd, logger=logger)
+
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(cmds))
+
+    errors = []
+    if max_workers <= 1:
+        for cmd in cmds:
+            try:
+                _run_cmd(cmd)
+            except Exception as exc:
+                errors.append((cmd, exc))
+
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = [
+                executor.submit(_run_cmd, cmd)
+                for cmd in cmds
+            ]
+            # Go through futures in order of commands so errors are
+            #   reported in the same order
+            for cmd, future in zip(cmds, futures):
+                exc = future.exception()
+                if exc is not None:
+                    errors.append((cmd, exc))
+
+    if not errors:
+        return
+
+    error_msgs = [
+        "Conversion command failed: {}\n{}".format(" ".join(cmd), str(exc))
+        for cmd, exc in errors
+    ]
+    raise RuntimeError(
+        "Failed to convert {} of {} inputs for ffmpeg.\n{}".format(
+            len(errors), len(cmds), "\n".join(error_msgs)
+        )
+    )
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output of ffprobe is cached per file (invalidated on file modification)
+    so repeated calls for the same file don't launch new process.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
     if not logger:
         logger = logging.getLogger(__name__)
+
+    output = get_media_info_cache().get_or_create(
+        "ffprobe",
+        path_to_file,
+        lambda: _get_ffprobe_output(path_to_file, logger),
+        is_valid=_is_valid_ffprobe_output
+    )
+    return json.loads(output)
+
+
+def _is_valid_ffprobe_output(output):
+    """Output of ffprobe can be cached only if ffprobe did not fail.
+
+    Ffprobe is launched with '-show_error' so failure is reported in output
+    under 'error' key.
+    """
+    try:
+        data = json.loads(output)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and "error" not in data
+
+
+def _get_ffprobe_output(path_to_file, logger):
     logger.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -770,7 +981,7 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    return popen_stdout.decode("utf-8")
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -8,6 +8,7 @@ import time
 import inspect
 import logging
 import platform
+import functools
 import threading
 import collections
 import traceback
@@ -38,6 +39,7 @@ from openpype.lib import (
     import_module_from_dirpath,
 )
 from openpype.lib.openpype_version import is_staging_enabled
+from openpype.lib.profiling import trace_phase
 
 from .interfaces import (
     OpenPypeInterface,
@@ -59,6 +61,14 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Methods of 'IPluginPaths' stored to modules manifest
+_PLUGIN_PATHS_METHODS = (
+    "get_plugin_paths",
+    "get_create_plugin_paths",
+    "get_load_plugin_paths",
+    "get_publish_plugin_paths",
+    "get_inventory_action_paths",
+)
 
 
 # Inherit from `object` for Python 2 hosts
@@ -67,6 +77,10 @@ class _ModuleClass(object):
 
     Object of this class can be stored to `sys.modules` and used for storing
     dynamically imported modules.
+
+    Attributes can be registered lazily with a loader callback which is
+    called on first access of the attribute. Loader is expected to set
+    the attribute.
     """
 
     def __init__(self, name):
@@ -77,12 +91,17 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of attributes which were not loaded yet
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
+        if attr_name in self.__lazy__:
+            self._load_lazy_attribute(attr_name)
+
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -94,7 +113,11 @@ class _ModuleClass(object):
             yield module
 
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        self.__lazy__.pop(attr_name, None)
+        if (
+            attr_name in self.__attributes__
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     self.name, attr_name
@@ -116,16 +139,49 @@ class _ModuleClass(object):
             )
         return self._log
 
+    def set_lazy(self, attr_name, loader):
+        """Register attribute which is loaded on first access.
+
+        Args:
+            attr_name (str): Name of attribute.
+            loader (Callable[[], None]): Callback which sets the attribute.
+        """
+        if attr_name not in self.__attributes__:
+            self.__lazy__[attr_name] = loader
+
+    def is_lazy(self, attr_name):
+        """Attribute is registered but was not loaded yet."""
+        return attr_name in self.__lazy__
+
+    def _load_lazy_attribute(self, attr_name):
+        with _LoadCache.lazy_lock:
+            loader = self.__lazy__.pop(attr_name, None)
+            if loader is not None:
+                loader()
+
+    def _load_all_lazy_attributes(self):
+        for attr_name in tuple(self.__lazy__.keys()):
+            self._load_lazy_attribute(attr_name)
+
     def get(self, key, default=None):
+        if key in self.__lazy__:
+            self._load_lazy_attribute(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
-        return self.__attributes__.keys()
+        """Names of all attributes without loading lazy attributes."""
+        return list(self.__attributes__.keys()) + [
+            attr_name
+            for attr_name in self.__lazy__.keys()
+            if attr_name not in self.__attributes__
+        ]
 
     def values(self):
+        self._load_all_lazy_attributes()
         return self.__attributes__.values()
 
     def items(self):
+        self._load_all_lazy_attributes()
         return self.__attributes__.items()
 
 
@@ -161,8 +217,354 @@ class _InterfacesClass(_ModuleClass):
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
+    lazy_lock = threading.RLock()
     interfaces_loaded = False
     modules_loaded = False
+    # Paths of lazy loaded modules by their name in 'openpype_modules'
+    module_paths = {}
+    manifest = None
+
+
+class _LazyModulesFinder(object):
+    """Import hook for not yet loaded modules in 'openpype_modules'.
+
+    Allows to use 'import openpype_modules.<name>.<submodule>' even if
+    module '<name>' was not accessed yet.
+
+    Args:
+        modules_key (str): Name of fake module in 'sys.modules'.
+    """
+
+    def __init__(self, modules_key):
+        self._modules_key = modules_key
+        # Specs of loaded modules before import machinery replaced them
+        self._original_specs = {}
+
+    def _is_lazy(self, fullname):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != self._modules_key:
+            return False
+
+        openpype_modules = sys.modules.get(self._modules_key)
+        return (
+            isinstance(openpype_modules, _ModuleClass)
+            and openpype_modules.is_lazy(parts[1])
+        )
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not self._is_lazy(fullname):
+            return None
+        import importlib.machinery
+
+        return importlib.machinery.ModuleSpec(fullname, self)
+
+    def find_module(self, fullname, path=None):
+        if not self._is_lazy(fullname):
+            return None
+        return self
+
+    def create_module(self, spec):
+        module = self.load_module(spec.name)
+        # Import machinery sets '__spec__' of this finder to returned module
+        #   which is already imported with own spec (e.g. under name
+        #   'openpype.modules.<name>'). Original spec is restored in
+        #   'exec_module'.
+        self._original_specs[spec.name] = getattr(module, "__spec__", None)
+        return module
+
+    def exec_module(self, module):
+        # Module was already executed in 'create_module'
+        spec = module.__spec__
+        if spec is not None and spec.name in self._original_specs:
+            module.__spec__ = self._original_specs.pop(spec.name)
+
+    def load_module(self, fullname):
+        openpype_modules = sys.modules[self._modules_key]
+        openpype_modules.get(fullname.split(".")[-1])
+        if fullname not in sys.modules:
+            raise ImportError("Failed to import {}".format(fullname))
+        return sys.modules[fullname]
+
+
+class _ModulesManifest(object):
+    """Information about modules found in module directories.
+
+    Manifest is stored to disk and tells which modules define
+    'OpenPypeModule' classes or settings definitions so modules which
+    don't have to be imported are not imported. For each module class is
+    stored its name, settings key, interfaces and plugin paths methods so
+    modules disabled in settings are not imported either. Information about
+    module is invalidated when modification time of module directory or of
+    any python file directly in it changes.
+
+    Args:
+        filepath (Union[str, None]): Path to json file where manifest is
+            stored. Manifest is kept only in memory if is 'None'.
+    """
+
+    version = 2
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+        self._data = None
+        self._stamps = {}
+        self._changed = False
+
+    def _get_data(self):
+        if self._data is None:
+            data = {}
+            if self._filepath and os.path.exists(self._filepath):
+                try:
+                    with open(self._filepath, "r") as stream:
+                        data = json.load(stream)
+                except (OSError, IOError, ValueError):
+                    data = {}
+
+            if data.get("version") != self.version:
+                data = {"version": self.version}
+            data.setdefault("modules", {})
+            self._data = data
+        return self._data
+
+    def _get_stamp(self, path):
+        if path in self._stamps:
+            return self._stamps[path]
+
+        stamp = None
+        try:
+            stamp = os.path.getmtime(path)
+            if os.path.isdir(path):
+                for filename in os.listdir(path):
+                    if filename.endswith(".py"):
+                        stamp = max(stamp, os.path.getmtime(
+                            os.path.join(path, filename)
+                        ))
+        except OSError:
+            stamp = None
+        self._stamps[path] = stamp
+        return stamp
+
+    def get(self, path):
+        """Stored information about module on path.
+
+        Args:
+            path (str): Path to module directory or file.
+
+        Returns:
+            Union[dict[str, list[str]], None]: Information about module or
+                'None' if is not stored or is outdated.
+        """
+        item = self._get_data()["modules"].get(path)
+        stamp = self._get_stamp(path)
+        if not item or stamp is None or item.get("stamp") != stamp:
+            return None
+        return item["info"]
+
+    def set(self, path, info):
+        stamp = self._get_stamp(path)
+        if stamp is None:
+            return
+        self._get_data()["modules"][path] = {"stamp": stamp, "info": info}
+        self._changed = True
+
+    def save(self):
+        if not self._changed or not self._filepath:
+            return
+        self._changed = False
+
+        dirpath = os.path.dirname(self._filepath)
+        tmp_path = "{}.{}.tmp".format(self._filepath, os.getpid())
+        try:
+            if not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+            with open(tmp_path, "w") as stream:
+                json.dump(self._data, stream)
+            # Replace is atomic so other processes never read half of file
+            if six.PY3:
+                os.replace(tmp_path, self._filepath)
+            else:
+                if os.path.exists(self._filepath):
+                    os.remove(self._filepath)
+                os.rename(tmp_path, self._filepath)
+        except (OSError, IOError):
+            pass
+
+
+def _is_lazy_modules_load_enabled():
+    value = os.environ.get("OPENPYPE_MODULES_LAZY_LOAD") or "1"
+    return value.lower() not in ("0", "false", "no", "off")
+
+
+def _get_modules_manifest():
+    if _LoadCache.manifest is None:
+        filepath = None
+        if _is_lazy_modules_load_enabled():
+            filepath = os.path.join(
+                appdirs.user_cache_dir("openpype", "pypeclub"),
+                "modules_manifest.json"
+            )
+        _LoadCache.manifest = _ModulesManifest(filepath)
+    return _LoadCache.manifest
+
+
+def _get_module_class_manifest_info(module_class):
+    """Collect information about 'OpenPypeModule' class for manifest.
+
+    Args:
+        module_class (type[OpenPypeModule]): Module class.
+
+    Returns:
+        dict[str, Any]: Name of class, name of module, settings key,
+            names of interfaces and implemented plugin paths methods.
+    """
+    name = module_class.name
+    if not isinstance(name, six.string_types):
+        name = None
+
+    interfaces = [
+        cls.__name__
+        for cls in inspect.getmro(module_class)
+        if cls is not OpenPypeInterface
+        and issubclass(cls, OpenPypeInterface)
+    ]
+    plugin_paths = []
+    if issubclass(module_class, IPluginPaths):
+        plugin_paths = [
+            attr_name
+            for attr_name in _PLUGIN_PATHS_METHODS
+            if (
+                getattr(module_class, attr_name)
+                is not getattr(IPluginPaths, attr_name)
+            )
+        ]
+
+    return {
+        "class_name": module_class.__name__,
+        "name": name,
+        "settings_key": module_class.settings_key,
+        "interfaces": interfaces,
+        "plugin_paths": plugin_paths,
+    }
+
+
+def _get_module_manifest_info(module):
+    """Collect information about module for manifest.
+
+    Args:
+        module (ModuleType): Imported python module.
+
+    Returns:
+        dict[str, list]: Information about 'OpenPypeModule' classes and
+            names of settings definitions available in module.
+    """
+    module_classes = []
+    settings_defs = []
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name, None)
+        if not inspect.isclass(attr):
+            continue
+        if issubclass(attr, OpenPypeModule):
+            module_classes.append(_get_module_class_manifest_info(attr))
+        elif issubclass(attr, BaseModuleSettingsDef):
+            settings_defs.append(attr_name)
+    return {
+        "module_classes": module_classes,
+        "settings_defs": settings_defs
+    }
+
+
+def _iter_openpype_modules(info_key, skip_module=None):
+    """Iterate loaded modules which may contain requested objects.
+
+    Modules which, based on manifest, don't contain any object of requested
+    type are not imported.
+
+    Args:
+        info_key (str): Key in manifest information, 'module_classes' or
+            'settings_defs'.
+        skip_module (Optional[Callable[[str, dict], bool]]): Decide if
+            module should be skipped based on its name and information
+            in manifest. Called only for modules stored in manifest.
+
+    Yields:
+        ModuleType: Imported python module.
+    """
+    import openpype_modules
+
+    manifest = _get_modules_manifest()
+    for name in openpype_modules.keys():
+        path = _LoadCache.module_paths.get(name)
+        info = None
+        if path:
+            info = manifest.get(path)
+            if info is not None:
+                if not info.get(info_key):
+                    continue
+                if skip_module is not None and skip_module(name, info):
+                    continue
+
+        module = openpype_modules.get(name)
+        if module is None:
+            continue
+
+        if path and info is None:
+            manifest.set(path, _get_module_manifest_info(module))
+        yield module
+    manifest.save()
+
+
+def _import_module_item(
+    openpype_modules, modules_key, dirpath, filename, is_in_current_dir,
+    is_in_host_dir, log
+):
+    """Import module found in module directories.
+
+    Imported module is stored to passed 'openpype_modules'.
+    """
+    fullpath = os.path.join(dirpath, filename)
+    basename = os.path.splitext(filename)[0]
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir:
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            default_module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = default_module
+            setattr(openpype_modules, basename, default_module)
+
+        elif is_in_host_dir:
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
+            try:
+                default_module = __import__(
+                    import_str, fromlist=("", )
+                )
+                sys.modules[new_import_str] = default_module
+                setattr(openpype_modules, basename, default_module)
+
+            except Exception:
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+
+        elif os.path.isdir(fullpath):
+            import_module_from_dirpath(dirpath, filename, modules_key)
+
+        else:
+            module = import_filepath(fullpath)
+            setattr(openpype_modules, basename, module)
+
+    except Exception:
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(
+                basename
+            )
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
 
 
 def get_default_modules_dir():
@@ -287,6 +689,10 @@ def load_modules(force=False):
     Function makes sure that `load_interfaces` was triggered. Modules import
     has specific order which can't be changed.
 
+    Modules are imported lazily on first access of the module in
+    `openpype_modules`. Lazy import can be disabled by setting environment
+    variable 'OPENPYPE_MODULES_LAZY_LOAD' to '0'.
+
     Args:
         force(bool): Force to load modules even if are already loaded.
             This won't update already loaded and used (cached) modules.
@@ -437,6 +843,7 @@ def _load_ayon_addons(openpype_modules, modules_key, log):
     return v3_addons_to_skip
 
 
+@trace_phase("modules.load")
 def _load_modules():
     # Key under which will be modules imported in `sys.modules`
     modules_key = "openpype_modules"
@@ -446,6 +853,14 @@ def _load_modules():
 
     log = Logger.get_logger("ModulesLoader")
 
+    lazy_load = _is_lazy_modules_load_enabled()
+    _LoadCache.module_paths = {}
+    if lazy_load and not any(
+        isinstance(finder, _LazyModulesFinder)
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.insert(0, _LazyModulesFinder(modules_key))
+
     ignore_addon_names = []
     if AYON_SERVER_ENABLED:
         ignore_addon_names = _load_ayon_addons(
@@ -512,50 +927,23 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
-
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
-
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
-
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+            loader = functools.partial(
+                _import_module_item,
+                openpype_modules,
+                modules_key,
+                dirpath,
+                filename,
+                is_in_current_dir,
+                is_in_host_dir,
+                log
+            )
+            if not lazy_load:
+                loader()
+                continue
 
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+            # Module is imported on first access
+            _LoadCache.module_paths[basename] = os.path.normpath(fullpath)
+            openpype_modules.set_lazy(basename, loader)
 
 
 @six.add_metaclass(ABCMeta)
@@ -571,6 +959,10 @@ class OpenPypeModule:
 
     # Disable by default
     enabled = False
+    # Key in 'modules' system settings where is 'enabled' of the module.
+    #   Module which is disabled in settings is not imported by
+    #   'ModulesManager' until is requested by name.
+    settings_key = None
     _id = None
 
     @property
@@ -680,9 +1072,43 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _ModulesByName(dict):
+    """Initialized modules by name.
+
+    Modules disabled in settings which were not imported by manager are
+    imported and initialized on first access.
+    """
+
+    def __init__(self, manager):
+        super(_ModulesByName, self).__init__()
+        self._manager = manager
+
+    def __missing__(self, module_name):
+        module = self._manager._initialize_skipped_module(module_name)
+        if module is None:
+            raise KeyError(module_name)
+        return module
+
+    def __contains__(self, module_name):
+        return (
+            super(_ModulesByName, self).__contains__(module_name)
+            or self._manager._is_module_skipped(module_name)
+        )
+
+    def get(self, module_name, default=None):
+        try:
+            return self[module_name]
+        except KeyError:
+            return default
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
+    Modules which are disabled in settings, based on modules manifest, are
+    not imported and are not in 'modules'. They are initialized when are
+    accessed by name.
+
     Args:
         modules_settings(dict): To be able create module manager with specified
             data. For settings changes callbacks and testing purposes.
@@ -697,7 +1123,11 @@ class ModulesManager:
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        # Module names and names of their python modules which were not
+        #   imported because they're disabled in settings
+        self._skipped_modules = {}
+        self._modules_settings = None
         # For report of time consumption
         self._report = {}
 
@@ -733,92 +1163,180 @@ class ModulesManager:
             Union[OpenPypeModule, None]: Enabled module found by name or None.
         """
 
+        # Skipped modules are disabled, don't import them
+        if self._is_module_skipped(module_name):
+            return default
         module = self.get(module_name)
         if module is not None and module.enabled:
             return module
         return default
 
+    @trace_phase("modules.initialize")
     def initialize_modules(self):
         """Import and initialize modules."""
         # Make sure modules are loaded
         load_modules()
 
-        import openpype_modules
-
         self.log.debug("*** Pype modules initialization.")
         # Prepare settings for modules
         system_settings = getattr(self, "_system_settings", None)
         if system_settings is None:
             system_settings = get_system_settings()
         modules_settings = system_settings["modules"]
+        self._modules_settings = modules_settings
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
-                    continue
-
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
+        # Modules without module classes or disabled in settings are not
+        #   imported
+        skip_module = functools.partial(
+            self._skip_disabled_module, modules_settings
+        )
+        for module in _iter_openpype_modules("module_classes", skip_module):
+            module_classes.extend(self._get_module_classes(module))
 
         for modules_item in module_classes:
-            try:
-                name = modules_item.__name__
-                # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
-                now = time.time()
-                report[module.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            self._initialize_module(modules_item, modules_settings)
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of module {} failed.".format(name),
-                    exc_info=True
-                )
+            now = time.time()
+            report[modules_item.__name__] = now - prev_start_time
+            prev_start_time = now
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
+    def _skip_disabled_module(self, modules_settings, name, info):
+        """Skip import of module if all its module classes are disabled.
+
+        Args:
+            modules_settings (dict[str, Any]): Modules system settings.
+            name (str): Name of python module in 'openpype_modules'.
+            info (dict[str, Any]): Information about module from manifest.
+
+        Returns:
+            bool: Module should not be imported.
+        """
+        module_names = []
+        for class_info in info["module_classes"]:
+            settings_key = class_info.get("settings_key")
+            module_name = class_info.get("name")
+            if not settings_key or not module_name:
+                return False
+
+            module_settings = modules_settings.get(settings_key)
+            if (
+                not isinstance(module_settings, dict)
+                or module_settings.get("enabled") is not False
+            ):
+                return False
+            module_names.append(module_name)
+
+        for module_name in module_names:
+            self._skipped_modules[module_name] = name
+            self.log.debug("[ ] {} (not imported)".format(module_name))
+        return True
+
+    def _is_module_skipped(self, module_name):
+        return module_name in self._skipped_modules
+
+    def _initialize_skipped_module(self, module_name):
+        """Import and initialize module which was skipped on initialization.
+
+        Args:
+            module_name (str): Name of module.
+
+        Returns:
+            Union[OpenPypeModule, None]: Initialized module or None if module
+                was not skipped.
+        """
+        import openpype_modules
+
+        with _LoadCache.lazy_lock:
+            name = self._skipped_modules.get(module_name)
+            if name is None:
+                return None
+
+            for key, value in tuple(self._skipped_modules.items()):
+                if value == name:
+                    self._skipped_modules.pop(key)
+
+            module = openpype_modules.get(name)
+            if module is not None:
+                for modules_item in self._get_module_classes(module):
+                    self._initialize_module(
+                        modules_item, self._modules_settings
+                    )
+        return dict.get(self.modules_by_name, module_name)
+
+    def _get_module_classes(self, module):
+        """Module classes which can be initialized from python module.
+
+        Args:
+            module (ModuleType): Imported python module.
+
+        Returns:
+            list[type[OpenPypeModule]]: Module classes.
+        """
+        module_classes = []
+        # Go through globals in `pype.modules`
+        for name in dir(module):
+            modules_item = getattr(module, name, None)
+            # Filter globals that are not classes which inherit from
+            #   OpenPypeModule
+            if (
+                not inspect.isclass(modules_item)
+                or modules_item is OpenPypeModule
+                or modules_item is OpenPypeAddOn
+                or not issubclass(modules_item, OpenPypeModule)
+            ):
+                continue
+
+            # Check if class is abstract (Developing purpose)
+            if inspect.isabstract(modules_item):
+                # Find abstract attributes by convention on `abc` module
+                not_implemented = []
+                for attr_name in dir(modules_item):
+                    attr = getattr(modules_item, attr_name, None)
+                    abs_method = getattr(
+                        attr, "__isabstractmethod__", None
+                    )
+                    if attr and abs_method:
+                        not_implemented.append(attr_name)
+
+                # Log missing implementations
+                self.log.warning((
+                    "Skipping abstract Class: {}."
+                    " Missing implementations: {}"
+                ).format(name, ", ".join(not_implemented)))
+                continue
+            module_classes.append(modules_item)
+        return module_classes
+
+    def _initialize_module(self, modules_item, modules_settings):
+        name = modules_item.__name__
+        try:
+            # Try initialize module
+            module = modules_item(self, modules_settings)
+            # Store initialized object
+            self.modules.append(module)
+            self.modules_by_id[module.id] = module
+            self.modules_by_name[module.name] = module
+            enabled_str = "X"
+            if not module.enabled:
+                enabled_str = " "
+            self.log.debug("[{}] {}".format(enabled_str, name))
+
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(name),
+                exc_info=True
+            )
+
+    @trace_phase("modules.connect")
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -1190,7 +1708,11 @@ class TrayModulesManager(ModulesManager):
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        # Module names and names of their python modules which were not
+        #   imported because they're disabled in settings
+        self._skipped_modules = {}
+        self._modules_settings = None
         self._report = {}
 
         self.tray_manager = None
@@ -1354,13 +1876,11 @@ def get_module_settings_defs():
     # Make sure modules are loaded
     load_modules()
 
-    import openpype_modules
-
     settings_defs = []
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
+    for raw_module in _iter_openpype_modules("settings_defs"):
         for attr_name in dir(raw_module):
             attr = getattr(raw_module, attr_name)
             if (
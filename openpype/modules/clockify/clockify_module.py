@@ -10,6 +10,7 @@ from .constants import CLOCKIFY_FTRACK_USER_PATH, CLOCKIFY_FTRACK_SERVER_PATH
 
 class ClockifyModule(OpenPypeModule, ITrayModule, IPluginPaths):
     name = "clockify"
+    settings_key = "clockify"
 
     def initialize(self, modules_settings):
         clockify_settings = modules_settings[self.name]
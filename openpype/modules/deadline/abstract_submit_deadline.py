@@ -26,6 +26,8 @@ from openpype.pipeline.publish.lib import (
     replace_with_published_scene_path
 )
 
+from .deadline_client import get_deadline_client
+
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
@@ -507,6 +509,15 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
         """
         return []
 
+    @property
+    def deadline_client(self):
+        """Client for Deadline Web Service of current instance.
+
+        Returns:
+            DeadlineClient: Client shared by all plugins using the same url.
+        """
+        return get_deadline_client(self._deadline_url)
+
     def from_published_scene(self, replace_in_path=True):
         """Switch work scene for published scene.
 
@@ -569,8 +580,61 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             KnownPublishError: if submission fails.
 
         """
-        url = "{}/api/jobs".format(self._deadline_url)
-        response = requests_post(url, json=payload)
+        response = self.deadline_client.submit_job(payload)
+        result = self._process_submit_response(response, payload)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_many(self, payloads):
+        """Submit multiple independent payloads to Deadline concurrently.
+
+        Payloads must not depend on each other. Result of last payload is
+        stored to instance the same way as if payloads were submitted one
+        by one using 'submit'.
+
+        Args:
+            payloads (Iterable[dict]): dicts to become json in deadline
+                submissions.
+
+        Returns:
+            list[str]: resulting Deadline job ids in order of payloads.
+
+        Throws:
+            KnownPublishError: if any submission fails.
+
+        """
+        payloads = list(payloads)
+        if not payloads:
+            return []
+
+        responses = self.deadline_client.submit_jobs(payloads)
+        results = [
+            self._process_submit_response(response, payload)
+            for response, payload in zip(responses, payloads)
+        ]
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = results[-1]
+
+        return [result["_id"] for result in results]
+
+    def _process_submit_response(self, response, payload):
+        """Validate response of submission and return its result.
+
+        Args:
+            response (requests.Response): Response of Deadline Web Service.
+            payload (dict): Submitted payload.
+
+        Returns:
+            dict: Submitted job data.
+
+        Throws:
+            KnownPublishError: if submission failed.
+
+        """
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
@@ -579,14 +643,9 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             raise KnownPublishError(response.text)
 
         try:
-            result = response.json()
+            return response.json()
         except JSONDecodeError:
             msg = "Broken response {}. ".format(response)
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""Client for Deadline Web Service.
+
+Client keeps connections to Deadline Web Service open between requests,
+retries requests which failed because Web Service was temporarily not
+available and can submit multiple independent jobs at the same time.
+
+"""
+import os
+import time
+import threading
+from multiprocessing.pool import ThreadPool
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+from openpype.lib import Logger
+
+
+def _get_default_verify():
+    """SSL verification based on 'OPENPYPE_DONT_VERIFY_SSL'.
+
+    Same logic as in 'requests_post' and 'requests_get' is used, which
+    means verification is disabled unless the environment variable is set
+    to an empty string.
+    """
+    return not os.getenv("OPENPYPE_DONT_VERIFY_SSL", True)
+
+
+def _is_connect_error(exc):
+    """Connection to server was not established.
+
+    Request was not sent to server so it is safe to repeat it.
+
+    Args:
+        exc (requests.exceptions.ConnectionError): Raised exception.
+
+    Returns:
+        bool: Exception happened before request was sent.
+    """
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    # Refused connection is wrapped in 'MaxRetryError' of urllib3
+    reason = exc.args[0] if exc.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, ConnectTimeoutError)
+
+
+class DeadlineClient(object):
+    """Pooled connection to Deadline Web Service.
+
+    Requests are sent using single 'requests.Session' so connections are
+    reused. Requests which returned one of 'retry_status_codes' are repeated
+    with exponential backoff. Requests which failed on connection error are
+    repeated only if are 'idempotent_methods' or if connection to server
+    was not established, so a job is not submitted twice.
+
+    Warning:
+        SSL certificate validation is disabled by default, same as in other
+        requests to Deadline. It is enabled only if
+        'OPENPYPE_DONT_VERIFY_SSL' is set to an empty string. Disabling SSL
+        certificate validation is defeating one line of defense SSL is
+        providing, and it is not recommended.
+
+    Args:
+        url (str): Deadline Web Service url.
+        timeout (Optional[float]): Timeout of single request in seconds.
+        retries (Optional[int]): How many times is failed request repeated.
+        backoff (Optional[float]): Seconds to wait before first retry. Wait
+            time is doubled for each following retry.
+        max_workers (Optional[int]): Maximum number of requests sent
+            at the same time.
+        verify (Optional[bool]): Verify SSL certificates. Default is based
+            on 'OPENPYPE_DONT_VERIFY_SSL' environment variable.
+    """
+
+    default_timeout = 10
+    default_retries = 3
+    default_backoff = 0.5
+    default_max_workers = 8
+    # Web Service is restarting or is overloaded
+    retry_status_codes = (503, )
+    # Methods which can be repeated on any connection error
+    idempotent_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(
+        self,
+        url,
+        timeout=None,
+        retries=None,
+        backoff=None,
+        max_workers=None,
+        verify=None
+    ):
+        if timeout is None:
+            timeout = self.default_timeout
+        if retries is None:
+            retries = self.default_retries
+        if backoff is None:
+            backoff = self.default_backoff
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if verify is None:
+            verify = _get_default_verify()
+
+        self._url = url.rstrip("/")
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._max_workers = max(1, max_workers)
+        self._verify = verify
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def session(self):
+        """Session used for all requests.
+
+        Returns:
+            requests.Session: Session with connection pool big enough for
+                concurrent requests.
+        """
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self._max_workers
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.verify = self._verify
+                self._session = session
+        return self._session
+
+    def close(self):
+        """Close all open connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def get_url(self, endpoint):
+        """Full url of an endpoint.
+
+        Args:
+            endpoint (str): Endpoint e.g. '/api/jobs'. Absolute urls are
+                returned as they are.
+
+        Returns:
+            str: Url of endpoint.
+        """
+        if "://" in endpoint:
+            return endpoint
+        return "{}/{}".format(self._url, endpoint.lstrip("/"))
+
+    def request(self, method, endpoint, **kwargs):
+        """Send request to Web Service with retries.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint or full url.
+            **kwargs: Keyword arguments passed to 'requests.Session.request'.
+
+        Returns:
+            requests.Response: Response of last attempt.
+
+        Raises:
+            requests.exceptions.ConnectionError: Web Service is not
+                reachable even after all retries.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        url = self.get_url(endpoint)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+                if (
+                    response.status_code not in self.retry_status_codes
+                    or attempt >= self._retries
+                ):
+                    return response
+
+            except requests.exceptions.ConnectionError as exc:
+                if attempt >= self._retries:
+                    raise
+                # Request might have been processed by server
+                if (
+                    method.upper() not in self.idempotent_methods
+                    and not _is_connect_error(exc)
+                ):
+                    raise
+
+            wait_time = self._backoff * (2 ** attempt)
+            attempt += 1
+            self.log.debug(
+                "Request {} {} failed. Retrying in {:.2f}s ({}/{})".format(
+                    method, url, wait_time, attempt, self._retries
+                )
+            )
+            time.sleep(wait_time)
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request("POST", endpoint, **kwargs)
+
+    def submit_job(self, payload):
+        """Submit job payload.
+
+        Args:
+            payload (dict[str, Any]): Job payload with 'JobInfo',
+                'PluginInfo' and 'AuxFiles'.
+
+        Returns:
+            requests.Response: Response of Web Service.
+        """
+        return self.post("/api/jobs", json=payload)
+
+    def submit_jobs(self, payloads):
+        """Submit multiple independent job payloads concurrently.
+
+        Payloads must not depend on each other as order in which are jobs
+        created is not guaranteed.
+
+        Args:
+            payloads (Iterable[dict[str, Any]]): Job payloads.
+
+        Returns:
+            list[requests.Response]: Responses in order of payloads.
+        """
+        payloads = list(payloads)
+        workers = min(self._max_workers, len(payloads))
+        if workers < 2:
+            return [self.submit_job(payload) for payload in payloads]
+
+        pool = ThreadPool(workers)
+        try:
+            return pool.map(self.submit_job, payloads)
+        finally:
+            pool.close()
+            pool.join()
+
+
+class _ClientsCache(object):
+    lock = threading.Lock()
+    clients = {}
+
+
+def get_deadline_client(url):
+    """Shared client for Deadline Web Service url.
+
+    All plugins submitting to the same Web Service in a process share
+    connections.
+
+    Args:
+        url (str): Deadline Web Service url.
+
+    Returns:
+        DeadlineClient: Client for the url.
+    """
+    key = url.rstrip("/")
+    with _ClientsCache.lock:
+        client = _ClientsCache.clients.get(key)
+        if client is None:
+            client = DeadlineClient(key)
+            _ClientsCache.clients[key] = client
+    return client
@@ -15,6 +15,7 @@ class DeadlineWebserviceError(Exception):
 
 class DeadlineModule(OpenPypeModule, IPluginPaths):
     name = "deadline"
+    settings_key = "deadline"
 
     def __init__(self, manager, settings):
         self.deadline_urls = {}
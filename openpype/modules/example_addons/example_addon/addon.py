@@ -53,6 +53,7 @@ class ExampleAddon(OpenPypeAddOn, IPluginPaths, ITrayAction):
     """
     label = "Example Addon"
     name = "example_addon"
+    settings_key = "example_addon"
 
     def initialize(self, settings):
         """Initialization of addon."""
@@ -25,6 +25,7 @@ class FtrackModule(
     ISettingsChangeListener
 ):
     name = "ftrack"
+    settings_key = "ftrack"
 
     def initialize(self, settings):
         ftrack_settings = settings[self.name]
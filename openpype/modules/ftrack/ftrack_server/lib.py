@@ -117,9 +117,22 @@ class ProcessEventHub(SocketBaseEventHub):
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Maximum number of events loaded from Mongo at once
+    events_batch_size = 500
+    # Maximum number of handled events waiting to be marked as processed
+    ack_batch_size = 100
+    # Merge consecutive update events of the same user
+    coalesce_update_events = True
+    # How often are old processed events removed (in seconds)
+    cleanup_interval = 300
+    # Processed events older than this are removed
+    keep_processed_days = 3
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self._processed_mongo_ids = []
+        self._last_cleanup = 0
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -147,8 +160,8 @@ class ProcessEventHub(SocketBaseEventHub):
 
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events are
+        set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
@@ -156,49 +169,89 @@ class ProcessEventHub(SocketBaseEventHub):
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
-                if not self.load_events():
+                try:
+                    # All handled events must be marked as processed before
+                    #   next load so they're not loaded again
+                    self._flush_processed()
+                    self._cleanup_processed()
+                    found = self.load_events()
+                except pymongo.errors.AutoReconnect:
+                    self._mongo_not_responding()
+
+                if not found:
                     time.sleep(0.5)
             else:
                 try:
                     self._handle(event)
 
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    mongo_ids = event["data"].get("_event_mongo_ids")
+                    if mongo_ids:
+                        self._processed_mongo_ids.extend(mongo_ids)
+                        if (
+                            len(self._processed_mongo_ids)
+                            >= self.ack_batch_size
+                        ):
+                            self._flush_processed()
 
                 except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
+                    self._mongo_not_responding()
                 # Additional special processing of events.
                 if event['topic'] == 'ftrack.meta.disconnected':
+                    self._flush_processed()
                     break
 
             if duration is not None:
                 if (time.time() - started) > duration:
+                    self._flush_processed()
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def _mongo_not_responding(self):
+        self.pypelog.error((
+            "Mongo server \"{}\" is not responding, exiting."
+        ).format(os.environ["OPENPYPE_MONGO"]))
+        sys.exit(0)
+
+    def _flush_processed(self):
+        """Mark handled events as processed in Mongo DB."""
+        if not self._processed_mongo_ids:
+            return
+
+        mongo_ids = self._processed_mongo_ids
+        self._processed_mongo_ids = []
+        self.dbcon.bulk_write(
+            [
+                pymongo.UpdateMany(
+                    {"_id": {"$in": mongo_ids}},
+                    {"$set": {"pype_data.is_processed": True}}
+                )
+            ],
+            ordered=False
+        )
+
+    def _cleanup_processed(self):
+        """Remove old processed events once in a 'cleanup_interval'."""
+        if time.time() - self._last_cleanup < self.cleanup_interval:
+            return
+        self._last_cleanup = time.time()
+
+        ago_date = datetime.datetime.now() - datetime.timedelta(
+            days=self.keep_processed_days
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
+    def load_events(self):
+        """Load not processed events sorted by stored date"""
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+        ).limit(self.events_batch_size)
 
-        found = False
+        events = []
+        invalid_mongo_ids = []
         for event_data in not_processed_events:
             new_event_data = {
                 k: v for k, v in event_data.items()
@@ -206,17 +259,116 @@ class ProcessEventHub(SocketBaseEventHub):
             }
             try:
                 event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
+                event["data"]["_event_mongo_ids"] = [event_data["_id"]]
             except Exception:
                 self.logger.exception(L(
                     'Failed to convert payload into event: {0}',
                     event_data
                 ))
+                # Skip the event next time
+                invalid_mongo_ids.append(event_data["_id"])
                 continue
-            found = True
+            events.append(event)
+
+        self._processed_mongo_ids.extend(invalid_mongo_ids)
+        if not events:
+            self._flush_processed()
+            return False
+
+        if self.coalesce_update_events:
+            loaded_count = len(events)
+            events = self.coalesce_events(events)
+            if len(events) != loaded_count:
+                self.pypelog.debug("Coalesced {} events to {}".format(
+                    loaded_count, len(events)
+                ))
+
+        for event in events:
             self._event_queue.put(event)
+        return True
+
+    @classmethod
+    def coalesce_events(cls, events):
+        """Merge consecutive 'ftrack.update' events of the same user.
+
+        Entities of merged events are combined to one event. Changes of the
+        same entity which was updated multiple times are merged so 'old'
+        value is from the first and 'new' value from the last change.
+        Other events are kept in the same order.
 
-        return found
+        Args:
+            events (list[ftrack_api.event.base.Event]): Events in order
+                in which they were stored.
+
+        Returns:
+            list[ftrack_api.event.base.Event]: Coalesced events.
+        """
+        output = []
+        current = None
+        current_key = None
+        for event in events:
+            key = cls._get_coalesce_key(event)
+            if key is None or key != current_key:
+                current = event
+                current_key = key
+                output.append(event)
+                continue
+
+            cls._merge_update_event(current, event)
+        return output
+
+    @staticmethod
+    def _get_coalesce_key(event):
+        if event["topic"] != "ftrack.update":
+            return None
+
+        data = event["data"]
+        entities = data.get("entities")
+        if not isinstance(entities, list):
+            return None
+
+        user_id = (data.get("user") or {}).get("userid")
+        source_user = (event.get("source") or {}).get("user") or {}
+        return (user_id, source_user.get("id"))
+
+    @staticmethod
+    def _merge_update_event(target_event, event):
+        target_data = target_event["data"]
+        target_entities = target_data["entities"]
+        entities_by_id = {
+            (ent_info.get("entityType"), ent_info.get("entityId")): ent_info
+            for ent_info in target_entities
+            if ent_info.get("action") == "update"
+        }
+        for ent_info in event["data"]["entities"]:
+            key = (ent_info.get("entityType"), ent_info.get("entityId"))
+            target_info = entities_by_id.get(key)
+            if ent_info.get("action") != "update" or target_info is None:
+                target_entities.append(ent_info)
+                if ent_info.get("action") == "update":
+                    entities_by_id[key] = ent_info
+                else:
+                    # Following updates must not be merged before this action
+                    entities_by_id.pop(key, None)
+                continue
+
+            changes = target_info.get("changes") or {}
+            for change_key, change in (ent_info.get("changes") or {}).items():
+                if change_key in changes:
+                    changes[change_key]["new"] = change.get("new")
+                else:
+                    changes[change_key] = change
+            target_info["changes"] = changes
+
+            keys = list(target_info.get("keys") or [])
+            for change_key in ent_info.get("keys") or []:
+                if change_key not in keys:
+                    keys.append(change_key)
+            target_info["keys"] = keys
+
+        target_data["_event_mongo_ids"].extend(
+            event["data"]["_event_mongo_ids"]
+        )
 
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
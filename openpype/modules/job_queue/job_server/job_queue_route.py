@@ -14,7 +14,8 @@ class JobQueueResource:
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
             ("GET", "/jobs", self.get_jobs),
-            ("GET", "/jobs/{job_id}", self.get_job)
+            ("GET", "/jobs/{job_id}", self.get_job),
+            ("GET", "/metrics", self.get_metrics)
         )
 
         self.register()
@@ -54,6 +55,13 @@ class JobQueueResource:
             content_type="application/json"
         )
 
+    async def get_metrics(self, request):
+        return Response(
+            status=200,
+            body=self.encode(self._job_queue.get_metrics()),
+            content_type="application/json"
+        )
+
     @classmethod
     def encode(cls, data):
         return json.dumps(
@@ -1,15 +1,36 @@
+import os
+import json
+import logging
 import datetime
+import tempfile
 import collections
 from uuid import uuid4
 
+log = logging.getLogger(__name__)
+
+
+def _datetime_to_str(value):
+    if value is None:
+        return None
+    return value.isoformat()
+
+
+def _str_to_datetime(value):
+    if value is None:
+        return None
+    return datetime.datetime.fromisoformat(value)
+
 
 class Job:
     """Job related to specific host name.
 
-    Data must contain everything needed to finish the job.
+    Data must contain everything needed to finish the job. Optional keys
+    'priority', 'user' and 'project_name' in data are used for scheduling.
+    Jobs with higher priority are assigned first.
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
+    default_priority = 50
 
     def __init__(self, host_name, data, job_id=None, created_time=None):
         if job_id is None:
@@ -24,6 +45,13 @@ class Job:
         self.data = data
         self._result_data = None
 
+        priority = data.get("priority")
+        if priority is None:
+            priority = self.default_priority
+        self.priority = int(priority)
+        self.user = data.get("user")
+        self.project_name = data.get("project_name")
+
         self._started = False
         self._done = False
         self._errored = False
@@ -48,6 +76,32 @@ class Job:
     def done(self):
         return self._done
 
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def started_time(self):
+        return self._started_time
+
+    @property
+    def done_time(self):
+        return self._done_time
+
+    @property
+    def wait_time(self):
+        """Seconds the job waited in queue before it was started."""
+        if self._started_time is None:
+            return None
+        return (self._started_time - self._created_time).total_seconds()
+
+    @property
+    def run_time(self):
+        """Seconds from start of the job until it was done."""
+        if self._started_time is None or self._done_time is None:
+            return None
+        return (self._done_time - self._started_time).total_seconds()
+
     def reset(self):
         self._started = False
         self._started_time = None
@@ -118,26 +172,154 @@ class Job:
         output["result"] = self._result_data
 
         output["state"] = state
+        output["priority"] = self.priority
 
         return output
 
+    def to_data(self):
+        """Job data which can be stored to json and used in 'from_data'."""
+        return {
+            "id": self.id,
+            "host_name": self.host_name,
+            "data": self.data,
+            "created_time": _datetime_to_str(self._created_time),
+            "started_time": _datetime_to_str(self._started_time),
+            "done_time": _datetime_to_str(self._done_time),
+            "done": self._done,
+            "errored": self._errored,
+            "message": self._message,
+            "result": self._result_data,
+        }
+
+    @classmethod
+    def from_data(cls, job_data):
+        """Recreate job from data created with 'to_data'.
+
+        Job which was started but not done is reset so it can be assigned
+        to a worker again.
+        """
+        job = cls(
+            job_data["host_name"],
+            job_data["data"],
+            job_data["id"],
+            _str_to_datetime(job_data["created_time"])
+        )
+        if job_data["done"]:
+            job._started = job_data["started_time"] is not None
+            job._started_time = _str_to_datetime(job_data["started_time"])
+            job._done = True
+            job._done_time = _str_to_datetime(job_data["done_time"])
+            job._errored = job_data["errored"]
+            job._message = job_data["message"]
+            job._result_data = job_data["result"]
+        return job
+
+
+class JobStore:
+    """Store of jobs in json file so they survive restart of server.
+
+    Args:
+        filepath (str): Path to json file where jobs are stored.
+    """
+
+    def __init__(self, filepath):
+        self._filepath = filepath
+
+    @property
+    def filepath(self):
+        return self._filepath
+
+    def load(self):
+        """Load stored jobs.
+
+        Returns:
+            list[Job]: Stored jobs.
+        """
+        if not os.path.exists(self._filepath):
+            return []
+
+        try:
+            with open(self._filepath, "r") as stream:
+                jobs_data = json.load(stream)
+        except (OSError, ValueError):
+            log.warning(
+                "Failed to load jobs from \"{}\"".format(self._filepath),
+                exc_info=True
+            )
+            return []
+
+        return [Job.from_data(job_data) for job_data in jobs_data]
+
+    def save(self, jobs):
+        """Store jobs to file.
+
+        Args:
+            Iterable[Job]: Jobs to store.
+        """
+        dirpath = os.path.dirname(self._filepath)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        jobs_data = [job.to_data() for job in jobs]
+        # Write to temp file first so the file is not corrupted if server
+        #   is killed during writing
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".tmp_", suffix=".json", dir=dirpath or None
+        )
+        try:
+            with os.fdopen(fd, "w") as stream:
+                json.dump(jobs_data, stream)
+            os.replace(tmp_path, self._filepath)
+
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
 
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Waiting job with highest priority is
+    assigned first. Jobs with the same priority are shared fairly between
+    users and projects - job of user (and project) with the lowest usage
+    divided by it's weight is assigned first. Usage is count of running jobs
+    and jobs started in last 'fair_share_window_minutes'.
+
+    Args:
+        store (Optional[JobStore]): Store where jobs are persisted.
+        user_weights (Optional[dict[str, float]]): Fair-share weights
+            of users. Users without weight have weight '1'.
+        project_weights (Optional[dict[str, float]]): Fair-share weights
+            of projects. Projects without weight have weight '1'.
     """
     old_jobs_check_minutes_interval = 30
-
-    def __init__(self):
-        self._last_old_jobs_check = datetime.datetime.now()
+    fair_share_window_minutes = 60
+    # Jobs are not errored because of missing workers right after start
+    #   of server so workers have time to connect
+    missing_workers_grace_seconds = 60
+    # How long are done jobs counted in throughput
+    throughput_window_minutes = 60
+
+    def __init__(self, store=None, user_weights=None, project_weights=None):
+        now = datetime.datetime.now()
+        self._started_time = now
+        self._last_old_jobs_check = now
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        self._job_queue_by_host_name = collections.defaultdict(list)
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
 
+        self._store = store
+        self._store_changed = False
+        self._user_weights = user_weights or {}
+        self._project_weights = project_weights or {}
+        # Started jobs by id used for fair-share usage
+        self._started_jobs = collections.OrderedDict()
+
+        if store is not None:
+            self._load_jobs()
+
     def workers(self):
         """All currently registered workers."""
         return self._workers_by_id.values()
@@ -159,7 +341,8 @@ class JobQueue:
             job.set_worker(None)
             job.reset()
             # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            self._job_queue_by_host_name[job.host_name].append(job)
+            self._store_changed = True
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -179,24 +362,30 @@ class JobQueue:
             host_name = worker.host_name
             available_host_names.add(host_name)
             if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
-                        break
-
+                job = self._pop_next_job(host_name)
+                if job is not None:
+                    worker.set_current_job(job)
+                    job.set_started()
+                    self._started_jobs.pop(job.id, None)
+                    self._started_jobs[job.id] = job
+                    self._store_changed = True
+
+        in_grace_period = (
+            (datetime.datetime.now() - self._started_time).total_seconds()
+            < self.missing_workers_grace_seconds
+        )
         for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+            if in_grace_period or host_name in available_host_names:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
+            jobs = self._job_queue_by_host_name.pop(host_name)
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
+            for job in jobs:
                 if not job.deleted:
                     job.set_done(False, message)
+                    self._store_changed = True
         self._remove_old_jobs()
+        self.save_jobs()
 
     def get_jobs(self):
         return self._jobs_by_id.values()
@@ -210,18 +399,191 @@ class JobQueue:
         job = Job(host_name, job_data)
         self._jobs_by_id[job.id] = job
         self._job_queue_by_host_name[host_name].append(job)
+        self._store_changed = True
+        self.save_jobs()
         return job
 
+    def finish_job(self, job_id, success=True, message=None, data=None):
+        """Mark job as done.
+
+        Returns:
+            Union[Job, None]: Finished job or 'None' if job was not found.
+        """
+        job = self._jobs_by_id.get(job_id)
+        if job is not None:
+            job.set_done(success, message, data)
+            self._store_changed = True
+            self.save_jobs()
+        return job
+
+    def _pop_next_job(self, host_name):
+        """Pop job which should be assigned next for a host."""
+        jobs = self._job_queue_by_host_name.get(host_name)
+        if not jobs:
+            return None
+
+        # Remove deleted jobs
+        jobs[:] = [job for job in jobs if not job.deleted]
+        if not jobs:
+            return None
+
+        user_usage, project_usage = self._get_usage()
+        job = min(
+            jobs,
+            key=lambda item: (
+                -item.priority,
+                self._get_share(
+                    user_usage, self._user_weights, item.user
+                ),
+                self._get_share(
+                    project_usage, self._project_weights, item.project_name
+                ),
+                item.created_time
+            )
+        )
+        jobs.remove(job)
+        return job
+
+    @staticmethod
+    def _get_share(usage, weights, key):
+        weight = weights.get(key)
+        if weight is None:
+            weight = 1
+        # Zero weight means the lowest possible share
+        weight = max(weight, 0.001)
+        return usage[key] / weight
+
+    def _get_usage(self):
+        """Usage of users and projects for fair-share.
+
+        Returns:
+            tuple[Counter, Counter]: Usage of users and projects.
+        """
+        user_usage = collections.Counter()
+        project_usage = collections.Counter()
+        window_start = datetime.datetime.now() - datetime.timedelta(
+            minutes=self.fair_share_window_minutes
+        )
+        for job_id in tuple(self._started_jobs.keys()):
+            job = self._started_jobs[job_id]
+            # Job was deleted or reset after worker was removed
+            if job.deleted or not job.started:
+                self._started_jobs.pop(job_id)
+                continue
+
+            if job.done and job.started_time < window_start:
+                self._started_jobs.pop(job_id)
+                continue
+
+            user_usage[job.user] += 1
+            project_usage[job.project_name] += 1
+        return user_usage, project_usage
+
+    def get_metrics(self):
+        """Metrics of queue per host name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Count of waiting, running and done
+                jobs, average wait time and run time in seconds and count
+                of done jobs per hour by host name.
+        """
+        now = datetime.datetime.now()
+        throughput_start = now - datetime.timedelta(
+            minutes=self.throughput_window_minutes
+        )
+        metrics = collections.defaultdict(lambda: {
+            "workers": 0,
+            "waiting": 0,
+            "running": 0,
+            "done": 0,
+            "avg_wait_time": None,
+            "avg_run_time": None,
+            "throughput_per_hour": 0,
+        })
+        wait_times = collections.defaultdict(list)
+        run_times = collections.defaultdict(list)
+        recently_done = collections.Counter()
+        for host_name, workers in self._workers_by_host_name.items():
+            if workers:
+                metrics[host_name]["workers"] = len(workers)
+
+        for job in self._jobs_by_id.values():
+            host_metrics = metrics[job.host_name]
+            if job.done:
+                host_metrics["done"] += 1
+                if job.done_time >= throughput_start:
+                    recently_done[job.host_name] += 1
+            elif job.started:
+                host_metrics["running"] += 1
+            else:
+                host_metrics["waiting"] += 1
+
+            if job.wait_time is not None:
+                wait_times[job.host_name].append(job.wait_time)
+            if job.run_time is not None:
+                run_times[job.host_name].append(job.run_time)
+
+        window_hours = self.throughput_window_minutes / 60.0
+        for host_name, host_metrics in metrics.items():
+            host_wait_times = wait_times[host_name]
+            if host_wait_times:
+                host_metrics["avg_wait_time"] = (
+                    sum(host_wait_times) / len(host_wait_times)
+                )
+            host_run_times = run_times[host_name]
+            if host_run_times:
+                host_metrics["avg_run_time"] = (
+                    sum(host_run_times) / len(host_run_times)
+                )
+            host_metrics["throughput_per_hour"] = (
+                recently_done[host_name] / window_hours
+            )
+        return dict(metrics)
+
+    def _load_jobs(self):
+        jobs = self._store.load()
+        for job in jobs:
+            self._jobs_by_id[job.id] = job
+            if not job.done:
+                self._job_queue_by_host_name[job.host_name].append(job)
+
+        for host_jobs in self._job_queue_by_host_name.values():
+            host_jobs.sort(key=lambda item: item.created_time)
+
+        if self._jobs_by_id:
+            print("Loaded {} jobs from \"{}\"".format(
+                len(self._jobs_by_id), self._store.filepath
+            ))
+
+    def save_jobs(self):
+        """Store jobs if store is set and jobs changed since last save."""
+        if self._store is None or not self._store_changed:
+            return
+
+        try:
+            self._store.save(
+                job
+                for job in self._jobs_by_id.values()
+                if not job.deleted
+            )
+            self._store_changed = False
+
+        except Exception:
+            log.warning("Failed to store jobs", exc_info=True)
+
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
-        delta = datetime.datetime.now() - self._last_old_jobs_check
-        if delta.seconds < self.old_jobs_check_minutes_interval:
+        now = datetime.datetime.now()
+        delta = now - self._last_old_jobs_check
+        if delta.total_seconds() < self.old_jobs_check_minutes_interval * 60:
             return
+        self._last_old_jobs_check = now
 
         for job_id in tuple(self._jobs_by_id.keys()):
             job = self._jobs_by_id[job_id]
             if not job.keep_in_memory():
                 self._jobs_by_id.pop(job_id)
+                self._store_changed = True
 
     def remove_job(self, job_id):
         """Delete job and eventually stop it."""
@@ -231,6 +593,8 @@ class JobQueue:
 
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        self._store_changed = True
+        self.save_jobs()
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
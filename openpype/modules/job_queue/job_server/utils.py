@@ -4,6 +4,7 @@ import time
 import socket
 
 from .server import WebServerManager
+from .jobs import JobQueue, JobStore
 
 
 class SharedObjects:
@@ -14,7 +15,13 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def main(
+    port=None,
+    host=None,
+    jobs_store_path=None,
+    user_weights=None,
+    project_weights=None
+):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -34,8 +41,14 @@ def main(port=None, host=None):
         ).format(host, port))
         return 1
 
+    store = None
+    if jobs_store_path:
+        print("Jobs are stored to \"{}\"".format(jobs_store_path))
+        store = JobStore(jobs_store_path)
+    job_queue = JobQueue(store, user_weights, project_weights)
+
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    manager = WebServerManager(port, host, job_queue=job_queue)
     manager.start_server()
 
     stopped = False
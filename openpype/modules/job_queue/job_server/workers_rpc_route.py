@@ -53,9 +53,7 @@ class WorkerRpc(JsonRpc):
         if worker is not None:
             worker.set_current_job(None)
 
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.finish_job(job_id, success, message, data)
         return True
 
     async def send_jobs(self):
@@ -27,6 +27,14 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- jobs are stored to local file so they're not lost on restart of server
+    (can be disabled in settings or path can be changed with '--jobs_store')
+
+## Scheduling
+Waiting job with the highest priority (key 'priority' in job data, default
+50) is assigned first. Jobs with the same priority are shared between users
+and projects (keys 'user' and 'project_name' in job data) by their weights
+defined in settings.
 
 ### start_worker
 - start worker which will process jobs
@@ -36,6 +44,7 @@ workstations know where to send or receive jobs.
     passed (this is added mainly for developing purposes)
 """
 
+import os
 import sys
 import json
 import copy
@@ -138,6 +147,24 @@ class JobQueueModule(OpenPypeModule):
         return self._server_url
 
     def send_job(self, host_name, job_data):
+        """Send job to job queue server.
+
+        Optional keys in job data are used for scheduling of jobs:
+            'priority' (int): Jobs with higher priority are assigned first.
+                Default is 50.
+            'user' (str): User who sent the job.
+            'project_name' (str): Project of the job.
+        Jobs of users and projects with lowest usage are assigned first
+        among jobs with the same priority.
+
+        Args:
+            host_name (str): Name of host which should process the job.
+            job_data (dict[str, Any]): Data of job.
+
+        Returns:
+            str: Job id.
+        """
+
         import requests
 
         job_data = job_data or {}
@@ -165,10 +192,30 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def get_default_jobs_store_path(cls, port=None):
+        import appdirs
+
+        return os.path.join(
+            appdirs.user_data_dir("openpype", "pypeclub"),
+            "job_queue",
+            "jobs_{}.json".format(port or 8079)
+        )
+
+    @classmethod
+    def start_server(cls, port=None, host=None, jobs_store_path=None):
         from .job_server import main
 
-        return main(port, host)
+        module_settings = get_system_settings()["modules"].get(cls.name, {})
+        if not jobs_store_path and module_settings.get("persist_jobs", True):
+            jobs_store_path = cls.get_default_jobs_store_path(port)
+
+        return main(
+            port,
+            host,
+            jobs_store_path,
+            module_settings.get("user_weights"),
+            module_settings.get("project_weights")
+        )
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -227,8 +274,9 @@ def cli_main():
 )
 @click.option("--port", help="Server port")
 @click.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click.option("--jobs_store", help="Path to json file where jobs are stored.")
+def cli_start_server(port, host, jobs_store):
+    JobQueueModule.start_server(port, host, jobs_store)
 
 
 @cli_main.command(
@@ -15,6 +15,7 @@ class KitsuModule(OpenPypeModule, IPluginPaths, ITrayAction):
 
     label = "Kitsu Connect"
     name = "kitsu"
+    settings_key = "kitsu"
 
     def initialize(self, settings):
         """Initialization of module."""
@@ -4,6 +4,7 @@ from openpype.modules import OpenPypeModule, ITrayModule
 
 class LogViewModule(OpenPypeModule, ITrayModule):
     name = "log_viewer"
+    settings_key = "log_viewer"
 
     def initialize(self, modules_settings):
         logging_settings = modules_settings[self.name]
@@ -18,6 +18,7 @@ class MusterModule(OpenPypeModule, ITrayModule):
     cred_filename = 'muster_cred.json'
 
     name = "muster"
+    settings_key = "muster"
 
     def initialize(self, modules_settings):
         muster_settings = modules_settings[self.name]
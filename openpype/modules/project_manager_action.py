@@ -5,6 +5,7 @@ from openpype.modules import OpenPypeModule, ITrayAction
 class ProjectManagerAction(OpenPypeModule, ITrayAction):
     label = "Project Manager (beta)"
     name = "project_manager"
+    settings_key = "project_manager"
     admin_action = True
 
     def initialize(self, modules_settings):
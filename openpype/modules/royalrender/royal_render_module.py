@@ -8,6 +8,7 @@ from openpype.modules import OpenPypeModule, IPluginPaths
 class RoyalRenderModule(OpenPypeModule, IPluginPaths):
     """Class providing basic Royal Render implementation logic."""
     name = "royalrender"
+    settings_key = "royalrender"
 
     @property
     def api(self):
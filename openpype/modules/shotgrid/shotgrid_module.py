@@ -12,6 +12,7 @@ SHOTGRID_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 class ShotgridModule(OpenPypeModule, ITrayModule, IPluginPaths):
     leecher_manager_url = None
     name = "shotgrid"
+    settings_key = "shotgrid"
     enabled = False
     project_id = None
     tray_wrapper = None
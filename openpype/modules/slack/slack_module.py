@@ -8,6 +8,7 @@ class SlackIntegrationModule(OpenPypeModule, IPluginPaths):
     """Allows sending notification to Slack channels during publishing."""
 
     name = "slack"
+    settings_key = "slack"
 
     def initialize(self, modules_settings):
         slack_settings = modules_settings[self.name]
@@ -1,4 +1,9 @@
+import os
 import abc
+import time
+import threading
+import concurrent.futures
+
 import six
 from openpype.lib import Logger
 
@@ -10,6 +15,14 @@ class AbstractProvider:
     CODE = ''
     LABEL = ''
 
+    # Chunked transfers - used by providers implementing chunk methods
+    #   ('read_chunk', 'write_chunk', 'get_file_size', 'allocate_file')
+    CHUNK_SIZE = 8 * 1024 * 1024
+    # Files smaller than this are transferred in one piece
+    CHUNKED_TRANSFER_MIN_SIZE = 64 * 1024 * 1024
+    # Number of chunks transferred in parallel
+    CHUNK_WORKERS = 4
+
     _log = None
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
@@ -215,3 +228,291 @@ class AbstractProvider:
             raise ValueError(msg)
 
         return path
+
+    def supports_chunked_transfer(self):
+        """Provider implements methods for chunked transfers.
+
+        Returns:
+            (boolean)
+        """
+        return False
+
+    def read_chunk(self, path, offset, size):
+        """
+            Read chunk of file on provider.
+
+        Args:
+            path (string): absolute path on provider
+            offset (int): position in file
+            size (int): maximum number of bytes to read
+        Returns:
+            (bytes)
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def write_chunk(self, path, offset, data):
+        """
+            Write chunk to already allocated file on provider.
+
+        Args:
+            path (string): absolute path on provider
+            offset (int): position in file
+            data (bytes): content of chunk
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def get_file_size(self, path):
+        """
+            Size of file on provider.
+
+        Args:
+            path (string): absolute path on provider
+        Returns:
+            (int) size of file or None if file doesn't exist
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def allocate_file(self, path, size):
+        """
+            Make sure file on provider exists and has 'size'.
+
+            Content of existing file is kept so interrupted transfer can
+            be resumed.
+
+        Args:
+            path (string): absolute path on provider
+            size (int): expected size of file
+        Returns:
+            (boolean) True if file was created or resized, content of such
+                file can't be used to resume transfer
+        """
+        raise NotImplementedError(
+            "{} does not support chunked transfers".format(self.CODE))
+
+    def upload_file_chunked(self, source_path, target_path,
+                            server, project_name, file, representation, site):
+        """
+            Upload local file to provider in chunks.
+
+            Chunks are transferred in parallel and transfer continues from
+            resume offset stored in 'site' record of the file.
+
+        Args:
+            source_path (string): local path
+            target_path (string): absolute path on provider
+            server (SyncServer): server instance to call update_db on
+            project_name (str): name of project_name
+            file (dict): info about uploaded file (matches structure from db)
+            representation (dict): complete repre containing 'file'
+            site (str): site name
+        Returns:
+            (string) file_id of created/modified file
+        """
+        size = os.path.getsize(source_path)
+        allocated = self.allocate_file(target_path, size)
+        self._transfer_chunked(
+            size,
+            lambda offset, chunk_size: _read_local_chunk(
+                source_path, offset, chunk_size),
+            lambda offset, data: self.write_chunk(target_path, offset, data),
+            lambda offset, chunk_size: self.read_chunk(
+                target_path, offset, chunk_size),
+            allocated,
+            server, project_name, file, representation, site
+        )
+        return os.path.basename(target_path)
+
+    def download_file_chunked(self, source_path, local_path,
+                              server, project_name, file, representation,
+                              site):
+        """
+            Download file from provider in chunks.
+
+            Chunks are transferred in parallel and transfer continues from
+            resume offset stored in 'site' record of the file.
+
+        Args:
+            source_path (string): absolute path on provider
+            local_path (string): local path
+            server (SyncServer): server instance to call update_db on
+            project_name (str): name of project_name
+            file (dict): info about uploaded file (matches structure from db)
+            representation (dict): complete repre containing 'file'
+            site (str): site name
+        Returns:
+            (string) file_id of created/modified file
+        """
+        size = self.get_file_size(source_path)
+        if size is None:
+            raise FileNotFoundError("Source file {} doesn't exist."
+                                    .format(source_path))
+        allocated = _allocate_local_file(local_path, size)
+        self._transfer_chunked(
+            size,
+            lambda offset, chunk_size: self.read_chunk(
+                source_path, offset, chunk_size),
+            lambda offset, data: _write_local_chunk(local_path, offset, data),
+            lambda offset, chunk_size: _read_local_chunk(
+                local_path, offset, chunk_size),
+            allocated,
+            server, project_name, file, representation, site
+        )
+        return os.path.basename(local_path)
+
+    def _transfer_chunked(self, size, read_chunk, write_chunk,
+                          read_target_chunk, allocated,
+                          server, project_name, file, representation, site):
+        """
+            Transfer chunks in parallel and store progress and resume offset.
+
+            Resume offset is end of contiguous block of transferred chunks
+            from start of file. It is stored in DB together with progress
+            so next attempt can skip already transferred part.
+
+            Resume offset is not used if target file was created or resized
+            by 'allocate_file'. Chunks before resume offset are verified
+            against source after transfer and copied again if they differ.
+        """
+        chunk_size = self.CHUNK_SIZE
+        resume_offset = 0
+        if file and not allocated:
+            _, site_rec = server._get_site_rec(file.get("sites") or [], site)
+            if site_rec:
+                resume_offset = site_rec.get("resume_offset") or 0
+        # Resume only on chunk boundary
+        resume_offset -= resume_offset % chunk_size
+        if resume_offset >= size:
+            resume_offset = 0
+
+        if resume_offset:
+            self.log.debug("Resuming transfer from {} bytes".format(
+                resume_offset))
+
+        thread_ids = set()
+
+        def copy_chunk(offset):
+            thread_ids.add(threading.current_thread().ident)
+            data = read_chunk(offset, min(chunk_size, size - offset))
+            write_chunk(offset, data)
+            return offset
+
+        def verify_chunk(offset):
+            thread_ids.add(threading.current_thread().ident)
+            length = min(chunk_size, size - offset)
+            data = read_chunk(offset, length)
+            if read_target_chunk(offset, length) != data:
+                write_chunk(offset, data)
+                return offset
+            return None
+
+        lock = threading.Lock()
+        state = {
+            "done": set(),
+            "offset": resume_offset,
+            "last_tick": None
+        }
+
+        def store_progress(force=False):
+            with lock:
+                offset = min(state["offset"], size)
+                last_tick = state["last_tick"]
+                if (
+                    not force
+                    and last_tick is not None
+                    and time.time() - last_tick < server.LOG_PROGRESS_SEC
+                ):
+                    return
+                state["last_tick"] = time.time()
+
+            server.update_db(project_name=project_name,
+                             new_file_id=None,
+                             file=file,
+                             representation=representation,
+                             site=site,
+                             progress=float(offset) / size if size else 0.0,
+                             resume_offset=offset
+                             )
+
+        offsets = list(range(resume_offset, size, chunk_size))
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.CHUNK_WORKERS
+        )
+        futures = [executor.submit(copy_chunk, offset) for offset in offsets]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                offset = future.result()
+                with lock:
+                    state["done"].add(offset)
+                    while state["offset"] in state["done"]:
+                        state["offset"] += chunk_size
+                store_progress()
+
+            # Part transferred by previous attempt might not be valid
+            futures = [
+                executor.submit(verify_chunk, offset)
+                for offset in range(0, resume_offset, chunk_size)
+            ]
+            invalid_offsets = [
+                offset
+                for offset in (
+                    future.result()
+                    for future in concurrent.futures.as_completed(futures)
+                )
+                if offset is not None
+            ]
+            if invalid_offsets:
+                self.log.warning((
+                    "{} chunks transferred by previous attempt were not"
+                    " valid and were copied again."
+                ).format(len(invalid_offsets)))
+
+        except Exception:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self._close_chunk_threads(thread_ids)
+            store_progress(force=True)
+            raise
+
+        executor.shutdown(wait=True)
+        self._close_chunk_threads(thread_ids)
+
+    def _close_chunk_threads(self, thread_ids):
+        """
+            Release resources of threads which transferred chunks.
+
+            Threads are not used anymore after transfer ended.
+
+        Args:
+            thread_ids (set[int]): identifiers of finished threads
+        """
+        pass
+
+
+def _read_local_chunk(path, offset, size):
+    with open(path, "rb") as stream:
+        stream.seek(offset)
+        return stream.read(size)
+
+
+def _write_local_chunk(path, offset, data):
+    with open(path, "r+b") as stream:
+        stream.seek(offset)
+        stream.write(data)
+
+
+def _allocate_local_file(path, size):
+    allocated = False
+    if not os.path.exists(path):
+        with open(path, "wb"):
+            pass
+        allocated = True
+
+    if os.path.getsize(path) != size:
+        with open(path, "r+b") as stream:
+            stream.truncate(size)
+        allocated = True
+    return allocated
@@ -7,7 +7,12 @@ import time
 from openpype.lib import Logger
 from openpype.lib.local_settings import get_local_site_id
 from openpype.pipeline import Anatomy
-from .abstract_provider import AbstractProvider
+from .abstract_provider import (
+    AbstractProvider,
+    _read_local_chunk,
+    _write_local_chunk,
+    _allocate_local_file,
+)
 
 log = Logger.get_logger("SyncServer")
 
@@ -93,6 +98,13 @@ class LocalDriveHandler(AbstractProvider):
                                     .format(source_path))
 
         if overwrite:
+            if os.path.getsize(source_path) >= self.CHUNKED_TRANSFER_MIN_SIZE:
+                # both sides are local, upload handles download too
+                return self.upload_file_chunked(
+                    source_path, target_path, server, project_name, file,
+                    representation, site
+                )
+
             thread = threading.Thread(target=self._copy,
                                       args=(source_path, target_path))
             thread.start()
@@ -151,6 +163,23 @@ class LocalDriveHandler(AbstractProvider):
         os.makedirs(folder_path, exist_ok=True)
         return folder_path
 
+    def supports_chunked_transfer(self):
+        return True
+
+    def read_chunk(self, path, offset, size):
+        return _read_local_chunk(path, offset, size)
+
+    def write_chunk(self, path, offset, data):
+        _write_local_chunk(path, offset, data)
+
+    def get_file_size(self, path):
+        if not os.path.isfile(path):
+            return None
+        return os.path.getsize(path)
+
+    def allocate_file(self, path, size):
+        return _allocate_local_file(path, size)
+
     def get_roots_config(self, anatomy=None):
         """
             Returns root values for path resolving
@@ -40,6 +40,8 @@ class SFTPHandler(AbstractProvider):
         self.site_name = site_name
         self.root = None
         self._conn = None
+        self._thread_conns = {}
+        self._thread_conns_lock = threading.Lock()
 
         self.presets = presets
         if not self.presets:
@@ -254,6 +256,12 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
+        if os.path.getsize(source_path) >= self.CHUNKED_TRANSFER_MIN_SIZE:
+            return self.upload_file_chunked(
+                source_path, target_path, server, project_name, file,
+                representation, site
+            )
+
         thread = threading.Thread(target=self._upload,
                                   args=(source_path, target_path))
         thread.start()
@@ -300,6 +308,16 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
+        source_size = self.get_file_size(source_path)
+        if (
+            source_size is not None
+            and source_size >= self.CHUNKED_TRANSFER_MIN_SIZE
+        ):
+            return self.download_file_chunked(
+                source_path, target_path, server, project_name, file,
+                representation, site
+            )
+
         thread = threading.Thread(target=self._download,
                                   args=(source_path, target_path))
         thread.start()
@@ -313,6 +331,65 @@ class SFTPHandler(AbstractProvider):
         conn = self._get_conn()
         conn.get(source_path, target_path)
 
+    def supports_chunked_transfer(self):
+        return True
+
+    def read_chunk(self, path, offset, size):
+        with self._get_thread_conn().open(path, "rb") as stream:
+            stream.seek(offset)
+            return stream.read(size)
+
+    def write_chunk(self, path, offset, data):
+        with self._get_thread_conn().open(path, "r+b") as stream:
+            stream.seek(offset)
+            stream.write(data)
+
+    def get_file_size(self, path):
+        if not self.file_path_exists(path):
+            return None
+        return self.conn.stat(path).st_size
+
+    def allocate_file(self, path, size):
+        allocated = False
+        if not self.file_path_exists(path):
+            with self.conn.open(path, "wb"):
+                pass
+            allocated = True
+
+        if self.conn.stat(path).st_size != size:
+            self.conn.truncate(path, size)
+            allocated = True
+        return allocated
+
+    def _get_thread_conn(self):
+        """Connection for current thread.
+
+        Connection can't be shared by threads transferring chunks in
+        parallel.
+        """
+        thread_id = threading.current_thread().ident
+        with self._thread_conns_lock:
+            conn = self._thread_conns.get(thread_id)
+        if conn is None:
+            conn = self._get_conn()
+            with self._thread_conns_lock:
+                self._thread_conns[thread_id] = conn
+        return conn
+
+    def _close_chunk_threads(self, thread_ids):
+        """Close connections of threads which transferred chunks."""
+        with self._thread_conns_lock:
+            conns = [
+                self._thread_conns.pop(thread_id)
+                for thread_id in thread_ids
+                if thread_id in self._thread_conns
+            ]
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                log.debug("Failed to close connection", exc_info=True)
+
     def delete_file(self, path):
         """
             Deletes file from 'path'. Expects path to specific file.
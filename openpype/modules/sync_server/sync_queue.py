@@ -0,0 +1,201 @@
+"""Incremental queue of representations which should be synchronized.
+
+Full aggregation in 'SyncServerModule.get_sync_representations' goes through
+all representations of a project. The queue runs it only once in a while
+(reconciliation) and in between it only re-checks representations which
+are already pending or which were changed since last check.
+
+Changes are received from Mongo change streams. If change streams are not
+available (e.g. Mongo is not running as replica set) new representations
+are found by '_id' higher than last known '_id' and changes of other
+representations are picked up by next reconciliation.
+"""
+import time
+
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+
+
+class SyncRepresentationQueue(object):
+    """Pending representations of one project for pair of sites.
+
+    Args:
+        module (SyncServerModule): Sync server module.
+        project_name (str): Project name.
+        active_site (str): Name of active (local) site.
+        remote_site (str): Name of remote site.
+        reconcile_interval (Union[int, float]): Seconds between full
+            reconciliations.
+    """
+
+    def __init__(
+        self, module, project_name, active_site, remote_site,
+        reconcile_interval
+    ):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._module = module
+        self._project_name = project_name
+        self._active_site = active_site
+        self._remote_site = remote_site
+        self._reconcile_interval = reconcile_interval
+
+        # Pending representations by id
+        self._pending = {}
+        self._last_reconcile = None
+
+        self._change_stream = None
+        self._change_streams_supported = True
+        self._last_seen_id = None
+
+    @property
+    def collection(self):
+        return self._module.connection.database[self._project_name]
+
+    def is_for_sites(self, active_site, remote_site):
+        return (
+            self._active_site == active_site
+            and self._remote_site == remote_site
+        )
+
+    def request_reconcile(self):
+        """Full reconciliation will happen on next 'get_representations'."""
+        self._last_reconcile = None
+
+    def get_representations(self):
+        """Representations which should be synchronized.
+
+        Returns:
+            list[dict[str, Any]]: Representations in the same format and
+                order as returned by 'get_sync_representations'.
+        """
+        if (
+            self._last_reconcile is None
+            or time.time() - self._last_reconcile > self._reconcile_interval
+        ):
+            self._reconcile()
+        else:
+            self._update()
+
+        return sorted(
+            self._pending.values(),
+            key=lambda repre: (-repre["priority"], repre["_id"])
+        )
+
+    def close(self):
+        if self._change_stream is not None:
+            try:
+                self._change_stream.close()
+            except PyMongoError:
+                pass
+            self._change_stream = None
+
+    def _reconcile(self):
+        self.log.debug("Full reconciliation of sync queue for {}".format(
+            self._project_name))
+        # Open change stream before full query so no change is missed
+        #   in between
+        self._open_change_stream()
+        self._last_seen_id = self._get_last_representation_id()
+        self._pending = {
+            repre["_id"]: repre
+            for repre in self._module.get_sync_representations(
+                self._project_name, self._active_site, self._remote_site
+            )
+        }
+        self._last_reconcile = time.time()
+
+    def _update(self):
+        repre_ids = set(self._pending.keys())
+        changed_ids = self._get_changed_ids()
+        if changed_ids is None:
+            # Changes could not be received - do full reconciliation
+            self._reconcile()
+            return
+
+        repre_ids |= changed_ids
+        if not repre_ids:
+            return
+
+        # Changed representations may not match anymore (e.g. are already
+        #   synchronized) so they're removed and added back only if they're
+        #   returned from the query
+        for repre_id in repre_ids:
+            self._pending.pop(repre_id, None)
+
+        for repre in self._module.get_sync_representations(
+            self._project_name,
+            self._active_site,
+            self._remote_site,
+            representation_ids=list(repre_ids)
+        ):
+            self._pending[repre["_id"]] = repre
+
+    def _open_change_stream(self):
+        self.close()
+        if not self._change_streams_supported:
+            return
+
+        try:
+            self._change_stream = self.collection.watch(
+                [{"$match": {
+                    "operationType": {"$in": ["insert", "update", "replace"]}
+                }}],
+                max_await_time_ms=1
+            )
+        except PyMongoError:
+            self.log.info((
+                "Change streams are not available. Using polling"
+                " of new representations for {}."
+            ).format(self._project_name), exc_info=True)
+            self._change_streams_supported = False
+            self._change_stream = None
+
+    def _get_changed_ids(self):
+        """Ids of documents changed since last call.
+
+        Returns:
+            Union[set, None]: Changed ids or 'None' if changes could not
+                be received.
+        """
+        if self._change_stream is None:
+            return self._get_new_representation_ids()
+
+        changed_ids = set()
+        try:
+            while True:
+                change = self._change_stream.try_next()
+                if change is None:
+                    break
+                changed_ids.add(change["documentKey"]["_id"])
+
+        except PyMongoError:
+            self.log.warning(
+                "Change stream of {} failed.".format(self._project_name),
+                exc_info=True
+            )
+            self.close()
+            return None
+        return changed_ids
+
+    def _get_last_representation_id(self):
+        for repre in (
+            self.collection
+            .find({"type": "representation"}, {"_id": True})
+            .sort("_id", -1)
+            .limit(1)
+        ):
+            return repre["_id"]
+        return None
+
+    def _get_new_representation_ids(self):
+        query = {"type": "representation"}
+        if self._last_seen_id is not None:
+            query["_id"] = {"$gt": self._last_seen_id}
+
+        new_ids = set()
+        for repre in self.collection.find(query, {"_id": True}):
+            new_ids.add(repre["_id"])
+            if self._last_seen_id is None or repre["_id"] > self._last_seen_id:
+                self._last_seen_id = repre["_id"]
+        return new_ids
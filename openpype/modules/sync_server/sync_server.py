@@ -14,6 +14,7 @@ from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
 from .utils import SyncStatus, ResumableError
+from .sync_queue import SyncRepresentationQueue
 
 
 async def upload(module, project_name, file, representation, provider_name,
@@ -289,16 +290,43 @@ class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
+
+        All enabled projects are processed concurrently in each loop.
+        Transfers are limited per remote site by semaphores so one slow
+        project or provider doesn't block the others.
+
+        Projects with 'incremental_sync' enabled use queue of pending
+        representations which is updated from changes in database, full
+        query of representations happens only once per loop delay. Loops
+        of these projects run every 'incremental_poll_delay' seconds, other
+        projects run after their own loop delay.
     """
-    def __init__(self, module):
+    # Workers of executor used for blocking calls (queries and transfers)
+    default_max_workers = 10
+    # Concurrent transfers per remote site if not set in project settings
+    default_site_workers = 3
+    # Seconds between syncs of projects using incremental sync
+    incremental_poll_delay = 5
+
+    def __init__(self, module, max_workers=None):
         self.log = Logger.get_logger(self.__class__.__name__)
 
         super(SyncServerThread, self).__init__()
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        if not max_workers:
+            max_workers = self.default_max_workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        )
         self.timer = None
+        self._site_semaphores = {}
+        self._queues = {}
+        self._last_full_loop = None
+        self._full_loop_delay = 0
+        # Time when should be project synchronized next time
+        self._next_project_runs = {}
 
     def run(self):
         self.is_running = True
@@ -327,7 +355,7 @@ class SyncServerThread(threading.Thread):
                 - gets list of active remote providers (has configuration,
                     credentials)
                 - for each project_name it looks for representations that
-                  should be synced
+                  should be synced (all projects concurrently)
                 - synchronize found collections
                 - update representations - fills error messages for exceptions
                 - waits X seconds and repeat
@@ -338,123 +366,42 @@ class SyncServerThread(threading.Thread):
             try:
                 import time
                 start_time = time.time()
-                self.module.set_sync_project_settings()  # clean cache
-                project_name = None
-                enabled_projects = self.module.get_enabled_projects()
-                for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
-
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
-
-                duration = time.time() - start_time
+                if self._is_full_loop(start_time):
+                    self.module.set_sync_project_settings()  # clean cache
+                    self._last_full_loop = start_time
+                enabled_projects = list(self.module.get_enabled_projects())
+                due_projects = [
+                    _project_name
+                    for _project_name in enabled_projects
+                    if self._next_project_runs.get(_project_name, 0)
+                    <= start_time
+                ]
+
+                results = await asyncio.gather(
+                    *[
+                        self._sync_project(_project_name)
+                        for _project_name in due_projects
+                    ],
+                    return_exceptions=True
+                )
+                end_time = time.time()
+                self._schedule_projects(
+                    enabled_projects, due_projects, end_time
+                )
+                for _project_name, result in zip(due_projects, results):
+                    if isinstance(result, (ConnectionResetError,
+                                           ResumableError)):
+                        self.log.warning(
+                            "{} in sync of project '{}', trying next loop"
+                            .format(type(result).__name__, _project_name),
+                            exc_info=result)
+                    elif isinstance(result, BaseException):
+                        raise result
+
+                duration = end_time - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
-                delay = self.module.get_loop_delay(project_name)
+                self._full_loop_delay = self._get_loop_delay(enabled_projects)
+                delay = self._get_wait_delay(enabled_projects, time.time())
                 self.log.debug(
                     "Waiting for {} seconds to new loop".format(delay)
                 )
@@ -478,6 +425,256 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    async def _sync_project(self, project_name):
+        """Synchronize files of one project.
+
+        Query of representations, creation of provider and its folder
+        tree are run in executor so projects are processed concurrently.
+
+        Args:
+            project_name (str): Project name.
+        """
+        loop = asyncio.get_running_loop()
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name, preset)
+        if not all([local_site, remote_site]):
+            return
+
+        if self._is_incremental(project_name):
+            queue = self._get_queue(project_name, local_site, remote_site)
+            sync_repres = await loop.run_in_executor(
+                None, queue.get_representations
+            )
+        else:
+            sync_repres = await loop.run_in_executor(
+                None,
+                lambda: list(self.module.get_sync_representations(
+                    project_name, local_site, remote_site
+                ))
+            )
+
+        semaphore = self._get_site_semaphore(remote_site, preset)
+
+        task_files_to_process = []
+        files_processed_info = []
+        # process only unique file paths in one batch
+        # multiple representation could have same file path
+        # (textures),
+        # upload process can find already uploaded file and
+        # reuse same id
+        processed_file_path = set()
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = \
+            self.module.get_provider_for_site(site=remote_site)
+        # creation of provider and its folder tree can be expensive so
+        # both run in executor to not block other projects
+        handler = await loop.run_in_executor(
+            None,
+            lambda: lib.factory.get_provider(remote_provider,
+                                             project_name,
+                                             remote_site,
+                                             presets=site_preset)
+        )
+        limit = lib.factory.get_provider_batch_limit(
+            remote_provider)
+        # first call to get_tree could be expensive, its
+        # building folder tree structure in memory
+        # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+        tree = None
+        tree_loaded = False
+        for sync in sync_repres:
+            if limit <= 0:
+                continue
+            files = sync.get("files") or []
+            if files:
+                for file in files:
+                    # skip already processed files
+                    file_path = file.get('path', '')
+                    if file_path in processed_file_path:
+                        continue
+                    status = self.module.check_status(
+                        file,
+                        local_site,
+                        remote_site,
+                        preset.get('config'))
+                    if status == SyncStatus.DO_UPLOAD:
+                        if not tree_loaded:
+                            tree = await loop.run_in_executor(
+                                None, handler.get_tree
+                            )
+                            tree_loaded = True
+                        limit -= 1
+                        task = asyncio.create_task(
+                            self._run_limited(
+                                semaphore,
+                                upload(self.module,
+                                       project_name,
+                                       file,
+                                       sync,
+                                       remote_provider,
+                                       remote_site,
+                                       tree,
+                                       site_preset)))
+                        task_files_to_process.append(task)
+                        # store info for exception handlingy
+                        files_processed_info.append((file,
+                                                     sync,
+                                                     remote_site,
+                                                     project_name
+                                                     ))
+                        processed_file_path.add(file_path)
+                    if status == SyncStatus.DO_DOWNLOAD:
+                        if not tree_loaded:
+                            tree = await loop.run_in_executor(
+                                None, handler.get_tree
+                            )
+                            tree_loaded = True
+                        limit -= 1
+                        task = asyncio.create_task(
+                            self._run_limited(
+                                semaphore,
+                                download(self.module,
+                                         project_name,
+                                         file,
+                                         sync,
+                                         remote_provider,
+                                         remote_site,
+                                         tree,
+                                         site_preset)))
+                        task_files_to_process.append(task)
+
+                        files_processed_info.append((file,
+                                                     sync,
+                                                     local_site,
+                                                     project_name
+                                                     ))
+                        processed_file_path.add(file_path)
+
+        self.log.debug("Sync tasks count {} for project '{}'".format(
+            len(task_files_to_process), project_name
+        ))
+        files_created = await asyncio.gather(
+            *task_files_to_process,
+            return_exceptions=True)
+        for file_id, info in zip(files_created,
+                                 files_processed_info):
+            file, representation, site, project_name = info
+            error = None
+            if isinstance(file_id, BaseException):
+                error = str(file_id)
+                file_id = None
+            self.module.update_db(project_name,
+                                  file_id,
+                                  file,
+                                  representation,
+                                  site,
+                                  error)
+
+    def _is_full_loop(self, current_time):
+        """Should be settings refreshed in this loop."""
+        if self._last_full_loop is None:
+            return True
+        return current_time - self._last_full_loop >= self._full_loop_delay
+
+    def _get_loop_delay(self, project_names):
+        """Shortest loop delay of projects.
+
+        Args:
+            project_names (list[str]): Enabled projects.
+
+        Returns:
+            int: Seconds to wait before next loop.
+        """
+        if not project_names:
+            return self.module.get_loop_delay(None)
+        return min(
+            self.module.get_loop_delay(project_name)
+            for project_name in project_names
+        )
+
+    def _get_project_delay(self, project_name):
+        """Seconds between syncs of a project."""
+        delay = self.module.get_loop_delay(project_name)
+        if self._is_incremental(project_name):
+            delay = min(delay, self.incremental_poll_delay)
+        return delay
+
+    def _schedule_projects(self, enabled_projects, synced_projects, end_time):
+        """Store time of next sync of synchronized projects.
+
+        Args:
+            enabled_projects (list[str]): Enabled projects.
+            synced_projects (list[str]): Projects synchronized in loop.
+            end_time (float): Time when synchronization finished.
+        """
+        next_project_runs = {
+            project_name: next_run
+            for project_name, next_run in self._next_project_runs.items()
+            if project_name in enabled_projects
+        }
+        for project_name in synced_projects:
+            next_project_runs[project_name] = (
+                end_time + self._get_project_delay(project_name)
+            )
+        self._next_project_runs = next_project_runs
+
+    def _get_wait_delay(self, enabled_projects, current_time):
+        """Seconds to wait until any enabled project should be synced."""
+        if not enabled_projects:
+            return self.module.get_loop_delay(None)
+        next_run = min(
+            self._next_project_runs.get(project_name, current_time)
+            for project_name in enabled_projects
+        )
+        return max(0, next_run - current_time)
+
+    def _is_incremental(self, project_name):
+        preset = self.module.sync_project_settings.get(project_name) or {}
+        return bool(preset.get("config", {}).get("incremental_sync"))
+
+    def _get_queue(self, project_name, local_site, remote_site):
+        """Queue of pending representations for project and sites."""
+        queue = self._queues.get(project_name)
+        if queue is not None and not queue.is_for_sites(
+            local_site, remote_site
+        ):
+            queue.close()
+            queue = None
+
+        if queue is None:
+            queue = SyncRepresentationQueue(
+                self.module,
+                project_name,
+                local_site,
+                remote_site,
+                self.module.get_loop_delay(project_name)
+            )
+            self._queues[project_name] = queue
+        return queue
+
+    async def _run_limited(self, semaphore, coro):
+        """Await coroutine when semaphore allows it."""
+        async with semaphore:
+            return await coro
+
+    def _get_site_semaphore(self, site_name, sync_config):
+        """Semaphore limiting concurrent transfers to a remote site.
+
+        Width is taken from 'site_workers' of project config which first
+        used the site.
+        """
+        semaphore = self._site_semaphores.get(site_name)
+        if semaphore is None:
+            site_workers = (
+                sync_config.get("config", {}).get("site_workers")
+                or self.default_site_workers
+            )
+            semaphore = asyncio.Semaphore(int(site_workers))
+            self._site_semaphores[site_name] = semaphore
+        return semaphore
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -511,8 +708,16 @@ class SyncServerThread(threading.Thread):
         await asyncio.sleep(delay)
 
     def reset_timer(self):
-        """Called when waiting for next loop should be skipped"""
+        """Called when waiting for next loop should be skipped
+
+        Next loop will refresh settings and fully reconcile queues of
+        incremental sync.
+        """
         self.log.debug("Resetting timer")
+        self._last_full_loop = None
+        self._next_project_runs = {}
+        for queue in tuple(self._queues.values()):
+            queue.request_reconcile()
         if self.timer:
             self.timer.cancel()
             self.timer = None
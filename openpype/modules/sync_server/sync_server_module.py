@@ -14,6 +14,7 @@ from openpype.client import (
     get_projects,
     get_representations,
     get_representation_by_id,
+    iter_representations,
 )
 from openpype.modules import OpenPypeModule, ITrayModule, IPluginPaths
 from openpype.settings import (
@@ -105,6 +106,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
 
     name = "sync_server"
+    settings_key = "sync_server"
     label = "Sync Queue"
 
     def initialize(self, module_settings):
@@ -467,14 +469,15 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         """
         self.log.debug("Validation of {} for {} started".format(project_name,
                                                                 site_name))
-        representations = list(get_representations(project_name))
-        if not representations:
-            self.log.debug("No repre found")
-            return
+        # Representations are queried page by page so all representations
+        #   of project are not loaded in memory at once
+        representations = iter_representations(project_name)
 
+        repre_found = False
         sites_added = 0
         sites_reset = 0
         for repre in representations:
+            repre_found = True
             repre_id = repre["_id"]
             for repre_file in repre.get("files", []):
                 try:
@@ -517,6 +520,10 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                             file_id=repre_file["_id"])
                         sites_reset += 1
 
+        if not repre_found:
+            self.log.debug("No repre found")
+            return
+
         if sites_added % 100 == 0:
             self.log.debug("Sites added {}".format(sites_added))
 
@@ -1666,7 +1673,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1682,12 +1690,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (list): check only these representations
 
         Returns:
             (list) of dictionaries
         """
         self.log.debug("Check representations for : {}".format(project_name))
-        self.connection.Session["AVALON_PROJECT"] = project_name
         # retry_cnt - number of attempts to sync specific file before giving up
         retries_arr = self._get_retries_arr(project_name)
         match = {
@@ -1731,6 +1739,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             ]
         }
 
+        if representation_ids is not None:
+            match["_id"] = {"$in": representation_ids}
+
         aggr = [
             {"$match": match},
             {'$unwind': '$files'},
@@ -1771,7 +1782,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             active_site, remote_site
         ))
         self.log.debug("query: {}".format(aggr))
-        representations = self.connection.aggregate(aggr)
+        # Use collection of the project directly as projects can be
+        #   processed concurrently
+        representations = self.connection.database[project_name].aggregate(
+            aggr
+        )
 
         return representations
 
@@ -1832,7 +1847,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, project_name, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  resume_offset=None):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
@@ -1847,6 +1863,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             error (string): exception message
             progress (float): 0-0.99 of progress of upload/download
             priority (int): 0-100 set priority
+            resume_offset (int): bytes of chunked transfer which are
+                already transferred, stored together with 'progress'
 
         Returns:
             None
@@ -1865,8 +1883,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
+            update["$unset"].update(self._get_resume_offset_dict(""))
         elif progress is not None:
             update["$set"] = self._get_progress_dict(progress)
+            if resume_offset is not None:
+                update["$set"].update(
+                    self._get_resume_offset_dict(resume_offset)
+                )
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
@@ -2350,6 +2373,19 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         val = {"files.$[f].sites.$[s].progress": progress}
         return val
 
+    def _get_resume_offset_dict(self, resume_offset):
+        """
+            Provide resume offset of chunked transfer to be stored in Db.
+            Used during upload/download to be able continue interrupted
+            transfer.
+        Args:
+            resume_offset: (int) - already transferred bytes
+        Returns:
+            (dictionary)
+        """
+        val = {"files.$[f].sites.$[s].resume_offset": resume_offset}
+        return val
+
     def _get_priority_dict(self, priority, file_id):
         """
             Provide priority metadata to be stored in Db.
@@ -92,6 +92,7 @@ class TimersManager(
     See `ExampleTimersManagerConnector`.
     """
     name = "timers_manager"
+    settings_key = "timers_manager"
     label = "Timers Service"
 
     _required_methods = (
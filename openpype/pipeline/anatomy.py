@@ -101,6 +101,26 @@ class BaseAnatomy(object):
 
         return anatomy_data
 
+    def _get_cached_templates(self):
+        """Templates with solved inner links shared with other instances.
+
+        Returns:
+            Union[tuple[dict, dict], None]: Raw and solved templates or 'None'
+                if templates were not cached yet.
+        """
+
+        return None
+
+    def _cache_templates(self, raw_templates, solved_templates):
+        """Store templates with solved inner links for other instances.
+
+        Args:
+            raw_templates (dict): Templates before solving.
+            solved_templates (dict): Templates with solved inner links.
+        """
+
+        pass
+
     @property
     def templates(self):
         """Wrap property `templates` of Anatomy's AnatomyTemplates instance."""
@@ -119,6 +139,10 @@ class BaseAnatomy(object):
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_many(self, *args, **kwargs):
+        """Wrap `format_many` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_many(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -369,19 +393,43 @@ class BaseAnatomy(object):
             )
 
 
+def get_anatomy_cache_lifetime():
+    """Lifetime of cached project data used by Anatomy in seconds.
+
+    Can be changed with 'OPENPYPE_ANATOMY_CACHE_LIFETIME' environment
+    variable.
+
+    Returns:
+        Union[int, float]: Lifetime in seconds.
+    """
+
+    value = os.environ.get("OPENPYPE_ANATOMY_CACHE_LIFETIME")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return CacheItem.default_lifetime
+
+
 class CacheItem:
     """Helper to cache data.
 
     Helper does not handle refresh of data and does not mark data as outdated.
     Who uses the object should check of outdated state on his own will.
+
+    Args:
+        lifetime (Optional[Union[int, float]]): Lifetime of cached data in
+            seconds. Value from 'get_anatomy_cache_lifetime' is used
+            if not passed.
     """
 
-    default_lifetime = 10
+    default_lifetime = 60
 
     def __init__(self, lifetime=None):
         self._data = None
         self._cached = None
-        self._lifetime = lifetime or self.default_lifetime
+        self._lifetime = lifetime
 
     @property
     def data(self):
@@ -405,7 +453,10 @@ class CacheItem:
 
         if self._cached is None:
             return True
-        return (time.time() - self._cached) > self._lifetime
+        lifetime = self._lifetime
+        if lifetime is None:
+            lifetime = get_anatomy_cache_lifetime()
+        return (time.time() - self._cached) > lifetime
 
     def update_data(self, data):
         """Update cache of data.
@@ -417,14 +468,63 @@ class CacheItem:
         self._data = data
         self._cached = time.time()
 
+    def reset(self):
+        """Mark data as outdated."""
+
+        self._data = None
+        self._cached = None
+
+
+class AnatomySnapshot(object):
+    """Prepared anatomy data shared by Anatomy instances.
+
+    Snapshot is created for project document and root overrides. Data of
+    snapshot must not be modified. Anatomy instances return copies of
+    the data and each 'AnatomyTemplates' gets its own copy of templates
+    with solved inner links.
+
+    Args:
+        project_doc (dict[str, Any]): Project document.
+        root_overrides (Union[dict[str, str], None]): Root overrides
+            of site.
+    """
+
+    def __init__(self, project_doc, root_overrides):
+        self.project_doc = project_doc
+        self.root_overrides = root_overrides
+        self.anatomy_data = None
+        self.raw_templates = None
+        self.solved_templates = None
+
+    def is_valid_for(self, project_doc, root_overrides):
+        return (
+            self.project_doc is project_doc
+            and self.root_overrides == root_overrides
+        )
+
 
 class Anatomy(BaseAnatomy):
+    """Anatomy of a project.
+
+    Project document, site root overrides and prepared anatomy data are
+    cached per process and shared by all instances for the same project
+    and site. Cache expires after lifetime defined by
+    'get_anatomy_cache_lifetime' or when 'clear_cache' is called.
+
+    Args:
+        project_name (Optional[str]): Project name. Value of 'AVALON_PROJECT'
+            environment variable is used if not passed.
+        site_name (Optional[str]): Site name for which root overrides are
+            used. Active site is used if not passed.
+    """
+
     _sync_server_addon_cache = CacheItem()
     _project_cache = collections.defaultdict(CacheItem)
     _default_site_id_cache = collections.defaultdict(CacheItem)
     _root_overrides_cache = collections.defaultdict(
         lambda: collections.defaultdict(CacheItem)
     )
+    _snapshots = {}
 
     def __init__(self, project_name=None, site_name=None):
         if not project_name:
@@ -436,17 +536,83 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
-        project_doc = self.get_project_doc_from_cache(project_name)
+        project_doc = self._get_project_doc(project_name)
         root_overrides = self._get_site_root_overrides(project_name, site_name)
+        self._snapshot = self._get_snapshot(
+            project_name, site_name, project_doc, root_overrides
+        )
 
         super(Anatomy, self).__init__(project_doc, root_overrides)
 
+    def _prepare_anatomy_data(self, project_doc, root_overrides):
+        snapshot = self._snapshot
+        if snapshot.anatomy_data is None:
+            snapshot.anatomy_data = super(
+                Anatomy, self
+            )._prepare_anatomy_data(project_doc, root_overrides)
+        return snapshot.anatomy_data
+
+    def _get_cached_templates(self):
+        snapshot = self._snapshot
+        if snapshot.solved_templates is None:
+            return None
+        return snapshot.raw_templates, snapshot.solved_templates
+
+    def _cache_templates(self, raw_templates, solved_templates):
+        self._snapshot.raw_templates = raw_templates
+        self._snapshot.solved_templates = solved_templates
+
     @classmethod
-    def get_project_doc_from_cache(cls, project_name):
+    def _get_snapshot(
+        cls, project_name, site_name, project_doc, root_overrides
+    ):
+        key = (project_name, site_name)
+        snapshot = cls._snapshots.get(key)
+        if (
+            snapshot is None
+            or not snapshot.is_valid_for(project_doc, root_overrides)
+        ):
+            snapshot = AnatomySnapshot(project_doc, root_overrides)
+            cls._snapshots[key] = snapshot
+        return snapshot
+
+    @classmethod
+    def _get_project_doc(cls, project_name):
         project_cache = cls._project_cache[project_name]
         if project_cache.is_outdated:
             project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+        return project_cache.data
+
+    @classmethod
+    def get_project_doc_from_cache(cls, project_name):
+        return copy.deepcopy(cls._get_project_doc(project_name))
+
+    @classmethod
+    def clear_cache(cls, project_name=None):
+        """Clear cached data used by Anatomy.
+
+        Should be called when project document, anatomy settings or local
+        settings are changed.
+
+        Args:
+            project_name (Optional[str]): Clear cache only of the project.
+                Cache of all projects is cleared if not passed.
+        """
+
+        if project_name is None:
+            cls._sync_server_addon_cache.reset()
+            cls._project_cache.clear()
+            cls._default_site_id_cache.clear()
+            cls._root_overrides_cache.clear()
+            cls._snapshots.clear()
+            return
+
+        cls._project_cache.pop(project_name, None)
+        cls._default_site_id_cache.pop(project_name, None)
+        cls._root_overrides_cache.pop(project_name, None)
+        for key in tuple(cls._snapshots.keys()):
+            if key[0] == project_name:
+                cls._snapshots.pop(key)
 
     @classmethod
     def get_sync_server_addon(cls):
@@ -640,6 +806,39 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_many(self, data_items, formatted_cache=None):
+        """Format template with multiple data at once.
+
+        Args:
+            data_items (Iterable[dict[str, Any]]): Formatting data.
+            formatted_cache (Optional[dict]): Cache of formatted values which
+                can be shared between multiple templates.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting results.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        roots = None
+        prepared_data = []
+        for data in data_items:
+            if not data.get("root"):
+                if roots is None:
+                    roots = anatomy_templates.anatomy.roots
+                data = dict(data)
+                data["root"] = roots
+            prepared_data.append(data)
+
+        return [
+            AnatomyTemplateResult(
+                result,
+                anatomy_templates.rootless_path_from_result(result)
+            )
+            for result in StringTemplate.format_many(
+                self, prepared_data, formatted_cache
+            )
+        ]
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -681,10 +880,12 @@ class AnatomyTemplates(TemplatesDict):
             self._discover()
             self.loaded_project = self.project_name
 
-    def _format_value(self, value, data):
+    def _format_value(self, value, data, formatted_cache=None):
         if isinstance(value, RootItem):
-            return self._solve_dict(value, data)
-        return super(AnatomyTemplates, self)._format_value(value, data)
+            return self._solve_dict(value, data, formatted_cache)
+        return super(AnatomyTemplates, self)._format_value(
+            value, data, formatted_cache
+        )
 
     def set_templates(self, templates):
         if not templates:
@@ -744,7 +945,24 @@ class AnatomyTemplates(TemplatesDict):
                 " Trying to use default."
             ).format(self.project_name))
 
-        self.set_templates(self.anatomy["templates"])
+        cached_templates = self.anatomy._get_cached_templates()
+        if cached_templates is None:
+            self.set_templates(self.anatomy["templates"])
+            self.anatomy._cache_templates(
+                copy.deepcopy(self._raw_templates),
+                copy.deepcopy(self._templates)
+            )
+            return
+
+        # Cached templates are shared with other Anatomy instances of the
+        #   same project and site - each instance gets its own copy so
+        #   modification of templates does not affect other instances
+        raw_templates, solved_templates = copy.deepcopy(cached_templates)
+        self._raw_templates = raw_templates
+        self._templates = solved_templates
+        self._objected_templates = self.create_objected_templates(
+            solved_templates
+        )
 
     @classmethod
     def replace_inner_keys(cls, matches, value, key_values, key):
@@ -1007,6 +1225,31 @@ class AnatomyTemplates(TemplatesDict):
         """
         return self.format(in_data, strict=False)
 
+    def format_many(self, data_items, strict=True):
+        """ Solves templates for multiple data at once.
+
+        Data are not deep copied and formatted values are shared between
+        all data, which makes it much faster than calling 'format' for each
+        data, e.g. for each frame of a sequence.
+
+        Args:
+            data_items (Iterable[dict]): Data used for formatting.
+            strict (bool, optional): Value of 'strict' attribute of results.
+
+        Returns:
+            list[TemplatesResultDict]: Results in order of passed data.
+        """
+        roots = self.roots
+        prepared_data = []
+        for data in data_items:
+            data = dict(data)
+            if roots:
+                data["root"] = roots
+            prepared_data.append(data)
+        return super(AnatomyTemplates, self).format_many(
+            prepared_data, strict=strict
+        )
+
 
 class RootItem(FormatObject):
     """Represents one item or roots.
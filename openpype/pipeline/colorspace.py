@@ -2,14 +2,27 @@ from copy import deepcopy
 import re
 import os
 import json
+import time
+import atexit
 import platform
+import threading
+import subprocess
 import contextlib
 import tempfile
+try:
+    from queue import Queue, Empty
+except ImportError:
+    from Queue import Queue, Empty
+
 from openpype import PACKAGE_DIR
 from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
+    env_value_to_bool,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -19,6 +32,209 @@ log = Logger.get_logger(__name__)
 
 class CashedData:
     remapping = None
+    # Data from ocio configs by data type, config path, mtime and size
+    ocio_config_data = {}
+    ocio_query_worker = None
+    has_compatible_ocio_package = None
+
+
+class OCIOQueryWorker(object):
+    """Long-lived OpenPype process answering queries about OCIO configs.
+
+    Used in hosts where PyOpenColorIO is not available. Process is started
+    on first query and is running until current process ends. Requests and
+    responses are json lines sent through stdin and stdout of the process.
+
+    Process runs 'ocio_wrapper.py serve' command. Output of the process is
+    read in a thread so a response can be awaited with timeout. Process is
+    killed when response does not come in time and is started again on
+    next query.
+    """
+
+    # Must match prefix in 'ocio_wrapper.py'
+    response_prefix = "OCIO_RESPONSE:"
+    # Seconds to wait for response, first query includes process start
+    response_timeout = 60
+
+    def __init__(self):
+        self._process = None
+        self._output_queue = None
+        self._lock = threading.Lock()
+        self._request_id = 0
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        args = get_openpype_execute_args(
+            "run", get_ocio_config_script_path(), "serve"
+        )
+        env = clean_envs_for_openpype_process(os.environ)
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        log.info("Starting OCIO query worker: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            env={str(key): str(value) for key, value in env.items()},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            **kwargs
+        )
+        self._start_output_reader()
+
+    def _start_output_reader(self):
+        self._output_queue = Queue()
+        thread = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._output_queue)
+        )
+        thread.daemon = True
+        thread.start()
+
+    @staticmethod
+    def _read_output(stdout, output_queue):
+        try:
+            for line in iter(stdout.readline, ""):
+                output_queue.put(line)
+        except (OSError, IOError, ValueError):
+            pass
+        # Process has stopped
+        output_queue.put(None)
+
+    def stop(self, kill=False):
+        process = self._process
+        self._process = None
+        self._output_queue = None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            process.stdin.close()
+        except (OSError, IOError):
+            pass
+
+        try:
+            if kill:
+                process.kill()
+            else:
+                process.terminate()
+        except (OSError, IOError):
+            pass
+
+    def query(self, data_type, config_path):
+        """Get data of a config from the worker.
+
+        Args:
+            data_type (str): Type of data, 'get_colorspace' or 'get_views'.
+            config_path (str): Path to ocio config file.
+
+        Raises:
+            RuntimeError: Worker failed to return the data.
+
+        Returns:
+            dict: Data from the config.
+        """
+        with self._lock:
+            if not self.is_running():
+                self.start()
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = {
+                "id": request_id,
+                "method": data_type,
+                "params": {"config_path": config_path}
+            }
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+                return self._read_response(request_id)
+
+            except (OSError, IOError) as exc:
+                self.stop()
+                raise RuntimeError(
+                    "OCIO query worker failed: {}".format(exc)
+                )
+
+    def _read_response(self, request_id):
+        output_queue = self._output_queue
+        end_time = time.time() + self.response_timeout
+        while True:
+            try:
+                line = output_queue.get(
+                    timeout=max(end_time - time.time(), 0)
+                )
+            except Empty:
+                self.stop(kill=True)
+                raise RuntimeError(
+                    "OCIO query worker did not respond in {} seconds".format(
+                        self.response_timeout
+                    )
+                )
+
+            if line is None:
+                self.stop()
+                raise RuntimeError("OCIO query worker has stopped")
+
+            # Skip output which is not response (e.g. OpenPype logs)
+            if not line.startswith(self.response_prefix):
+                continue
+
+            response = json.loads(line[len(self.response_prefix):])
+            if response.get("id") != request_id:
+                continue
+
+            error = response.get("error")
+            if error:
+                raise RuntimeError(
+                    "OCIO query worker error: {}".format(error)
+                )
+            return response["result"]
+
+
+def _stop_ocio_query_worker():
+    if CashedData.ocio_query_worker is not None:
+        CashedData.ocio_query_worker.stop()
+
+
+def get_ocio_query_worker():
+    """Shared OCIO query worker of current process.
+
+    Returns:
+        OCIOQueryWorker: Worker object.
+    """
+    if CashedData.ocio_query_worker is None:
+        CashedData.ocio_query_worker = OCIOQueryWorker()
+        atexit.register(_stop_ocio_query_worker)
+    return CashedData.ocio_query_worker
+
+
+def _get_cached_config_data(config_path, data_type, func):
+    """Get data of ocio config from cache or using passed function.
+
+    Cache is invalidated when modification time or size of the config
+    file changes.
+    """
+    config_path = os.path.normpath(config_path)
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return func(config_path)
+
+    key = (data_type, config_path, stat.st_mtime, stat.st_size)
+    data = CashedData.ocio_config_data.get(key)
+    if data is None:
+        data = func(config_path)
+        CashedData.ocio_config_data[key] = data
+    return deepcopy(data)
 
 
 @contextlib.contextmanager
@@ -209,11 +425,23 @@ def validate_imageio_colorspace_in_config(config_path, colorspace_name):
 def get_data_subprocess(config_path, data_type):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Data are received from long-lived OCIO
+    query worker. Single use process is launched if the worker fails, does
+    not respond in time or is disabled with 'OPENPYPE_OCIO_QUERY_WORKER'
+    environment variable set to '0'.
 
     Args:
         config_path (str): path leading to config.ocio file
     """
+    if env_value_to_bool("OPENPYPE_OCIO_QUERY_WORKER", default=True):
+        try:
+            return get_ocio_query_worker().query(data_type, config_path)
+        except RuntimeError:
+            log.warning(
+                "OCIO query worker failed. Using single use process.",
+                exc_info=True
+            )
+
     with _make_temp_json_file() as tmp_json_path:
         # Prepare subprocess arguments
         args = [
@@ -238,11 +466,13 @@ def get_data_subprocess(config_path, data_type):
 
 def compatibility_check():
     """Making sure PyOpenColorIO is importable"""
-    try:
-        import PyOpenColorIO  # noqa: F401
-    except ImportError:
-        return False
-    return True
+    if CashedData.has_compatible_ocio_package is None:
+        try:
+            import PyOpenColorIO  # noqa: F401
+            CashedData.has_compatible_ocio_package = True
+        except ImportError:
+            CashedData.has_compatible_ocio_package = False
+    return CashedData.has_compatible_ocio_package
 
 
 def get_ocio_config_colorspaces(config_path):
@@ -260,11 +490,15 @@ def get_ocio_config_colorspaces(config_path):
     if not compatibility_check():
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        return get_colorspace_data_subprocess(config_path)
+        return _get_cached_config_data(
+            config_path, "get_colorspace", get_colorspace_data_subprocess
+        )
 
     from openpype.scripts.ocio_wrapper import _get_colorspace_data
 
-    return _get_colorspace_data(config_path)
+    return _get_cached_config_data(
+        config_path, "get_colorspace", _get_colorspace_data
+    )
 
 
 def get_colorspace_data_subprocess(config_path):
@@ -296,11 +530,15 @@ def get_ocio_config_views(config_path):
     if not compatibility_check():
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        return get_views_data_subprocess(config_path)
+        return _get_cached_config_data(
+            config_path, "get_views", get_views_data_subprocess
+        )
 
     from openpype.scripts.ocio_wrapper import _get_views_data
 
-    return _get_views_data(config_path)
+    return _get_cached_config_data(
+        config_path, "get_views", _get_views_data
+    )
 
 
 def get_views_data_subprocess(config_path):
@@ -19,6 +19,7 @@ from openpype.client import (
     version_is_latest,
 )
 from openpype.lib.events import emit_event
+from openpype.lib.profiling import trace_phase
 from openpype.modules import load_modules, ModulesManager
 from openpype.settings import get_project_settings
 
@@ -93,6 +94,7 @@ def registered_root():
     return ""
 
 
+@trace_phase("host.install")
 def install_host(host):
     """Install `host` into the running Python session.
 
@@ -1,8 +1,11 @@
 import os
+import sys
+import types
 import inspect
+import importlib.machinery
 import traceback
 
-from openpype.lib import Logger
+from openpype.lib import Logger, env_value_to_bool
 from openpype.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
@@ -11,6 +14,230 @@ from openpype.lib.python_module_tools import (
 log = Logger.get_logger(__name__)
 
 
+class PluginModulesCache(object):
+    """Modules of python files from plugin directories.
+
+    Plugin directories are usually discovered multiple times (for loaders,
+    creators, inventory actions, publish plugins...) and executing all
+    files on each discovery is slow. Executed module is reused until
+    modification time or size of its file changes. Listing of directory is
+    reused until modification time of the directory changes.
+
+    Each discovery gets a copy of the module where classes defined in the
+    file are replaced with new subclasses. Settings applied to classes
+    during one discovery don't affect classes of other discoveries.
+
+    Files which failed to execute are not cached and are executed again on
+    next discovery as the failure may be caused by environment which was
+    not ready yet.
+    """
+
+    def __init__(self):
+        # Directory path -> (directory mtime, python file paths)
+        self._listings = {}
+        # File path -> (file signature, executed module)
+        self._modules = {}
+
+    def clear(self):
+        """Forget all cached modules so files are executed again."""
+
+        self._listings.clear()
+        self._modules.clear()
+
+    def get_modules(self, dirpath):
+        """Get python files from a directory as modules.
+
+        Output is the same as output of 'modules_from_path'.
+
+        Args:
+            dirpath (str): Path to directory containing python files.
+
+        Returns:
+            tuple[list, list]: First list contains tuples of path and
+                imported module and second list contains tuples of path
+                and exception info.
+        """
+
+        modules = []
+        crashed = []
+        output = (modules, crashed)
+        if not dirpath:
+            return output
+
+        # Do not allow relative imports
+        if dirpath.startswith("."):
+            log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(dirpath))
+            return output
+
+        dirpath = os.path.normpath(dirpath)
+        filepaths = self._get_filepaths(dirpath)
+        if filepaths is None:
+            log.warning("Not a directory path: {}".format(dirpath))
+            return output
+
+        for filepath in filepaths:
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._modules.get(filepath)
+            if cached is not None and cached[0] == signature:
+                module = cached[1]
+            else:
+                try:
+                    module = self._execute_file(filepath)
+
+                except Exception:
+                    self._modules.pop(filepath, None)
+                    crashed.append((filepath, sys.exc_info()))
+                    log.warning(
+                        "Failed to load path: \"{0}\"".format(filepath),
+                        exc_info=True
+                    )
+                    continue
+                self._modules[filepath] = (signature, module)
+
+            modules.append((filepath, self._create_module_copy(module)))
+        return output
+
+    def _execute_file(self, filepath):
+        mod_name = os.path.splitext(os.path.basename(filepath))[0]
+        loader = importlib.machinery.SourceFileLoader(mod_name, filepath)
+        module = types.ModuleType(mod_name)
+        module.__file__ = filepath
+        exec(loader.get_code(mod_name), module.__dict__)
+        return module
+
+    def _create_module_copy(self, module):
+        """Copy of module with new subclasses of classes defined in it.
+
+        Subclass of a class which inherits from other class defined in the
+        module inherits also from the new subclass of the other class, so
+        values set on the parent class are inherited the same way as in
+        the original module.
+
+        Args:
+            module (types.ModuleType): Executed module.
+
+        Returns:
+            types.ModuleType: Module for one discovery.
+        """
+
+        module_copy = types.ModuleType(module.__name__, module.__doc__)
+        module_copy.__dict__.update(module.__dict__)
+
+        module_classes = {
+            obj
+            for obj in module.__dict__.values()
+            if (
+                inspect.isclass(obj)
+                and obj.__module__ == module.__name__
+            )
+        }
+        new_classes = {}
+
+        def get_new_class(cls):
+            if cls in new_classes:
+                return new_classes[cls]
+
+            bases = [cls]
+            for base in cls.__bases__:
+                if base in module_classes:
+                    bases.append(get_new_class(base))
+
+            try:
+                new_cls = type(cls)(cls.__name__, tuple(bases), {
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "__doc__": cls.__doc__,
+                })
+            except Exception:
+                # Some classes can't be subclassed (e.g. enums with members)
+                new_cls = cls
+            new_classes[cls] = new_cls
+            return new_cls
+
+        for name, obj in module.__dict__.items():
+            if inspect.isclass(obj) and obj in module_classes:
+                module_copy.__dict__[name] = get_new_class(obj)
+        return module_copy
+
+    def _get_filepaths(self, dirpath):
+        try:
+            dir_mtime = os.stat(dirpath).st_mtime_ns
+        except OSError:
+            return None
+
+        if not os.path.isdir(dirpath):
+            return None
+
+        cached = self._listings.get(dirpath)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        filepaths = []
+        for filename in os.listdir(dirpath):
+            # Ignore files which start with underscore
+            if filename.startswith("_"):
+                continue
+
+            if os.path.splitext(filename)[1] != ".py":
+                continue
+
+            filepath = os.path.join(dirpath, filename)
+            if os.path.isfile(filepath):
+                filepaths.append(filepath)
+
+        self._listings[dirpath] = (dir_mtime, filepaths)
+        return filepaths
+
+
+_plugin_modules_cache = PluginModulesCache()
+
+
+def is_plugin_modules_cache_enabled():
+    """Cache of plugin modules can be disabled with environment variable.
+
+    Set 'OPENPYPE_PLUGIN_DISCOVER_CACHE' to '0' to import plugin files on
+    each discovery, e.g. during plugin development.
+
+    Returns:
+        bool: Cache is enabled.
+    """
+
+    return env_value_to_bool("OPENPYPE_PLUGIN_DISCOVER_CACHE", default=True)
+
+
+def plugin_modules_from_path(dirpath):
+    """Get python files from a plugin directory as modules.
+
+    Modules are reused from process-wide cache if files did not change
+    since last call. Classes defined in the files are new subclasses on
+    each call.
+
+    Args:
+        dirpath (str): Path to directory containing python files.
+
+    Returns:
+        tuple[list, list]: First list contains tuples of path and imported
+            module and second list contains tuples of path and exception info.
+    """
+
+    if not is_plugin_modules_cache_enabled():
+        return modules_from_path(dirpath)
+    return _plugin_modules_cache.get_modules(dirpath)
+
+
+def clear_plugin_modules_cache():
+    """Force import of plugin files on next discovery."""
+
+    _plugin_modules_cache.clear()
+
+
 class DiscoverResult:
     """Result of Plug-ins discovery of a single superclass type.
 
@@ -101,7 +328,8 @@ class PluginDiscoverContext(object):
 
     Keeps in memory all registered types and their paths. Paths are dynamically
     loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    class objects even if were loaded from same file. Executed modules are
+    reused until the files change (see 'PluginModulesCache').
     """
 
     def __init__(self):
@@ -168,7 +396,7 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = plugin_modules_from_path(path)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
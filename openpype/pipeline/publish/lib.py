@@ -11,7 +11,6 @@ import pyblish.api
 
 from openpype.lib import (
     Logger,
-    import_filepath,
     filter_profiles,
     is_func_signature_supported,
 )
@@ -23,7 +22,10 @@ from openpype.pipeline import (
     tempdir,
     Anatomy
 )
-from openpype.pipeline.plugin_discover import DiscoverResult
+from openpype.pipeline.plugin_discover import (
+    DiscoverResult,
+    plugin_modules_from_path,
+)
 
 from .contants import (
     DEFAULT_PUBLISH_TEMPLATE,
@@ -294,33 +296,17 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if mod_ext != ".py":
-                continue
-
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
-
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
-
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+        # Modules are reused from previous discovery if files did not
+        #   change, plugin classes are new subclasses
+        modules, crashed = plugin_modules_from_path(path)
+        for abspath, exc_info in crashed:
+            result.crashed_file_paths[abspath] = exc_info
+
+        for abspath, module in modules:
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[abspath] = module
 
             for plugin in pyblish.plugin.plugins_from_module(module):
                 # Ignore base plugin classes
@@ -81,9 +81,13 @@ class KnownPublishError(Exception):
 
 
 class OpenPypePyblishPluginMixin:
+    # Plugin does not touch host and can process multiple instances
+    #   at the same time in worker threads (e.g. extractors which only
+    #   launch ffmpeg or oiiotool). Used only by publisher tool, other
+    #   publishing processes ignore the attribute.
+    executable_in_thread = False
+
     # TODO
-    # executable_in_thread = False
-    #
     # state_message = None
     # state_percent = None
     # _state_change_callbacks = []
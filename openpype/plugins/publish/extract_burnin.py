@@ -56,6 +56,10 @@ class ExtractBurnin(publish.Extractor):
         # "resolve"
     ]
 
+    # Only launches subprocesses and does not touch host so instances
+    #   can be processed in worker threads of publisher
+    executable_in_thread = True
+
     optional = True
 
     positions = [
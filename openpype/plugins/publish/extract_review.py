@@ -65,6 +65,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
         "unreal"
     ]
 
+    # Only launches subprocesses and does not touch host so instances
+    #   can be processed in worker threads of publisher
+    executable_in_thread = True
+
     # Supported extensions
     image_exts = ["exr", "jpg", "jpeg", "png", "dpx"]
     video_exts = ["mov", "mp4"]
@@ -77,6 +81,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Render compatible output definitions of representation with single
+    #   ffmpeg process decoding input only once
+    single_pass_outputs = True
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -303,111 +310,64 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self, instance, repre, src_repre_staging_dir, output_definitions
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_repre["tags"]:
-                new_repre["tags"].remove("delete")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_repre["tags"]:
-                    new_repre["tags"].append(tag)
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
-
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
-
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
-            )
-
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
+        output_items = []
+        files_to_clean = []
+        try:
+            for output_def in output_definitions:
+                output_item = self._prepare_output_item(
+                    instance,
+                    repre,
+                    src_repre_staging_dir,
+                    output_def,
+                    fill_data,
+                    files_to_clean
                 )
+                # Input is not supported
+                if output_item is None:
+                    return
+                output_items.append(output_item)
 
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext
-            })
-
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def, instance, new_repre, temp_data, fill_data
-                )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
+            for items_group in self._group_output_items(output_items):
+                if len(items_group) == 1:
+                    ffmpeg_args = self.ffmpeg_full_args(
+                        *items_group[0]["ffmpeg_parts"]
                     )
-                    return
-                raise NotImplementedError
+                else:
+                    self.log.debug(
+                        "Rendering outputs {} in single pass".format(", ".join(
+                            item["output_name"] for item in items_group
+                        ))
+                    )
+                    ffmpeg_args = self._single_pass_ffmpeg_args(items_group)
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+                subprcs_cmd = " ".join(ffmpeg_args)
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+                # run subprocess
+                self.log.debug("Executing: {}".format(subprcs_cmd))
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+                run_subprocess(subprcs_cmd, shell=True, logger=self.log)
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
+                for output_item in items_group:
+                    output_item["ffmpeg_cmd"] = subprcs_cmd
 
+        finally:
+            # delete files added to fill gaps
+            for filepath in set(files_to_clean):
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+        for output_item in output_items:
+            new_repre = output_item["new_repre"]
+            temp_data = output_item["temp_data"]
+            output_name = output_item["output_name"]
             new_repre.update({
                 "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
+                "name": "{}_{}".format(output_name, new_repre["ext"]),
                 "outputName": output_name,
-                "outputDef": output_def,
+                "outputDef": output_item["output_def"],
                 "frameStartFtrack": temp_data["output_frame_start"],
                 "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
+                "ffmpeg_cmd": output_item["ffmpeg_cmd"]
             })
 
             # Force to pop these key if are in new repre
@@ -423,6 +383,233 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _prepare_output_item(
+        self,
+        instance,
+        repre,
+        src_repre_staging_dir,
+        _output_def,
+        fill_data,
+        files_to_clean
+    ):
+        """Prepare new representation and ffmpeg arguments of output.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            repre (dict): Source representation.
+            src_repre_staging_dir (str): Original staging dir of source
+                representation.
+            _output_def (dict): Output definition.
+            fill_data (dict): Anatomy fill data. Output name and extension
+                are updated.
+            files_to_clean (list[str]): Files added to fill gaps in sequence
+                are added to the list.
+
+        Returns:
+            Union[dict, None]: Output item data or None if input is not
+                supported.
+        """
+        output_def = copy.deepcopy(_output_def)
+        # Make sure output definition has "tags" key
+        if "tags" not in output_def:
+            output_def["tags"] = []
+
+        if "burnins" not in output_def:
+            output_def["burnins"] = []
+
+        # Create copy of representation
+        new_repre = copy.deepcopy(repre)
+        # Make sure new representation has origin staging dir
+        #   - this is because source representation may change
+        #       it's staging dir because of ffmpeg conversion
+        new_repre["stagingDir"] = src_repre_staging_dir
+
+        # Remove "delete" tag from new repre if there is
+        if "delete" in new_repre["tags"]:
+            new_repre["tags"].remove("delete")
+
+        # Add additional tags from output definition to representation
+        for tag in output_def["tags"]:
+            if tag not in new_repre["tags"]:
+                new_repre["tags"].append(tag)
+
+        # Add burnin link from output definition to representation
+        for burnin in output_def["burnins"]:
+            if burnin not in new_repre.get("burnins", []):
+                if not new_repre.get("burnins"):
+                    new_repre["burnins"] = []
+                new_repre["burnins"].append(str(burnin))
+
+        self.log.debug(
+            "Linked burnins: `{}`".format(new_repre.get("burnins"))
+        )
+
+        self.log.debug(
+            "New representation tags: `{}`".format(
+                new_repre.get("tags"))
+        )
+
+        temp_data = self.prepare_temp_data(instance, repre, output_def)
+        if temp_data["input_is_sequence"]:
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean.extend(self.fill_sequence_gaps(
+                files=temp_data["origin_repre"]["files"],
+                staging_dir=new_repre["stagingDir"],
+                start_frame=temp_data["frame_start"],
+                end_frame=temp_data["frame_end"]
+            ))
+
+        # create or update outputName
+        output_name = new_repre.get("outputName", "")
+        output_ext = new_repre["ext"]
+        if output_name:
+            output_name += "_"
+        output_name += output_def["filename_suffix"]
+        if temp_data["without_handles"]:
+            output_name += "_noHandles"
+
+        # add outputName to anatomy format fill_data
+        fill_data.update({
+            "output": output_name,
+            "ext": output_ext
+        })
+
+        try:  # temporary until oiiotool is supported cross platform
+            ffmpeg_parts = self._ffmpeg_argument_parts(
+                output_def, instance, new_repre, temp_data, fill_data
+            )
+        except ZeroDivisionError:
+            # TODO recalculate width and height using OIIO before
+            #   conversion
+            if 'exr' in temp_data["origin_repre"]["ext"]:
+                self.log.warning(
+                    (
+                        "Unsupported compression on input files."
+                        " Skipping!!!"
+                    ),
+                    exc_info=True
+                )
+                return None
+            raise NotImplementedError
+
+        return {
+            "output_def": output_def,
+            "new_repre": new_repre,
+            "temp_data": temp_data,
+            "output_name": output_name,
+            "ffmpeg_parts": ffmpeg_parts,
+            "ffmpeg_cmd": None,
+        }
+
+    def _get_single_pass_key(self, output_item):
+        """Key of outputs which can be rendered in single pass.
+
+        Outputs can share one ffmpeg process if they have the same input
+        arguments, single input and no audio filters. Video filters with
+        labels can't be used in branch of filter graph.
+
+        Returns:
+            Union[tuple, None]: Key or None if output must be rendered
+                separately.
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            output_item["ffmpeg_parts"]
+        )
+        if audio_filters:
+            return None
+
+        for arg in self.split_ffmpeg_args(output_args):
+            for identifier in ("-af", "-filter:a"):
+                if arg.startswith(identifier + " "):
+                    return None
+
+        input_count = 0
+        for arg in input_args:
+            if arg == "-i" or arg.startswith("-i "):
+                input_count += 1
+        if input_count != 1:
+            return None
+
+        for arg in input_args + output_args:
+            for identifier in ("-map", "-filter_complex", "-lavfi"):
+                if arg == identifier or arg.startswith(identifier + " "):
+                    return None
+
+        for video_filter in video_filters:
+            if "[" in video_filter or ";" in video_filter:
+                return None
+        return tuple(input_args)
+
+    def _group_output_items(self, output_items):
+        """Group output items which can be rendered in single pass.
+
+        Returns:
+            list[list[dict]]: Groups of output items in order of outputs.
+        """
+        if not self.single_pass_outputs:
+            return [[output_item] for output_item in output_items]
+
+        groups = []
+        groups_by_key = {}
+        for output_item in output_items:
+            key = self._get_single_pass_key(output_item)
+            if key is None:
+                groups.append([output_item])
+                continue
+
+            group = groups_by_key.get(key)
+            if group is None:
+                group = []
+                groups_by_key[key] = group
+                groups.append(group)
+            group.append(output_item)
+        return groups
+
+    def _single_pass_ffmpeg_args(self, output_items):
+        """Arguments rendering multiple outputs with single ffmpeg process.
+
+        Input is decoded once and split to a branch of filter graph for
+        each output. Audio of input, e.g. of a movie, is mapped to each
+        output unless the output disables audio.
+
+        Args:
+            output_items (list[dict]): Output items with the same single pass
+                key.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = output_items[0]["ffmpeg_parts"][0]
+        filter_graph = ["[0:v]split={}{}".format(
+            len(output_items),
+            "".join("[s{}]".format(idx) for idx in range(len(output_items)))
+        )]
+        output_args = []
+        for idx, output_item in enumerate(output_items):
+            _, video_filters, audio_filters, item_output_args = (
+                output_item["ffmpeg_parts"]
+            )
+            video_filters = list(video_filters)
+            item_output_args = self._move_filters_from_output_args(
+                video_filters, list(audio_filters), item_output_args
+            )
+            filter_graph.append("[s{0}]{1}[v{0}]".format(
+                idx, ",".join(video_filters) or "null"
+            ))
+            output_args.extend(["-map", "\"[v{}]\"".format(idx)])
+            # Mapping streams disables default stream selection so audio
+            #   must be mapped explicitly ('?' ignores input without audio)
+            if "-an" not in item_output_args:
+                output_args.extend(["-map", "0:a?"])
+            output_args.extend(item_output_args)
+
+        all_args = [path_to_subprocess_arg(self.ffmpeg_path)]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
+        all_args.extend(output_args)
+        return all_args
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -547,6 +734,22 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _ffmpeg_argument_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares parts of ffmpeg arguments for expected extraction.
+
+        Same as '_ffmpeg_arguments' but parts are returned separately.
+
+        Returns:
+            tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments with output filepath.
+                Filters are moved from output arguments.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -722,7 +925,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -770,6 +976,40 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments.
+
+        Args:
+            video_filters (list): Video filters where found video filters
+                are added.
+            audio_filters (list): Audio filters where found audio filters
+                are added.
+            output_args (list): Output arguments.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -786,21 +1026,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
-
-        all_args = []
-        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
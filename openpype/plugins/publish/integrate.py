@@ -22,6 +22,7 @@ from openpype.client import (
     get_representations,
     get_subset_by_name,
     get_version_by_name,
+    get_versions,
 )
 from openpype.lib import source_hash
 from openpype.lib.file_transaction import (
@@ -143,6 +144,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Number of concurrent file transfers per destination device
+    transfer_max_workers = 8
+
+    # Calculate content hash of copied files and store it to file info
+    hash_content = False
+    # Hardlink files with same content from previous version of the subset
+    #   instead of copying them (enables 'hash_content')
+    dedupe_published_files = False
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -173,9 +183,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            hash_content=self.hash_content
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -253,6 +267,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         anatomy = instance.context.data["anatomy"]
 
+        if self.dedupe_published_files:
+            file_transactions.set_dedupe_lookup(
+                self.get_dedupe_lookup(project_name, version, anatomy)
+            )
+
         # Get existing representations (if any)
         existing_repres_by_name = {
             repre_doc["name"].lower(): repre_doc
@@ -316,6 +335,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        metrics = file_transactions.metrics
+        self.log.debug((
+            "Transferred {files} files ({bytes} bytes) in {duration:.2f}s"
+            " ({bytes_per_second:.0f} B/s)"
+        ).format(**metrics))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -329,9 +353,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        content_hashes = file_transactions.content_hashes
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            content_hashes=content_hashes
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -342,7 +370,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                content_hashes=content_hashes
             )
 
             # Add the version resource file infos to each representation
@@ -941,25 +972,38 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(
+        self, destinations, sites, anatomy, content_hashes=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            content_hashes (dict): content hashes of files by destination
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if content_hashes is None:
+            content_hashes = {}
+
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                content_hash=content_hashes.get(
+                    os.path.normpath(os.path.abspath(file_path))
+                )
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, content_hash=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -968,18 +1012,82 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            content_hash: sha256 hash of file content if was calculated
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        file_info = {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
         }
+        if content_hash:
+            file_info["contentHash"] = content_hash
+        return file_info
+
+    def get_dedupe_lookup(self, project_name, version_doc, anatomy):
+        """Prepare function finding published files by content hash.
+
+        Files of the last previous version of the subset are used as
+        source of identical files. Only files with stored content hash
+        can be found.
+
+        Arguments:
+            project_name (str): Project name.
+            version_doc (dict): Version which is being published.
+            anatomy (Anatomy): Project anatomy to fill roots of paths.
+
+        Returns:
+            Callable[[str, int], Union[str, None]]: Function returning path
+                to published file with the same content hash and size.
+        """
+
+        previous_version = None
+        for version in get_versions(
+            project_name,
+            subset_ids=[version_doc["parent"]],
+            fields=["_id", "name"]
+        ):
+            if version["name"] >= version_doc["name"]:
+                continue
+            if (
+                previous_version is None
+                or previous_version["name"] < version["name"]
+            ):
+                previous_version = version
+
+        published_by_hash = {}
+        if previous_version is not None:
+            for repre_doc in get_representations(
+                project_name,
+                version_ids=[previous_version["_id"]],
+                fields=["files"]
+            ):
+                for file_info in repre_doc.get("files") or []:
+                    content_hash = file_info.get("contentHash")
+                    if content_hash:
+                        published_by_hash[content_hash] = file_info
+
+        self.log.debug(
+            "Found {} published files with content hash for dedupe.".format(
+                len(published_by_hash)
+            )
+        )
+
+        def dedupe_lookup(content_hash, size):
+            file_info = published_by_hash.get(content_hash)
+            if not file_info or file_info.get("size") != size:
+                return None
+            path = anatomy.fill_root(file_info["path"])
+            if os.path.exists(path):
+                return path
+            return None
+
+        return dedupe_lookup
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
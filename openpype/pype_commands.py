@@ -375,3 +375,11 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def rebuild_last_version_index(self, project_name):
+        from openpype.client.operations import rebuild_last_version_index
+
+        count = rebuild_last_version_index(project_name)
+        print(">>> Indexed last versions of {} subsets in {}".format(
+            count, project_name
+        ))
@@ -17,8 +17,11 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - python 2
+        - long-lived process answering json requests from stdin
 """
 
+import sys
 import click
 import json
 from pathlib2 import Path
@@ -174,5 +177,51 @@ def _get_views_data(config_path):
     return data
 
 
+# Prefix of response lines so they can be distinguished from other output
+RESPONSE_PREFIX = "OCIO_RESPONSE:"
+
+_REQUEST_HANDLERS = {
+    "get_colorspace": _get_colorspace_data,
+    "get_views": _get_views_data,
+}
+
+
+@main.command(
+    name="serve",
+    help="Answer json requests from stdin until stdin is closed"
+)
+def serve():
+    """Long-lived process answering requests about configs.
+
+    Each line of stdin is json request with 'id', 'method' and 'params'.
+    Method is 'get_colorspace' or 'get_views' and params must contain
+    'config_path'. Response is printed to stdout as json line with
+    'RESPONSE_PREFIX' containing 'id' and 'result' or 'error'.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = {"id": None}
+        try:
+            request = json.loads(line)
+            response["id"] = request.get("id")
+            handler = _REQUEST_HANDLERS.get(request.get("method"))
+            if handler is None:
+                raise ValueError(
+                    f"Unknown method '{request.get('method')}'")
+            response["result"] = handler(request["params"]["config_path"])
+
+        except Exception as exc:
+            response["error"] = f"{exc.__class__.__name__}: {exc}"
+
+        sys.stdout.write(RESPONSE_PREFIX + json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
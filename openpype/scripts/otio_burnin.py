@@ -1,7 +1,6 @@
 import os
 import sys
 import subprocess
-import platform
 import json
 import tempfile
 from string import Formatter
@@ -13,11 +12,11 @@ from openpype.lib import (
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
     convert_ffprobe_fps_to_float,
+    get_ffprobe_data,
 )
 
 
 ffmpeg_path = get_ffmpeg_tool_path("ffmpeg")
-ffprobe_path = get_ffmpeg_tool_path("ffprobe")
 
 
 FFMPEG = (
@@ -43,31 +42,15 @@ SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 def _get_ffprobe_data(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
+
+    Uses shared (cached) ffprobe implementation from openpype lib.
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = [
-        ffprobe_path,
-        "-v", "quiet",
-        "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        source
-    ]
-    kwargs = {
-        "stdout": subprocess.PIPE,
-    }
-    if platform.system().lower() == "windows":
-        kwargs["creationflags"] = (
-            subprocess.CREATE_NEW_PROCESS_GROUP
-            | getattr(subprocess, "DETACHED_PROCESS", 0)
-            | getattr(subprocess, "CREATE_NO_WINDOW", 0)
-        )
-    proc = subprocess.Popen(command, **kwargs)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)
+    ffprobe_data = get_ffprobe_data(source)
+    if not ffprobe_data or "error" in ffprobe_data:
+        raise RuntimeError("Failed to get ffprobe data of: %s" % source)
+    return ffprobe_data
 
 
 class ModifiedBurnins(ffmpeg_burnins.Burnins):
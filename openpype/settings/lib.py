@@ -1,5 +1,7 @@
 import os
+import sys
 import json
+import time
 import functools
 import logging
 import platform
@@ -166,9 +168,11 @@ def save_studio_settings(data):
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
     old_data = get_system_settings()
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    new_data = apply_overrides(default_values, copy.deepcopy(data))
-    new_data_with_metadata = copy.deepcopy(new_data)
+    default_values = _get_default_settings_data()[SYSTEM_SETTINGS_KEY]
+    new_data_with_metadata = merge_overrides(
+        copy.deepcopy(default_values), copy.deepcopy(data)
+    )
+    new_data = copy.deepcopy(new_data_with_metadata)
     clear_metadata_from_settings(new_data)
 
     changes = calculate_changes(old_data, new_data)
@@ -186,6 +190,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    _RESOLVED_SETTINGS_CACHE.clear()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -213,19 +218,19 @@ def save_project_settings(project_name, overrides):
     # Notify Pype modules
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
+    default_values = _get_default_settings_data()[PROJECT_SETTINGS_KEY]
+    new_data = copy.deepcopy(default_values)
     if project_name:
         old_data = get_project_settings(project_name)
 
         studio_overrides = get_studio_project_settings_overrides()
-        studio_values = apply_overrides(default_values, studio_overrides)
-        clear_metadata_from_settings(studio_values)
-        new_data = apply_overrides(studio_values, copy.deepcopy(overrides))
+        new_data = merge_overrides(new_data, studio_overrides or {})
+        clear_metadata_from_settings(new_data)
 
     else:
         old_data = get_default_project_settings(exclude_locals=True)
-        new_data = apply_overrides(default_values, copy.deepcopy(overrides))
 
+    new_data = merge_overrides(new_data, copy.deepcopy(overrides))
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
 
@@ -246,6 +251,8 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    _RESOLVED_SETTINGS_CACHE.clear()
+    _clear_anatomy_cache(project_name)
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -274,19 +281,19 @@ def save_project_anatomy(project_name, anatomy_data):
     # Notify Pype modules
     from openpype.modules import ModulesManager, ISettingsChangeListener
 
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
+    default_values = _get_default_settings_data()[PROJECT_ANATOMY_KEY]
+    new_data = copy.deepcopy(default_values)
     if project_name:
         old_data = get_anatomy_settings(project_name)
 
         studio_overrides = get_studio_project_settings_overrides()
-        studio_values = apply_overrides(default_values, studio_overrides)
-        clear_metadata_from_settings(studio_values)
-        new_data = apply_overrides(studio_values, copy.deepcopy(anatomy_data))
+        new_data = merge_overrides(new_data, studio_overrides or {})
+        clear_metadata_from_settings(new_data)
 
     else:
         old_data = get_default_anatomy_settings(exclude_locals=True)
-        new_data = apply_overrides(default_values, copy.deepcopy(anatomy_data))
 
+    new_data = merge_overrides(new_data, copy.deepcopy(anatomy_data))
     new_data_with_metadata = copy.deepcopy(new_data)
     clear_metadata_from_settings(new_data)
 
@@ -308,6 +315,8 @@ def save_project_anatomy(project_name, anatomy_data):
 
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "anatomy")
     _SETTINGS_HANDLER.save_project_anatomy(project_name, anatomy_data)
+    _RESOLVED_SETTINGS_CACHE.clear()
+    _clear_anatomy_cache(project_name)
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -515,7 +524,25 @@ def clear_project_settings_overrides_for_version(
 
 @require_local_handler
 def save_local_settings(data):
-    return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    output = _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
+    _RESOLVED_SETTINGS_CACHE.clear()
+    _clear_anatomy_cache()
+    return output
+
+
+def _clear_anatomy_cache(project_name=None):
+    """Clear cache of Anatomy after settings affecting anatomy changed.
+
+    Args:
+        project_name (Optional[str]): Project which was changed. Cache of
+            all projects is cleared if not passed (e.g. default project
+            settings were changed).
+    """
+
+    # Anatomy is not imported if was not used in current process
+    anatomy_module = sys.modules.get("openpype.pipeline.anatomy")
+    if anatomy_module is not None:
+        anatomy_module.Anatomy.clear_cache(project_name)
 
 
 @require_local_handler
@@ -580,11 +607,10 @@ def _get_default_settings():
     return defaults
 
 
-def get_default_settings():
-    """Get default settings.
+def _get_default_settings_data():
+    """Cached default settings without copy.
 
-    Todo:
-        Cache loaded defaults.
+    Returned data must not be modified.
 
     Returns:
         dict: Loaded default settings.
@@ -592,7 +618,16 @@ def get_default_settings():
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
+
+
+def get_default_settings():
+    """Get default settings.
+
+    Returns:
+        dict: Copy of loaded default settings.
+    """
+    return copy.deepcopy(_get_default_settings_data())
 
 
 def load_json_file(fpath):
@@ -922,11 +957,145 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
+class ResolvedSettingsCache:
+    """Process-wide cache of settings with applied overrides.
+
+    Resolving of settings (defaults, studio and project overrides) is
+    expensive and settings are requested many times in single process.
+    Resolved values are reused for 'lifetime' seconds. When lifetime
+    expires, last saved information of used overrides is compared and
+    values are resolved again only if overrides were saved since then.
+    Local settings are not part of cached values.
+
+    Lifetime can be changed with 'OPENPYPE_SETTINGS_CACHE_LIFETIME'
+    environment variable. Cache is disabled when lifetime is '0'.
+    """
+
+    default_lifetime = 10
+
+    def __init__(self):
+        # Key -> (check time, stamp, value)
+        self._items = {}
+
+    @property
+    def lifetime(self):
+        value = os.environ.get("OPENPYPE_SETTINGS_CACHE_LIFETIME")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+        return self.default_lifetime
+
+    def clear(self):
+        self._items.clear()
+
+    def get_value(self, key, get_stamp, create_value):
+        """Get copy of cached value or create it.
+
+        Args:
+            key (tuple): Key of value.
+            get_stamp (Callable[[], tuple]): Returns information about
+                current state of overrides used for the value.
+            create_value (Callable[[], dict]): Resolves the value.
+
+        Returns:
+            dict[str, Any]: Copy of resolved value.
+        """
+
+        lifetime = self.lifetime
+        if lifetime <= 0:
+            return create_value()
+
+        now = time.time()
+        item = self._items.get(key)
+        if item is not None:
+            check_time, stamp, value = item
+            if now - check_time <= lifetime:
+                return copy.deepcopy(value)
+
+            # Overrides did not change since value was created
+            if get_stamp() == stamp:
+                self._items[key] = (now, stamp, value)
+                return copy.deepcopy(value)
+
+        stamp = get_stamp()
+        value = create_value()
+        self._items[key] = (now, stamp, value)
+        return copy.deepcopy(value)
+
+
+_RESOLVED_SETTINGS_CACHE = ResolvedSettingsCache()
+
+
+def clear_settings_cache():
+    """Clear cache of resolved settings in current process."""
+
+    _RESOLVED_SETTINGS_CACHE.clear()
+
+
+def _get_system_settings_stamp():
+    return (get_system_last_saved_info(), )
+
+
+def _get_project_settings_stamp(project_name):
+    return (
+        get_project_last_saved_info(None),
+        get_project_last_saved_info(project_name),
+    )
+
+
+def _get_cached_system_settings(clear_metadata=True, exclude_locals=None):
+    # Local settings can be saved by other process (or for other site)
+    #   without change of last saved info of studio overrides, so values are
+    #   cached without them and local settings are applied on each call
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    result = _RESOLVED_SETTINGS_CACHE.get_value(
+        (SYSTEM_SETTINGS_KEY, None, clear_metadata),
+        _get_system_settings_stamp,
+        functools.partial(_get_system_settings, clear_metadata, True)
+    )
+    if not exclude_locals:
+        local_settings = get_local_settings()
+        apply_local_settings_on_system_settings(result, local_settings)
+    return result
+
+
+def _get_cached_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    if not project_name:
+        return _get_project_settings(
+            project_name, clear_metadata, exclude_locals
+        )
+
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    result = _RESOLVED_SETTINGS_CACHE.get_value(
+        (PROJECT_SETTINGS_KEY, project_name, clear_metadata),
+        functools.partial(_get_project_settings_stamp, project_name),
+        functools.partial(
+            _get_project_settings, project_name, clear_metadata, True
+        )
+    )
+    if not exclude_locals:
+        local_settings = get_local_settings()
+        apply_local_settings_on_project_settings(
+            result, local_settings, project_name
+        )
+    return result
+
+
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
+    default_values = _get_default_settings_data()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    result = merge_overrides(
+        copy.deepcopy(default_values), studio_values or {}
+    )
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -947,9 +1116,11 @@ def _get_system_settings(clear_metadata=True, exclude_locals=None):
 
 def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
+    default_values = _get_default_settings_data()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    result = merge_overrides(
+        copy.deepcopy(default_values), studio_values or {}
+    )
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -968,10 +1139,12 @@ def get_default_project_settings(clear_metadata=True, exclude_locals=None):
 
 def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
+    default_values = _get_default_settings_data()[PROJECT_ANATOMY_KEY]
     studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
+    result = merge_overrides(
+        copy.deepcopy(default_values), studio_values or {}
+    )
     # Clear overrides metadata from settings
     if clear_metadata:
         clear_metadata_from_settings(result)
@@ -1002,7 +1175,8 @@ def get_anatomy_settings(
     project_overrides = get_project_anatomy_overrides(
         project_name
     )
-    result = copy.deepcopy(studio_overrides)
+    # Studio overrides are resolved for this call so they can be modified
+    result = studio_overrides
     if project_overrides:
         for key, value in project_overrides.items():
             result[key] = value
@@ -1039,7 +1213,8 @@ def _get_project_settings(
         project_name
     )
 
-    result = apply_overrides(studio_overrides, project_overrides)
+    # Studio overrides are resolved for this call so they can be modified
+    result = merge_overrides(studio_overrides, project_overrides or {})
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -1128,17 +1303,28 @@ def get_general_environments():
     return value["general"]["environment"]
 
 
+def _trace_phase(name):
+    # 'openpype.lib' imports settings so it can't be imported on module level
+    from openpype.lib.profiling import trace_phase
+
+    return trace_phase(name)
+
+
 def get_system_settings(*args, **kwargs):
-    if not AYON_SERVER_ENABLED:
-        return _get_system_settings(*args, **kwargs)
+    with _trace_phase("settings.system"):
+        if not AYON_SERVER_ENABLED:
+            return _get_cached_system_settings(*args, **kwargs)
 
-    default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    return get_ayon_system_settings(default_settings)
+        default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
+        return get_ayon_system_settings(default_settings)
 
 
 def get_project_settings(project_name, *args, **kwargs):
-    if not AYON_SERVER_ENABLED:
-        return _get_project_settings(project_name, *args, **kwargs)
+    with _trace_phase("settings.project"):
+        if not AYON_SERVER_ENABLED:
+            return _get_cached_project_settings(
+                project_name, *args, **kwargs
+            )
 
-    default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
-    return get_ayon_project_settings(default_settings, project_name)
+        default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
+        return get_ayon_project_settings(default_settings, project_name)
@@ -1,5 +1,6 @@
 import os
 import copy
+import time
 import logging
 import traceback
 import collections
@@ -7,6 +8,12 @@ import uuid
 import tempfile
 import shutil
 import inspect
+import threading
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    wait as wait_for_futures,
+)
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -64,6 +71,60 @@ class MainThreadItem:
         self.callback(*self.args, **self.kwargs)
 
 
+class ThreadLogRecords(logging.Handler):
+    """Collect log records of publish plugins processed in worker threads.
+
+    Pyblish adds its log handler to root logger only for time of processing
+    of one plugin which is not safe when more plugins are processed at the
+    same time. This handler is added to root logger once and collects
+    records of each worker thread separately.
+    """
+
+    def __init__(self):
+        super(ThreadLogRecords, self).__init__()
+        self._records_by_thread = {}
+        self._lock = threading.Lock()
+        self._root_level = None
+        self._attached = False
+
+    def attach(self):
+        if self._attached:
+            return
+        root_logger = logging.getLogger()
+        self._root_level = root_logger.level
+        root_logger.addHandler(self)
+        root_logger.setLevel(logging.DEBUG)
+        self._attached = True
+
+    def detach(self):
+        if not self._attached:
+            return
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self)
+        root_logger.setLevel(self._root_level)
+        self._attached = False
+
+    def start_thread(self):
+        """Start collecting records of current thread."""
+        with self._lock:
+            self._records_by_thread[threading.get_ident()] = []
+
+    def pop_thread_records(self):
+        """Stop collecting records of current thread and return them."""
+        with self._lock:
+            return self._records_by_thread.pop(threading.get_ident(), [])
+
+    def emit(self, record):
+        # Same filter as in pyblish 'MessageHandler'
+        if not record.name.startswith("pyblish"):
+            return
+
+        with self._lock:
+            records = self._records_by_thread.get(record.thread)
+            if records is not None:
+                records.append(record)
+
+
 class AssetDocsCache:
     """Cache asset documents for creation part."""
 
@@ -1694,6 +1755,13 @@ class PublisherController(BasePublisherController):
     """
 
     _log = None
+    # Maximum number of worker threads processing instances of plugins
+    #   marked with 'executable_in_thread' (cpu count if is 'None')
+    publish_thread_workers = None
+    # How long main thread waits for result of worker thread before
+    #   it gives control back to UI (in seconds). Main thread waits until
+    #   result is available if is 'None'.
+    publish_thread_wait_timeout = None
 
     def __init__(self, headless=False):
         super(PublisherController, self).__init__()
@@ -1729,6 +1797,10 @@ class PublisherController(BasePublisherController):
 
         # Plugin iterator
         self._main_thread_iter = None
+        # Worker threads for plugins executable in thread
+        self._publish_executor = None
+        self._publish_futures = []
+        self._thread_log_records = ThreadLogRecords()
 
         # State flags to prevent executing method which is already in progress
         self._resetting_plugins = False
@@ -2224,6 +2296,8 @@ class PublisherController(BasePublisherController):
 
     def _reset_publish(self):
         self._reset_attributes()
+        # Make sure plugins of previous publishing are not running
+        self._cancel_publish_futures(wait=True)
 
         self._publish_up_validation = False
         self._publish_comment_is_set = False
@@ -2298,6 +2372,10 @@ class PublisherController(BasePublisherController):
     def _stop_publish(self):
         """Stop or pause publishing."""
         self.publish_is_running = False
+        # Instances which are not processed by worker threads yet are
+        #   submitted again when publishing continues
+        for future in self._publish_futures:
+            future.cancel()
 
         self._emit_event("publish.process.stopped")
 
@@ -2434,10 +2512,22 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
                     continue
 
-                for instance in instances:
-                    if instance.data.get("publish") is False:
-                        continue
+                instances = [
+                    instance
+                    for instance in instances
+                    if instance.data.get("publish") is not False
+                ]
+                if (
+                    len(instances) > 1
+                    and getattr(plugin, "executable_in_thread", False)
+                ):
+                    for item in self._threaded_process_items(
+                        plugin, instances
+                    ):
+                        yield item
+                    continue
 
+                for instance in instances:
                     instance_label = (
                         instance.data.get("label")
                         or instance.data["name"]
@@ -2486,11 +2576,173 @@ class PublisherController(BasePublisherController):
             result["instance"]
         )
 
+    def _get_publish_executor(self):
+        if self._publish_executor is None:
+            max_workers = (
+                self.publish_thread_workers
+                or os.cpu_count()
+                or 1
+            )
+            self._publish_executor = ThreadPoolExecutor(
+                max_workers=max_workers
+            )
+        return self._publish_executor
+
+    def _cancel_publish_futures(self, wait=False):
+        """Cancel instances waiting for processing in worker threads.
+
+        Args:
+            wait (Optional[bool]): Wait until instances which are already
+                processed are finished.
+        """
+
+        futures = self._publish_futures
+        self._publish_futures = []
+        for future in futures:
+            future.cancel()
+
+        if wait and futures:
+            self.log.debug("Waiting for running publish plugins to finish")
+            wait_for_futures(futures)
+        self._thread_log_records.detach()
+
+    def _threaded_process_items(self, plugin, instances):
+        """Process instances of plugin in worker threads.
+
+        All instances are submitted at once. Results are handled in main
+        thread in order of instances so report and validation errors are
+        the same as if instances were processed one by one.
+
+        Args:
+            plugin (pyblish.api.Plugin): Plugin executable in thread.
+            instances (list[pyblish.api.Instance]): Instances to process.
+
+        Yields:
+            MainThreadItem: Items handling results of worker threads.
+        """
+
+        executor = self._get_publish_executor()
+        self._thread_log_records.attach()
+        self._publish_futures = [
+            executor.submit(self._process_in_thread, plugin, instance)
+            for instance in instances
+        ]
+        for idx, instance in enumerate(instances):
+            instance_label = (
+                instance.data.get("label")
+                or instance.data["name"]
+            )
+            self._emit_event(
+                "publish.process.instance.changed",
+                {"instance_label": instance_label}
+            )
+            yield MainThreadItem(
+                self._wait_for_thread_result, plugin, instance, idx
+            )
+        self._publish_futures = []
+        self._thread_log_records.detach()
+
+    def _process_in_thread(self, plugin, instance):
+        """Process plugin on instance in worker thread.
+
+        Same as 'pyblish.plugin.process' but pyblish signals are not
+        emitted and result is not added to context. That happens in main
+        thread in '_handle_thread_result'.
+        """
+
+        self._thread_log_records.start_thread()
+        result = {
+            "success": False,
+            "plugin": plugin,
+            "instance": instance,
+            "action": None,
+            "error": None,
+            "records": [],
+            "duration": None,
+            "progress": 0,
+            "context": self._publish_context,
+        }
+        start = time.time()
+        try:
+            plugin().process(instance)
+            result["success"] = True
+
+        except Exception as error:
+            pyblish.lib.extract_traceback(error, plugin.__module__)
+            result["error"] = error
+
+        result["duration"] = (time.time() - start) * 1000
+        result["records"] = self._thread_log_records.pop_thread_records()
+        return result
+
+    def _handle_thread_result(self, result):
+        """Do in main thread what 'pyblish.plugin.process' does."""
+
+        context = self._publish_context
+        error = result["error"]
+        if error is not None:
+            pyblish.lib.emit(
+                "pluginFailed",
+                plugin=result["plugin"],
+                context=context,
+                instance=result["instance"],
+                error=error
+            )
+        context.data.setdefault("results", []).append(result)
+        pyblish.lib.emit("pluginProcessed", result=result)
+
+    def _wait_for_thread_result(self, plugin, instance, idx):
+        future = self._publish_futures[idx]
+        if future.cancelled():
+            # Publishing was paused before the instance was processed
+            future = self._get_publish_executor().submit(
+                self._process_in_thread, plugin, instance
+            )
+            self._publish_futures[idx] = future
+
+        try:
+            result = future.result(
+                timeout=self.publish_thread_wait_timeout
+            )
+
+        except FutureTimeoutError:
+            # Give control back to UI and check the result later
+            self._process_main_thread_item(MainThreadItem(
+                self._wait_for_thread_result, plugin, instance, idx
+            ))
+            return
+
+        except Exception as exc:
+            # Errors of plugins are caught so this is unexpected
+            result = {
+                "success": False,
+                "plugin": plugin,
+                "instance": instance,
+                "action": None,
+                "error": exc,
+                "records": [],
+                "duration": 0,
+                "progress": 0,
+                "context": self._publish_context,
+            }
+
+        self._handle_thread_result(result)
+        self._handle_process_result(result)
+        if self.publish_has_crashed:
+            self._cancel_publish_futures()
+
+        self._publish_next_process()
+
     def _process_and_continue(self, plugin, instance):
         result = pyblish.plugin.process(
             plugin, self._publish_context, instance
         )
 
+        self._handle_process_result(result)
+
+        self._publish_next_process()
+
+    def _handle_process_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2516,8 +2768,6 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
-        self._publish_next_process()
-
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
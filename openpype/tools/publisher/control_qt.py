@@ -70,6 +70,9 @@ class MainThreadProcess(QtCore.QObject):
 
 
 class QtPublisherController(PublisherController):
+    # Check results of worker threads periodically to keep UI responsive
+    publish_thread_wait_timeout = 0.05
+
     def __init__(self, *args, **kwargs):
         self._main_thread_processor = MainThreadProcess()
 
@@ -1,4 +1,5 @@
 import re
+import time
 import logging
 
 from collections import defaultdict
@@ -8,11 +9,10 @@ import qtawesome
 
 from openpype.host import ILoadHost
 from openpype.client import (
-    get_asset_by_id,
-    get_subset_by_id,
-    get_version_by_id,
-    get_last_version_by_subset_id,
-    get_representation_by_id,
+    get_versions,
+    get_last_versions,
+    get_representations,
+    get_representations_parents,
 )
 from openpype.pipeline import (
     get_current_project_name,
@@ -30,6 +30,120 @@ from .lib import (
 )
 
 
+class InventoryEntitiesCache(object):
+    """Cache of representations and their parents used by inventory.
+
+    Entities of all containers are queried at once with constant number of
+    queries. Resolved entities are kept for 'lifetime' seconds so refresh of
+    inventory queries only representations which were not resolved yet.
+    """
+
+    lifetime = 60
+
+    def __init__(self):
+        self._project_name = None
+        # Representation id -> (cache time, repre, version, subset, asset)
+        self._items_by_repre_id = {}
+
+    def clear(self):
+        self._items_by_repre_id = {}
+
+    def get_entities(self, project_name, repre_ids):
+        """Representations and their parents by representation ids.
+
+        Args:
+            project_name (str): Project name.
+            repre_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, tuple]: Representation, version, subset and asset
+                by representation id. Entities which were not found
+                are 'None'.
+        """
+
+        if project_name != self._project_name:
+            self._project_name = project_name
+            self.clear()
+
+        now = time.time()
+        output = {}
+        missing_ids = set()
+        for repre_id in repre_ids:
+            item = self._items_by_repre_id.get(str(repre_id))
+            if item is None or (now - item[0]) > self.lifetime:
+                missing_ids.add(repre_id)
+            else:
+                output[repre_id] = item[1:]
+
+        if missing_ids:
+            entities_by_id = self._query_entities(project_name, missing_ids)
+            for repre_id in missing_ids:
+                entities = entities_by_id[str(repre_id)]
+                self._items_by_repre_id[str(repre_id)] = (now, ) + entities
+                output[repre_id] = entities
+        return output
+
+    def _query_entities(self, project_name, repre_ids):
+        output = {
+            str(repre_id): (None, None, None, None)
+            for repre_id in repre_ids
+        }
+        repre_docs = list(get_representations(
+            project_name, representation_ids=repre_ids, archived=True
+        ))
+        if not repre_docs:
+            return output
+
+        parents_by_repre_id = get_representations_parents(
+            project_name, repre_docs
+        )
+
+        # Hero versions use name and data of version they're pointing to
+        hero_version_docs = []
+        for parents in parents_by_repre_id.values():
+            version_doc = parents[0]
+            if (
+                version_doc
+                and version_doc["type"] == "hero_version"
+                and not isinstance(version_doc.get("name"), HeroVersionType)
+                and version_doc not in hero_version_docs
+            ):
+                hero_version_docs.append(version_doc)
+
+        if hero_version_docs:
+            version_docs_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name,
+                    version_ids={
+                        version_doc["version_id"]
+                        for version_doc in hero_version_docs
+                    },
+                    fields=["_id", "name", "data"]
+                )
+            }
+            for hero_version_doc in hero_version_docs:
+                version_doc = version_docs_by_id.get(
+                    hero_version_doc["version_id"]
+                )
+                if version_doc is None:
+                    continue
+                hero_version_doc["name"] = HeroVersionType(
+                    version_doc["name"]
+                )
+                hero_version_doc["data"] = version_doc["data"]
+
+        for repre_doc in repre_docs:
+            parents = parents_by_repre_id.get(repre_doc["_id"])
+            if not parents:
+                parents = (None, None, None)
+            version_doc, subset_doc, asset_doc = parents[:3]
+            output[str(repre_doc["_id"])] = (
+                repre_doc, version_doc, subset_doc, asset_doc
+            )
+        return output
+
+
 class InventoryModel(TreeModel):
     """The model for the inventory"""
 
@@ -49,6 +163,7 @@ class InventoryModel(TreeModel):
         self.family_config_cache = family_config_cache
 
         self._hierarchy_view = False
+        self._entities_cache = InventoryEntitiesCache()
 
         self._default_icon_color = get_default_entity_icon_color()
 
@@ -332,39 +447,30 @@ class InventoryModel(TreeModel):
         # Add to model
         not_found = defaultdict(list)
         not_found_ids = []
+        entities_by_repre_id = self._entities_cache.get_entities(
+            project_name, grouped.keys()
+        )
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
             # Get parenthood per group
-            representation = get_representation_by_id(
-                project_name, repre_id
+            representation, version, subset, asset = (
+                entities_by_repre_id[repre_id]
             )
             if not representation:
                 not_found["representation"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            version = get_version_by_id(
-                project_name, representation["parent"]
-            )
             if not version:
                 not_found["version"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            elif version["type"] == "hero_version":
-                _version = get_version_by_id(
-                    project_name, version["version_id"]
-                )
-                version["name"] = HeroVersionType(_version["name"])
-                version["data"] = _version["data"]
-
-            subset = get_subset_by_id(project_name, version["parent"])
             if not subset:
                 not_found["subset"].extend(group_items)
                 not_found_ids.append(repre_id)
                 continue
 
-            asset = get_asset_by_id(project_name, subset["parent"])
             if not asset:
                 not_found["asset"].extend(group_items)
                 not_found_ids.append(repre_id)
@@ -399,6 +505,18 @@ class InventoryModel(TreeModel):
                 item_node["isNotFound"] = True
                 self.add_child(item_node, parent=group_node)
 
+        # Store the highest available version so the model can know
+        #   whether current version is currently up-to-date.
+        # - last versions are always queried as they change with publishing
+        last_version_by_subset_id = get_last_versions(
+            project_name,
+            {
+                group_dict["version"]["parent"]
+                for group_dict in grouped.values()
+            },
+            fields=["_id", "parent", "name"]
+        )
+
         for repre_id, group_dict in sorted(grouped.items()):
             group_items = group_dict["items"]
             representation = grouped[repre_id]["representation"]
@@ -423,10 +541,8 @@ class InventoryModel(TreeModel):
             family = family_config.get("label", prim_family)
             family_icon = family_config.get("icon", None)
 
-            # Store the highest available version so the model can know
-            # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
+            highest_version = (
+                last_version_by_subset_id.get(version["parent"]) or version
             )
 
             # create the group header
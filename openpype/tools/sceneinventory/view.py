@@ -7,6 +7,7 @@ from qtpy import QtWidgets, QtCore
 import qtawesome
 
 from openpype.client import (
+    entity_cache_session,
     get_version_by_id,
     get_versions,
     get_hero_versions,
@@ -843,12 +844,28 @@ class SceneInventoryView(QtWidgets.QTreeView):
 
         # Trigger update to latest
         try:
-            for item, item_version in zip(items, versions):
-                try:
-                    update_container(item, item_version)
-                except AssertionError:
-                    self._show_version_error_dialog(item_version, [item])
-                    log.warning("Update failed", exc_info=True)
+            # Query representations and versions of all containers at once
+            #   instead of querying them for each container separately
+            with entity_cache_session() as cache:
+                project_name = legacy_io.active_project()
+                repre_ids = {item["representation"] for item in items}
+                repre_docs = cache.get_entities(
+                    project_name, "representation", repre_ids
+                )
+                cache.prefetch(
+                    project_name,
+                    version_ids={
+                        repre_doc["parent"]
+                        for repre_doc in repre_docs.values()
+                        if repre_doc
+                    }
+                )
+                for item, item_version in zip(items, versions):
+                    try:
+                        update_container(item, item_version)
+                    except AssertionError:
+                        self._show_version_error_dialog(item_version, [item])
+                        log.warning("Update failed", exc_info=True)
         finally:
             # Always update the scene inventory view, even if errors occurred
             self.data_changed.emit()
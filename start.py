@@ -96,6 +96,7 @@ Attributes:
 import os
 import re
 import sys
+import time
 import platform
 import traceback
 import subprocess
@@ -104,6 +105,11 @@ import distutils.spawn
 from pathlib import Path
 
 
+# Process start used for startup trace
+_START_TIME = time.time()
+# Timings of boot phases (name, start, duration) passed to startup trace
+_boot_phases = []
+
 silent_mode = False
 
 # OPENPYPE_ROOT is variable pointing to build (or code) directory
@@ -263,6 +269,12 @@ if "--use-staging" in sys.argv:
     sys.argv.remove("--use-staging")
     os.environ["OPENPYPE_USE_STAGING"] = "1"
 
+# Record timings of startup phases and imports to json trace
+if "--trace-startup" in sys.argv:
+    sys.argv.remove("--trace-startup")
+    if not os.getenv("OPENPYPE_STARTUP_TRACE"):
+        os.environ["OPENPYPE_STARTUP_TRACE"] = "1"
+
 import igniter  # noqa: E402
 from igniter import BootstrapRepos  # noqa: E402
 from igniter.tools import (
@@ -280,6 +292,38 @@ silent_commands = {"run", "igniter", "standalonepublisher",
                    "extractenvironments", "version"}
 
 
+def _add_boot_phase(name: str, start: float) -> float:
+    """Store duration of boot phase for startup trace.
+
+    Args:
+        name (str): Name of boot phase.
+        start (float): Start time of the phase.
+
+    Returns:
+        float: End time of the phase which can be used as start of next one.
+    """
+    end = time.time()
+    if os.getenv("OPENPYPE_STARTUP_TRACE"):
+        _boot_phases.append((name, start, end - start))
+    return end
+
+
+def _start_startup_trace():
+    """Pass boot phases to startup trace of OpenPype if is enabled."""
+    if not os.getenv("OPENPYPE_STARTUP_TRACE"):
+        return
+
+    from openpype.lib.profiling import get_startup_trace
+
+    trace = get_startup_trace()
+    if trace is None:
+        return
+
+    for name, start, duration in _boot_phases:
+        trace.add_event(name, "phase", start, duration)
+    trace.add_event("boot", "phase", _START_TIME, time.time() - _START_TIME)
+
+
 def list_versions(openpype_versions: list, local_version=None) -> None:
     """Print list of detected versions."""
     _print("  - Detected versions:")
@@ -977,10 +1021,13 @@ def boot():
     # ------------------------------------------------------------------------
     os.environ["OPENPYPE_ROOT"] = OPENPYPE_ROOT
 
+    phase_start = _add_boot_phase("boot.imports", _START_TIME)
+
     # ------------------------------------------------------------------------
     # Do necessary startup validations
     # ------------------------------------------------------------------------
     _startup_validations()
+    phase_start = _add_boot_phase("boot.startup_validations", phase_start)
 
     # ------------------------------------------------------------------------
     # Process arguments
@@ -1022,9 +1069,11 @@ def boot():
             os.environ["AVALON_DB"] = avalon_db + "_tests"
 
     global_settings = get_openpype_global_settings(openpype_mongo)
+    phase_start = _add_boot_phase("boot.global_settings", phase_start)
 
     _print(">>> run disk mapping command ...")
     run_disk_mapping_commands(global_settings)
+    phase_start = _add_boot_phase("boot.disk_mapping", phase_start)
 
     # Logging to server enabled/disabled
     log_to_server = global_settings.get("log_to_server", True)
@@ -1095,6 +1144,8 @@ def boot():
             _boot_handle_missing_version(local_version, str(exc))
             sys.exit(1)
 
+    phase_start = _add_boot_phase("boot.find_version", phase_start)
+
     # set this to point either to `python` from venv in case of live code
     # or to `openpype` or `openpype_console` in case of frozen code
     os.environ["OPENPYPE_EXECUTABLE"] = sys.executable
@@ -1123,6 +1174,7 @@ def boot():
     set_openpype_global_environments()
     _print("  - for modules ...")
     set_modules_environments()
+    _add_boot_phase("boot.environments", phase_start)
 
     assert version_path, "Version path not defined."
 
@@ -1147,6 +1199,8 @@ def boot():
         for i in info:
             t.echo(i)
 
+    _start_startup_trace()
+
     from openpype import cli
     try:
         cli.main(obj={}, prog_name="openpype")
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of OpenPype startup phases.
+
+Phases are measured against fixture studio settings so results don't depend
+on content of database. Each benchmark fails when the phase takes longer
+than its budget. Budgets can be multiplied with environment variable
+'OPENPYPE_BENCHMARK_FACTOR' for slower machines.
+
+Run with:
+    python start.py runtests tests/benchmarks
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+
+import pytest
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+OPENPYPE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)))
+
+# Imports cli in subprocess with fixture studio settings instead of
+#   database, path to settings is in 'OPENPYPE_BENCHMARK_SYSTEM_SETTINGS'
+CLI_IMPORT_SCRIPT = """
+import os
+import json
+from openpype.lib.profiling import get_startup_trace
+
+get_startup_trace()
+
+from openpype.settings import lib as settings_lib
+from openpype.modules import base as modules_base
+
+with open(os.environ["OPENPYPE_BENCHMARK_SYSTEM_SETTINGS"], "r") as stream:
+    overrides = json.load(stream)
+
+
+def get_overrides(return_version=False):
+    if return_version:
+        return overrides, None
+    return overrides
+
+
+settings_lib.get_studio_system_settings_overrides = get_overrides
+settings_lib.get_system_last_saved_info = lambda: None
+settings_lib.get_local_settings = lambda: {}
+modules_base.get_studio_system_settings_overrides = get_overrides
+
+import openpype.cli
+"""
+
+# Budgets in seconds
+CLI_IMPORT_BUDGET = 10.0
+SETTINGS_RESOLVE_BUDGET = 1.0
+MODULES_MANAGER_BUDGET = 5.0
+
+
+def _get_budget(value):
+    factor = float(os.environ.get("OPENPYPE_BENCHMARK_FACTOR") or 1)
+    return value * factor
+
+
+def _measure(func, repeat=3):
+    """Best time of multiple calls of function."""
+    durations = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        durations.append(time.time() - start)
+    return min(durations)
+
+
+@pytest.fixture(scope="module")
+def studio_system_settings():
+    path = os.path.join(FIXTURES_DIR, "studio_system_settings.json")
+    with open(path, "r") as stream:
+        return json.load(stream)
+
+
+@pytest.fixture
+def fixture_settings(monkeypatch, studio_system_settings):
+    """Use fixture studio settings instead of database."""
+    import copy
+    from openpype.settings import lib as settings_lib
+    from openpype.modules import base as modules_base
+
+    def _get_overrides(return_version=False):
+        value = copy.deepcopy(studio_system_settings)
+        if return_version:
+            return value, None
+        return value
+
+    monkeypatch.setattr(
+        settings_lib, "get_studio_system_settings_overrides", _get_overrides
+    )
+    monkeypatch.setattr(
+        modules_base, "get_studio_system_settings_overrides", _get_overrides
+    )
+    return studio_system_settings
+
+
+def test_cli_import_time(tmp_path):
+    """Import of OpenPype cli in fresh process with startup trace.
+
+    Fixture studio settings are used in the process so database is not
+    needed.
+    """
+    trace_path = tmp_path / "trace.json"
+    env = dict(os.environ)
+    env["OPENPYPE_STARTUP_TRACE"] = str(trace_path)
+    env["OPENPYPE_BENCHMARK_SYSTEM_SETTINGS"] = os.path.join(
+        FIXTURES_DIR, "studio_system_settings.json"
+    )
+    # Url must be set on import but database is not used
+    env.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+
+    start = time.time()
+    subprocess.check_call(
+        [sys.executable, "-c", CLI_IMPORT_SCRIPT],
+        cwd=OPENPYPE_ROOT,
+        env=env
+    )
+    duration = time.time() - start
+
+    with open(trace_path, "r") as stream:
+        trace = json.load(stream)
+
+    import_names = {
+        event["name"]
+        for event in trace["traceEvents"]
+        if event["cat"] == "import"
+    }
+    assert "openpype.cli" in import_names
+    assert duration < _get_budget(CLI_IMPORT_BUDGET), (
+        "Import of cli took {:.2f}s".format(duration)
+    )
+
+
+def test_settings_resolve_time(fixture_settings):
+    """Resolve system settings from defaults and studio overrides."""
+    from openpype.settings.lib import (
+        SYSTEM_SETTINGS_KEY,
+        load_openpype_default_settings,
+        apply_overrides,
+        clear_metadata_from_settings,
+    )
+
+    def _resolve():
+        defaults = load_openpype_default_settings()[SYSTEM_SETTINGS_KEY]
+        settings = apply_overrides(defaults, fixture_settings)
+        clear_metadata_from_settings(settings)
+        return settings
+
+    settings = _resolve()
+    assert settings["general"]["studio_code"] == "bench"
+
+    duration = _measure(_resolve)
+    assert duration < _get_budget(SETTINGS_RESOLVE_BUDGET), (
+        "Settings resolution took {:.2f}s".format(duration)
+    )
+
+
+def test_modules_manager_time(fixture_settings):
+    """Construction of ModulesManager with fixture system settings."""
+    from openpype.settings.lib import (
+        SYSTEM_SETTINGS_KEY,
+        load_openpype_default_settings,
+        apply_overrides,
+    )
+    from openpype.modules import ModulesManager
+
+    defaults = load_openpype_default_settings()[SYSTEM_SETTINGS_KEY]
+    system_settings = apply_overrides(defaults, fixture_settings)
+
+    start = time.time()
+    manager = ModulesManager(_system_settings=system_settings)
+    first_duration = time.time() - start
+
+    assert manager.get_enabled_module("ftrack") is not None
+
+    # Following managers reuse imported modules
+    duration = _measure(
+        lambda: ModulesManager(_system_settings=system_settings)
+    )
+    assert first_duration < _get_budget(MODULES_MANAGER_BUDGET), (
+        "First ModulesManager took {:.2f}s".format(first_duration)
+    )
+    assert duration < _get_budget(MODULES_MANAGER_BUDGET) / 5, (
+        "ModulesManager took {:.2f}s".format(duration)
+    )
@@ -0,0 +1,141 @@
+"""Local stand-in of Deadline Web Service for tests.
+
+Server runs in a thread on random free port and implements only endpoints
+used by OpenPype submissions. Submitted jobs are stored in memory.
+
+Example:
+    >>> with FakeDeadlineServer() as server:
+    ...     client = DeadlineClient(server.url)
+    ...     client.submit_job(payload)
+    ...     assert len(server.jobs) == 1
+"""
+import json
+import uuid
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _FakeDeadlineHandler(BaseHTTPRequestHandler):
+    server_version = "FakeDeadline/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def do_GET(self):
+        fake_server = self.server.fake_server
+        fake_server.register_request("GET", self.path)
+        if self.path.startswith("/api/pools"):
+            self._send_json(200, list(fake_server.pools))
+            return
+
+        if self.path.startswith("/api/jobs"):
+            self._send_json(200, list(fake_server.jobs))
+            return
+
+        self._send_json(404, {"error": "Unknown endpoint"})
+
+    def do_POST(self):
+        fake_server = self.server.fake_server
+        fake_server.register_request("POST", self.path)
+        payload = self._read_json()
+        if fake_server.consume_failure():
+            self._send_json(503, {"error": "Service unavailable"})
+            return
+
+        if self.path != "/api/jobs":
+            self._send_json(404, {"error": "Unknown endpoint"})
+            return
+
+        if not payload or "JobInfo" not in payload:
+            self._send_json(400, {"error": "Missing JobInfo"})
+            return
+
+        job = {
+            "_id": uuid.uuid4().hex,
+            "Props": payload["JobInfo"],
+            "PluginInfo": payload.get("PluginInfo", {}),
+            "AuxFiles": payload.get("AuxFiles", []),
+        }
+        fake_server.add_job(job)
+        self._send_json(200, job)
+
+
+class FakeDeadlineServer(object):
+    """Fake Deadline Web Service running in a thread.
+
+    Args:
+        pools (Optional[Iterable[str]]): Pool names returned by server.
+        fail_requests (Optional[int]): Number of first POST requests which
+            are answered with status 503.
+    """
+
+    def __init__(self, pools=None, fail_requests=0):
+        self.pools = list(pools or ["none"])
+        self.jobs = []
+        self.requests = []
+        self._fail_requests = fail_requests
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def register_request(self, method, path):
+        with self._lock:
+            self.requests.append((method, path))
+
+    def consume_failure(self):
+        with self._lock:
+            if self._fail_requests > 0:
+                self._fail_requests -= 1
+                return True
+        return False
+
+    def add_job(self, job):
+        with self._lock:
+            self.jobs.append(job)
+
+    def start(self):
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _FakeDeadlineHandler
+        )
+        self._server.daemon_threads = True
+        self._server.fake_server = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -12,6 +12,8 @@ import pytest
 
 from igniter.bootstrap_repos import BootstrapRepos
 from igniter.bootstrap_repos import OpenPypeVersion
+from igniter.bootstrap_repos import ValidationStampCache
+from igniter.bootstrap_repos import sha256sum
 from igniter.user_settings import OpenPypeSettingsRegistry
 
 
@@ -388,3 +390,28 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def test_validate_dir_with_stamp_cache(tmp_path):
+    """Test that validation stamp is used and invalidated."""
+    version_dir = tmp_path / "openpype-v3.0.0"
+    (version_dir / "openpype").mkdir(parents=True)
+    file_names = ["LICENSE", "openpype/__init__.py"]
+    for file_name in file_names:
+        (version_dir / file_name).write_text(file_name * 10)
+
+    (version_dir / "checksums").write_text("".join(
+        "{}:{}\n".format(sha256sum(str(version_dir / file_name)), file_name)
+        for file_name in file_names
+    ))
+
+    cache = ValidationStampCache(tmp_path / "stamps")
+    assert BootstrapRepos._validate_dir(version_dir, cache) == (
+        True, "All ok")
+    assert BootstrapRepos._validate_dir(version_dir, cache) == (
+        True, "All ok (cached)")
+
+    # Changed file must invalidate the stamp
+    (version_dir / "openpype/__init__.py").write_text("changed")
+    valid, _ = BootstrapRepos._validate_dir(version_dir, cache)
+    assert not valid
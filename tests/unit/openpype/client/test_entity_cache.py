@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Test suite for entity cache of client functions."""
+import types
+import threading
+
+from openpype.client import entity_cache
+from openpype.client.entity_cache import EntityCache, entity_cache_session
+
+
+def _fake_backend(calls):
+    versions = {
+        "v1": {"_id": "v1", "name": 1, "data": {"families": ["render"]}},
+        "v2": {"_id": "v2", "name": 2, "data": {"families": ["review"]}},
+    }
+
+    def get_versions(project_name, version_ids=None, hero=False):
+        calls.append(set(version_ids))
+        return [
+            versions[version_id]
+            for version_id in version_ids
+            if version_id in versions
+        ]
+
+    return types.SimpleNamespace(get_versions=get_versions)
+
+
+def test_prefetch_uses_single_query(monkeypatch):
+    calls = []
+    backend = _fake_backend(calls)
+    monkeypatch.setattr(entity_cache, "_get_backend", lambda: backend)
+
+    cache = EntityCache()
+    cache.prefetch("prj", version_ids=["v1", "v2", "v3"])
+    assert calls == [{"v1", "v2", "v3"}]
+
+    version = cache.get_entity("prj", "version", "v1", ["data.families"])
+    assert version == {"_id": "v1", "data": {"families": ["render"]}}
+    # Not existing entity is cached too
+    assert cache.get_entity("prj", "version", "v3") is None
+    assert len(calls) == 1
+
+    cache.invalidate("prj", ["v1"])
+    cache.get_entity("prj", "version", "v1")
+    assert calls[-1] == {"v1"}
+
+
+def test_cache_session_lru_limit(monkeypatch):
+    calls = []
+    backend = _fake_backend(calls)
+    monkeypatch.setattr(entity_cache, "_get_backend", lambda: backend)
+
+    with entity_cache_session(max_entities=1) as cache:
+        assert entity_cache.get_active_entity_cache() is cache
+        cache.get_entity("prj", "version", "v1")
+        cache.get_entity("prj", "version", "v2")
+        cache.get_entity("prj", "version", "v1")
+        assert len(calls) == 3
+
+        entity_cache.invalidate_entity_caches("prj")
+        cache.get_entity("prj", "version", "v1")
+        assert len(calls) == 4
+
+    assert entity_cache.get_active_entity_cache() is None
+
+
+def test_cache_session_is_thread_local(monkeypatch):
+    calls = []
+    backend = _fake_backend(calls)
+    monkeypatch.setattr(entity_cache, "_get_backend", lambda: backend)
+
+    result = {}
+
+    def _get_other_thread_cache():
+        result["cache"] = entity_cache.get_active_entity_cache()
+
+    with entity_cache_session() as cache:
+        cache.get_entity("prj", "version", "v1")
+        thread = threading.Thread(target=_get_other_thread_cache)
+        thread.start()
+        thread.join()
+        assert result["cache"] is None
+        assert entity_cache.get_active_entity_cache() is cache
+
+        # Invalidation from other thread affects the cache
+        thread = threading.Thread(
+            target=entity_cache.invalidate_entity_caches, args=("prj",)
+        )
+        thread.start()
+        thread.join()
+        cache.get_entity("prj", "version", "v1")
+        assert len(calls) == 2
+
+    assert entity_cache.get_active_entity_cache() is None
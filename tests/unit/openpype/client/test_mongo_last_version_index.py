@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Test suite for last version index maintained by operations session."""
+import mongomock
+import pytest
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+from openpype.client.mongo import entities, operations
+from openpype.client.mongo.entities import LAST_VERSION_INDEX_KEY
+from openpype.client.mongo.operations import (
+    MongoOperationsSession,
+    new_subset_document,
+    new_version_doc,
+    rebuild_last_version_index,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class _FakeCollection(object):
+    """Mongomock collection applying bulk writes one by one.
+
+    Bulk write of mongomock is not compatible with operations of all
+    pymongo versions.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, attr_name):
+        return getattr(self._collection, attr_name)
+
+    def bulk_write(self, requests):
+        for request in requests:
+            if isinstance(request, InsertOne):
+                self._collection.insert_one(request._doc)
+            elif isinstance(request, UpdateOne):
+                self._collection.update_one(request._filter, request._doc)
+            elif isinstance(request, DeleteOne):
+                self._collection.delete_one(request._filter)
+            else:
+                raise TypeError("Unknown request {}".format(request))
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    conn = _FakeCollection(mongomock.MongoClient()["avalon"][PROJECT_NAME])
+
+    def get_project_connection(project_name):
+        return conn
+
+    monkeypatch.setattr(
+        entities, "get_project_connection", get_project_connection
+    )
+    monkeypatch.setattr(
+        operations, "get_project_connection", get_project_connection
+    )
+    return conn
+
+
+def _create_subset(session, name="modelMain"):
+    subset_doc = new_subset_document(name, "model", ObjectId())
+    session.create_entity(PROJECT_NAME, "subset", subset_doc)
+    return subset_doc["_id"]
+
+
+def _create_version(session, subset_id, version):
+    version_doc = new_version_doc(version, subset_id)
+    session.create_entity(PROJECT_NAME, "version", version_doc)
+    return version_doc["_id"]
+
+
+def _get_index(collection, subset_id):
+    return collection.find_one({"_id": subset_id})[LAST_VERSION_INDEX_KEY]
+
+
+def test_subset_creation_is_indexed(collection):
+    session = MongoOperationsSession()
+    subset_id = _create_subset(session)
+    session.commit()
+    # Subset without versions has index set to 'None'
+    assert _get_index(collection, subset_id) is None
+
+    session = MongoOperationsSession()
+    other_subset_id = _create_subset(session, "modelOther")
+    version_id = _create_version(session, other_subset_id, 1)
+    session.commit()
+    assert _get_index(collection, other_subset_id) == {
+        "_id": version_id, "name": 1
+    }
+
+
+def test_version_create_delete_rename(collection):
+    session = MongoOperationsSession()
+    subset_id = _create_subset(session)
+    v1_id = _create_version(session, subset_id, 1)
+    session.commit()
+
+    session = MongoOperationsSession()
+    v2_id = _create_version(session, subset_id, 2)
+    session.commit()
+    assert _get_index(collection, subset_id) == {"_id": v2_id, "name": 2}
+
+    # Rename of older version to higher name
+    session = MongoOperationsSession()
+    session.update_entity(PROJECT_NAME, "version", v1_id, {"name": 3})
+    session.commit()
+    assert _get_index(collection, subset_id) == {"_id": v1_id, "name": 3}
+
+    session = MongoOperationsSession()
+    session.delete_entity(PROJECT_NAME, "version", v1_id)
+    session.commit()
+    assert _get_index(collection, subset_id) == {"_id": v2_id, "name": 2}
+
+    session = MongoOperationsSession()
+    session.delete_entity(PROJECT_NAME, "version", v2_id)
+    session.commit()
+    assert _get_index(collection, subset_id) is None
+
+
+def test_version_reparent(collection):
+    session = MongoOperationsSession()
+    src_subset_id = _create_subset(session, "modelSrc")
+    dst_subset_id = _create_subset(session, "modelDst")
+    v1_id = _create_version(session, src_subset_id, 1)
+    v2_id = _create_version(session, src_subset_id, 2)
+    _create_version(session, dst_subset_id, 1)
+    session.commit()
+
+    session = MongoOperationsSession()
+    session.update_entity(
+        PROJECT_NAME, "version", v2_id, {"parent": dst_subset_id}
+    )
+    session.commit()
+    assert _get_index(collection, src_subset_id) == {"_id": v1_id, "name": 1}
+    assert _get_index(collection, dst_subset_id) == {"_id": v2_id, "name": 2}
+
+
+def test_created_version_does_not_overwrite_newer(collection):
+    session = MongoOperationsSession()
+    subset_id = _create_subset(session)
+    _create_version(session, subset_id, 1)
+    session.commit()
+
+    # Other process already indexed newer version
+    newer_index = {"_id": ObjectId(), "name": 10}
+    collection.update_one(
+        {"_id": subset_id}, {"$set": {LAST_VERSION_INDEX_KEY: newer_index}}
+    )
+    version_id = ObjectId()
+    collection.insert_one(new_version_doc(2, subset_id, entity_id=version_id))
+
+    operations._update_last_version_index(PROJECT_NAME, {subset_id}, set())
+    assert _get_index(collection, subset_id) == newer_index
+
+    # Changed subsets are always overwritten
+    operations._update_last_version_index(PROJECT_NAME, set(), {subset_id})
+    assert _get_index(collection, subset_id) == {"_id": version_id, "name": 2}
+
+
+def test_index_changes_of_operations(collection):
+    subset_id = ObjectId()
+    other_subset_id = ObjectId()
+    version_id = ObjectId()
+    collection.insert_one(new_version_doc(1, subset_id, entity_id=version_id))
+
+    ops = [
+        operations.MongoCreateOperation(
+            PROJECT_NAME, "version", new_version_doc(2, subset_id)
+        ),
+        operations.MongoCreateOperation(
+            PROJECT_NAME, "version", new_version_doc(1, other_subset_id)
+        ),
+        # Update of other keys than name and parent does not change index
+        operations.MongoUpdateOperation(
+            PROJECT_NAME, "version", version_id, {"data": {}}
+        ),
+    ]
+    created_ids, changed_ids = operations._get_last_version_index_changes(
+        PROJECT_NAME, ops
+    )
+    assert created_ids == {subset_id, other_subset_id}
+    assert changed_ids == set()
+
+    ops.append(operations.MongoDeleteOperation(
+        PROJECT_NAME, "version", version_id
+    ))
+    created_ids, changed_ids = operations._get_last_version_index_changes(
+        PROJECT_NAME, ops
+    )
+    assert created_ids == {other_subset_id}
+    assert changed_ids == {subset_id}
+
+
+def test_rebuild_last_version_index(collection):
+    subset_ids = [ObjectId(), ObjectId()]
+    for subset_id in subset_ids:
+        collection.insert_one(
+            new_subset_document("model", "model", ObjectId(), None, subset_id)
+        )
+    version_id = ObjectId()
+    collection.insert_many([
+        new_version_doc(1, subset_ids[0]),
+        new_version_doc(4, subset_ids[0], entity_id=version_id),
+    ])
+
+    assert rebuild_last_version_index(PROJECT_NAME, batch_size=1) == 2
+    assert _get_index(collection, subset_ids[0]) == {
+        "_id": version_id, "name": 4
+    }
+    assert _get_index(collection, subset_ids[1]) is None
+
+
+def test_last_versions_info_uses_index(collection):
+    indexed_id = ObjectId()
+    not_indexed_id = ObjectId()
+    indexed_info = {"_id": ObjectId(), "name": 7}
+    subset_doc = new_subset_document("model", "model", ObjectId(), None,
+                                     indexed_id)
+    subset_doc[LAST_VERSION_INDEX_KEY] = indexed_info
+    collection.insert_many([
+        subset_doc,
+        new_subset_document("look", "look", ObjectId(), None, not_indexed_id),
+    ])
+    version_id = ObjectId()
+    collection.insert_many([
+        new_version_doc(1, indexed_id),
+        new_version_doc(3, not_indexed_id, entity_id=version_id),
+    ])
+
+    output = entities._get_last_versions_info(
+        collection, [indexed_id, not_indexed_id], None
+    )
+    assert output == {
+        indexed_id: indexed_info,
+        not_indexed_id: {"_id": version_id, "name": 3},
+    }
+
+    # Index is not used with active filter
+    output = entities._get_last_versions_info(collection, [indexed_id], True)
+    assert output[indexed_id]["name"] == 1
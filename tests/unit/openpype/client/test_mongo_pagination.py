@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Test suite for keyset pagination of mongo entity functions."""
+import mongomock
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    conn = mongomock.MongoClient()["avalon"]["test_project"]
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda project_name: conn
+    )
+    return conn
+
+
+def _insert_versions(collection, count):
+    version_ids = [ObjectId() for _ in range(count)]
+    collection.insert_many([
+        {
+            "_id": version_id,
+            "type": "version",
+            "name": idx + 1,
+            "parent": ObjectId(),
+        }
+        for idx, version_id in enumerate(version_ids)
+    ])
+    return sorted(version_ids)
+
+
+def test_page_token_filter_with_ids_filter():
+    version_ids = [ObjectId() for _ in range(3)]
+    query_filter = {"type": "version", "_id": {"$in": version_ids}}
+    output = entities._add_page_token_filter(
+        query_filter, str(version_ids[0])
+    )
+    assert output == {
+        "type": "version",
+        "_id": {"$in": version_ids, "$gt": version_ids[0]},
+    }
+    # Original filter is not modified
+    assert query_filter["_id"] == {"$in": version_ids}
+
+
+def test_page_token_filter_with_scalar_id():
+    version_id = ObjectId()
+    token_id = ObjectId()
+    query_filter = {"_id": version_id}
+    output = entities._add_page_token_filter(query_filter, str(token_id))
+    assert output == {"$and": [query_filter, {"_id": {"$gt": token_id}}]}
+
+    assert entities._add_page_token_filter(query_filter, None) is query_filter
+
+
+def test_versions_pages_resume_from_token(collection):
+    version_ids = _insert_versions(collection, 5)
+
+    docs, page_token = entities.get_versions_page(
+        "test_project", page_size=2
+    )
+    assert [doc["_id"] for doc in docs] == version_ids[:2]
+    assert page_token == str(version_ids[1])
+
+    docs, page_token = entities.get_versions_page(
+        "test_project", page_size=2, page_token=page_token
+    )
+    assert [doc["_id"] for doc in docs] == version_ids[2:4]
+
+    # Resume iteration from token of second page
+    resumed_ids = [
+        doc["_id"]
+        for doc in entities.iter_versions(
+            "test_project", batch_size=2, page_token=page_token
+        )
+    ]
+    assert resumed_ids == version_ids[4:]
+
+
+def test_iter_versions_with_ids_filter(collection):
+    version_ids = _insert_versions(collection, 6)
+    filtered_ids = version_ids[1::2]
+
+    docs = list(entities.iter_versions(
+        "test_project",
+        version_ids=[str(version_id) for version_id in filtered_ids],
+        fields=["name"],
+        batch_size=2
+    ))
+    assert [doc["_id"] for doc in docs] == filtered_ids
+    assert all(set(doc.keys()) == {"_id", "name"} for doc in docs)
@@ -0,0 +1,120 @@
+import os
+import hashlib
+
+import pytest
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+from openpype.lib.media_info_cache import MediaInfoCache
+
+CONTENT = b"published content"
+CONTENT_HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def media_info_cache(monkeypatch):
+    cache = MediaInfoCache(None)
+    monkeypatch.setattr(
+        file_transaction, "get_media_info_cache", lambda: cache
+    )
+    return cache
+
+
+@pytest.fixture
+def src_path(tmp_path):
+    filepath = tmp_path / "work" / "source.exr"
+    filepath.parent.mkdir()
+    filepath.write_bytes(CONTENT)
+    return str(filepath)
+
+
+@pytest.fixture
+def published_path(tmp_path):
+    filepath = tmp_path / "publish" / "v001" / "source.exr"
+    filepath.parent.mkdir(parents=True)
+    filepath.write_bytes(CONTENT)
+    return str(filepath)
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("Source file must not be read again")
+
+
+def test_hash_during_copy(tmp_path, monkeypatch, media_info_cache, src_path):
+    monkeypatch.setattr(file_transaction, "get_file_content_hash", _fail)
+    dst = str(tmp_path / "publish" / "v002" / "source.exr")
+
+    transaction = FileTransaction(hash_content=True)
+    transaction.add(src_path, dst)
+    transaction.process()
+
+    with open(dst, "rb") as stream:
+        assert stream.read() == CONTENT
+    assert transaction.content_hashes == {dst: CONTENT_HASH}
+
+    key = media_info_cache.get_key("content_hash", src_path)
+    assert media_info_cache.get(key) == CONTENT_HASH
+
+
+def test_dedupe_replaces_copy_with_hardlink(
+    tmp_path, monkeypatch, media_info_cache, src_path, published_path
+):
+    monkeypatch.setattr(file_transaction, "get_file_content_hash", _fail)
+    dst = str(tmp_path / "publish" / "v002" / "source.exr")
+    lookups = []
+
+    def _lookup(content_hash, size):
+        lookups.append((content_hash, size))
+        return published_path
+
+    transaction = FileTransaction(dedupe_lookup=_lookup)
+    transaction.add(src_path, dst)
+    transaction.process()
+
+    assert lookups == [(CONTENT_HASH, len(CONTENT))]
+    assert os.path.samefile(dst, published_path)
+    assert transaction.metrics["deduplicated"] == 1
+    assert not [
+        filename
+        for filename in os.listdir(os.path.dirname(dst))
+        if filename.endswith(".tmp")
+    ]
+
+
+def test_dedupe_with_cached_hash_does_not_copy(
+    tmp_path, monkeypatch, media_info_cache, src_path, published_path
+):
+    key = media_info_cache.get_key("content_hash", src_path)
+    media_info_cache.set(key, CONTENT_HASH)
+    monkeypatch.setattr(file_transaction, "get_file_content_hash", _fail)
+    monkeypatch.setattr(
+        file_transaction, "copy_file_with_content_hash", _fail
+    )
+    monkeypatch.setattr(file_transaction, "copyfile", _fail)
+    dst = str(tmp_path / "publish" / "v002" / "source.exr")
+
+    transaction = FileTransaction(
+        dedupe_lookup=lambda content_hash, size: published_path
+    )
+    transaction.add(src_path, dst)
+    transaction.process()
+
+    assert os.path.samefile(dst, published_path)
+    assert transaction.content_hashes == {dst: CONTENT_HASH}
+
+
+def test_dedupe_without_match_copies(
+    tmp_path, media_info_cache, src_path
+):
+    dst = str(tmp_path / "publish" / "v002" / "source.exr")
+
+    transaction = FileTransaction(
+        dedupe_lookup=lambda content_hash, size: None
+    )
+    transaction.add(src_path, dst)
+    transaction.process()
+
+    assert not os.path.samefile(dst, src_path)
+    with open(dst, "rb") as stream:
+        assert stream.read() == CONTENT
+    assert transaction.metrics["deduplicated"] == 0
@@ -0,0 +1,69 @@
+import json
+
+from openpype.lib.media_info_cache import MediaInfoCache
+from openpype.lib.transcoding import _is_valid_ffprobe_output
+
+
+def _create_file(tmp_path, name="input.mov"):
+    filepath = tmp_path / name
+    filepath.write_bytes(b"content")
+    return str(filepath)
+
+
+def test_value_is_cached(tmp_path):
+    cache = MediaInfoCache(str(tmp_path / "cache"))
+    filepath = _create_file(tmp_path)
+    calls = []
+
+    def _func():
+        calls.append(1)
+        return "output"
+
+    assert cache.get_or_create("ffprobe", filepath, _func) == "output"
+    assert cache.get_or_create("ffprobe", filepath, _func) == "output"
+    assert len(calls) == 1
+
+    # Other process reads value from disk
+    other_cache = MediaInfoCache(str(tmp_path / "cache"))
+    assert other_cache.get_or_create("ffprobe", filepath, _func) == "output"
+    assert len(calls) == 1
+
+
+def test_invalid_value_is_not_cached(tmp_path):
+    cache = MediaInfoCache(str(tmp_path / "cache"))
+    filepath = _create_file(tmp_path)
+    error_output = json.dumps({"error": {"code": -1094995529}})
+    calls = []
+
+    def _func():
+        calls.append(1)
+        return error_output
+
+    for _ in range(2):
+        output = cache.get_or_create(
+            "ffprobe", filepath, _func, is_valid=_is_valid_ffprobe_output
+        )
+        assert output == error_output
+    assert len(calls) == 2
+
+    other_cache = MediaInfoCache(str(tmp_path / "cache"))
+    key = other_cache.get_key("ffprobe", filepath)
+    assert other_cache.get(key) is None
+
+
+def test_is_valid_ffprobe_output():
+    assert _is_valid_ffprobe_output(json.dumps({"streams": []}))
+    assert not _is_valid_ffprobe_output(json.dumps({"error": {}}))
+    assert not _is_valid_ffprobe_output("not json")
+
+
+def test_changed_file_is_not_served_from_cache(tmp_path):
+    cache = MediaInfoCache(None)
+    filepath = _create_file(tmp_path)
+    cache.get_or_create("oiio_info", filepath, lambda: "first")
+
+    with open(filepath, "ab") as stream:
+        stream.write(b"more content")
+
+    value = cache.get_or_create("oiio_info", filepath, lambda: "second")
+    assert value == "second"
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates."""
+from openpype.lib.path_templates import StringTemplate, TemplatesDict
+
+
+def test_format_many_matches_format():
+    template = StringTemplate(
+        "{root[work]}/{project[name]}/{asset}<_{variant}>/{frame:0>4}.exr"
+    )
+    data_items = [
+        {
+            "root": {"work": "/mnt/work"},
+            "project": {"name": "prj"},
+            "asset": "sh010",
+            "frame": frame
+        }
+        for frame in range(1001, 1011)
+    ]
+    data_items[3]["variant"] = "main"
+
+    results = template.format_many(data_items)
+
+    assert len(results) == len(data_items)
+    for data, result in zip(data_items, results):
+        expected = template.format(data)
+        assert str(result) == str(expected)
+        assert result.solved == expected.solved
+        assert result.used_values == expected.used_values
+    assert results[3] == "/mnt/work/prj/sh010_main/1004.exr"
+
+
+def test_format_many_missing_keys():
+    template = StringTemplate("{asset}/{frame:0>4}")
+    results = template.format_many([{"asset": "sh010"}, {"frame": 1}])
+
+    assert not results[0].solved
+    assert results[0].missing_keys == ["frame"]
+    assert results[1].missing_keys == ["asset"]
+
+
+def test_compiled_template_is_shared():
+    first = StringTemplate("{asset}/{subset}")
+    second = StringTemplate("{asset}/{subset}")
+
+    assert first._parts is second._parts
+
+
+def test_templates_dict_format_many():
+    templates = TemplatesDict({
+        "publish": {
+            "folder": "{project[name]}/{asset}",
+            "file": "{asset}.{frame:0>4}.exr"
+        }
+    })
+    data_items = [
+        {"project": {"name": "prj"}, "asset": "sh010", "frame": frame}
+        for frame in (1, 2)
+    ]
+
+    results = templates.format_many(data_items)
+
+    assert results[0]["publish"]["folder"] == "prj/sh010"
+    assert results[1]["publish"]["file"] == "sh010.0002.exr"
@@ -0,0 +1,124 @@
+"""Test Deadline client against fake Deadline Web Service."""
+import socket
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
+
+from openpype.modules.deadline import deadline_client
+from openpype.modules.deadline.deadline_client import DeadlineClient
+from tests.lib.fake_deadline import FakeDeadlineServer
+
+
+def _get_payload(name):
+    return {
+        "JobInfo": {"Name": name, "Plugin": "MayaBatch"},
+        "PluginInfo": {},
+        "AuxFiles": []
+    }
+
+
+@pytest.fixture
+def fake_deadline():
+    with FakeDeadlineServer(pools=["none", "render"]) as server:
+        yield server
+
+
+def test_get_pools(fake_deadline):
+    client = DeadlineClient(fake_deadline.url)
+    response = client.get("/api/pools?NamesOnly=true")
+
+    assert response.ok
+    assert response.json() == ["none", "render"]
+
+
+def test_submit_jobs_keeps_order(fake_deadline):
+    client = DeadlineClient(fake_deadline.url, max_workers=4)
+    payloads = [_get_payload("frame {}".format(idx)) for idx in range(20)]
+
+    responses = client.submit_jobs(payloads)
+
+    assert len(fake_deadline.jobs) == 20
+    names = [response.json()["Props"]["Name"] for response in responses]
+    assert names == ["frame {}".format(idx) for idx in range(20)]
+
+
+def test_retry_unavailable_service():
+    with FakeDeadlineServer(fail_requests=2) as server:
+        client = DeadlineClient(server.url, retries=3, backoff=0)
+        response = client.submit_job(_get_payload("retried"))
+
+        assert response.ok
+        assert len(server.jobs) == 1
+        assert len(server.requests) == 3
+
+
+def test_retries_exhausted():
+    with FakeDeadlineServer(fail_requests=5) as server:
+        client = DeadlineClient(server.url, retries=1, backoff=0)
+        response = client.submit_job(_get_payload("failed"))
+
+        assert response.status_code == 503
+        assert not server.jobs
+
+
+def _get_closed_port_url():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return "http://127.0.0.1:{}".format(port)
+
+
+def _count_requests(monkeypatch, client):
+    calls = []
+    request = client.session.request
+
+    def _request(method, url, **kwargs):
+        calls.append(method)
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(client.session, "request", _request)
+    return calls
+
+
+def test_post_retried_on_refused_connection(monkeypatch):
+    client = DeadlineClient(_get_closed_port_url(), retries=2, backoff=0)
+    calls = _count_requests(monkeypatch, client)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.submit_job(_get_payload("refused"))
+    assert len(calls) == 3
+
+
+def test_post_not_retried_after_sent(monkeypatch, fake_deadline):
+    client = DeadlineClient(fake_deadline.url, retries=2, backoff=0)
+    calls = []
+
+    def _request(method, url, **kwargs):
+        calls.append(method)
+        raise requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.")
+        )
+
+    monkeypatch.setattr(client.session, "request", _request)
+
+    # Server might have created the job so POST is not repeated
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.submit_job(_get_payload("aborted"))
+    assert calls == ["POST"]
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("/api/pools")
+    assert calls == ["POST", "GET", "GET", "GET"]
+
+
+def test_ssl_verification_default(monkeypatch):
+    monkeypatch.delenv("OPENPYPE_DONT_VERIFY_SSL", raising=False)
+    assert deadline_client._get_default_verify() is False
+
+    monkeypatch.setenv("OPENPYPE_DONT_VERIFY_SSL", "1")
+    assert deadline_client._get_default_verify() is False
+
+    monkeypatch.setenv("OPENPYPE_DONT_VERIFY_SSL", "")
+    assert deadline_client._get_default_verify() is True
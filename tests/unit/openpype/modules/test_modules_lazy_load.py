@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import types
+import logging
+import importlib
+
+import pytest
+
+from openpype.modules.interfaces import IPluginPaths
+from openpype.modules.base import (
+    OpenPypeModule,
+    ModulesManager,
+    _ModuleClass,
+    _ModulesByName,
+    _LazyModulesFinder,
+    _ModulesManifest,
+    _get_module_class_manifest_info,
+)
+
+MODULES_KEY = "fake_openpype_modules"
+
+
+@pytest.fixture
+def fake_modules():
+    openpype_modules = _ModuleClass(MODULES_KEY)
+    finder = _LazyModulesFinder(MODULES_KEY)
+    sys.modules[MODULES_KEY] = openpype_modules
+    sys.meta_path.insert(0, finder)
+    try:
+        yield openpype_modules
+    finally:
+        sys.meta_path.remove(finder)
+        for name in tuple(sys.modules.keys()):
+            if name == MODULES_KEY or name.startswith(MODULES_KEY + "."):
+                sys.modules.pop(name)
+
+
+def _register_json_module(openpype_modules, loaded):
+    def _loader():
+        loaded.append("js")
+        sys.modules["{}.js".format(MODULES_KEY)] = json
+        setattr(openpype_modules, "js", json)
+
+    openpype_modules.set_lazy("js", _loader)
+
+
+def test_module_is_loaded_on_first_access(fake_modules):
+    loaded = []
+    _register_json_module(fake_modules, loaded)
+
+    assert "js" in fake_modules.keys()
+    assert fake_modules.is_lazy("js")
+    assert not loaded
+
+    assert fake_modules.js is json
+    assert fake_modules.get("js") is json
+    assert loaded == ["js"]
+    assert not fake_modules.is_lazy("js")
+
+
+def test_import_keeps_original_spec(fake_modules):
+    loaded = []
+    _register_json_module(fake_modules, loaded)
+
+    module = importlib.import_module("{}.js".format(MODULES_KEY))
+
+    assert module is json
+    assert loaded == ["js"]
+    assert json.__spec__.name == "json"
+    assert importlib.reload(json) is json
+
+
+def _create_module_dir(tmp_path):
+    module_dir = tmp_path / "my_module"
+    module_dir.mkdir()
+    (module_dir / "__init__.py").write_text("")
+    module_py = module_dir / "module.py"
+    module_py.write_text("")
+    return str(module_dir), str(module_py)
+
+
+def test_manifest_is_stored_to_disk(tmp_path):
+    module_dir, _ = _create_module_dir(tmp_path)
+    manifest_path = str(tmp_path / "manifest.json")
+    info = {"module_classes": ["MyModule"], "settings_defs": []}
+
+    manifest = _ModulesManifest(manifest_path)
+    assert manifest.get(module_dir) is None
+    manifest.set(module_dir, info)
+    manifest.save()
+
+    assert _ModulesManifest(manifest_path).get(module_dir) == info
+
+
+def test_manifest_is_invalidated_by_change_of_file(tmp_path):
+    module_dir, module_py = _create_module_dir(tmp_path)
+    manifest_path = str(tmp_path / "manifest.json")
+    info = {"module_classes": ["MyModule"], "settings_defs": []}
+
+    manifest = _ModulesManifest(manifest_path)
+    manifest.set(module_dir, info)
+    manifest.save()
+
+    mtime = os.path.getmtime(module_py) + 10
+    os.utime(module_py, (mtime, mtime))
+
+    assert _ModulesManifest(manifest_path).get(module_dir) is None
+
+
+def test_manifest_with_other_version_is_ignored(tmp_path):
+    module_dir, _ = _create_module_dir(tmp_path)
+    manifest_path = str(tmp_path / "manifest.json")
+    manifest = _ModulesManifest(manifest_path)
+    manifest.set(module_dir, {"module_classes": [], "settings_defs": []})
+    manifest.save()
+
+    with open(manifest_path, "r") as stream:
+        data = json.load(stream)
+    data["version"] = _ModulesManifest.version + 1
+    with open(manifest_path, "w") as stream:
+        json.dump(data, stream)
+
+    assert _ModulesManifest(manifest_path).get(module_dir) is None
+
+
+class _FakeModule(OpenPypeModule, IPluginPaths):
+    name = "fake_module"
+    settings_key = "fake"
+
+    def initialize(self, modules_settings):
+        self.enabled = modules_settings[self.settings_key]["enabled"]
+
+    def get_plugin_paths(self):
+        return {}
+
+    def get_publish_plugin_paths(self, host_name):
+        return []
+
+
+def _create_manager(modules_settings):
+    manager = ModulesManager.__new__(ModulesManager)
+    manager.log = logging.getLogger("test")
+    manager.modules = []
+    manager.modules_by_id = {}
+    manager.modules_by_name = _ModulesByName(manager)
+    manager._skipped_modules = {}
+    manager._modules_settings = modules_settings
+    return manager
+
+
+def test_manifest_info_of_module_class():
+    info = _get_module_class_manifest_info(_FakeModule)
+
+    assert info["class_name"] == "_FakeModule"
+    assert info["name"] == "fake_module"
+    assert info["settings_key"] == "fake"
+    assert "IPluginPaths" in info["interfaces"]
+    assert info["plugin_paths"] == [
+        "get_plugin_paths", "get_publish_plugin_paths"
+    ]
+
+
+def test_disabled_module_is_initialized_on_access(monkeypatch):
+    fake_module = types.ModuleType("fake_module_py")
+    fake_module._FakeModule = _FakeModule
+    openpype_modules = _ModuleClass("openpype_modules")
+    setattr(openpype_modules, "fake_module_py", fake_module)
+    monkeypatch.setitem(sys.modules, "openpype_modules", openpype_modules)
+
+    info = {"module_classes": [
+        _get_module_class_manifest_info(_FakeModule)
+    ]}
+    enabled_manager = _create_manager({"fake": {"enabled": True}})
+    assert not enabled_manager._skip_disabled_module(
+        enabled_manager._modules_settings, "fake_module_py", info
+    )
+
+    manager = _create_manager({"fake": {"enabled": False}})
+    assert manager._skip_disabled_module(
+        manager._modules_settings, "fake_module_py", info
+    )
+    assert not manager.modules
+    assert "fake_module" in manager.modules_by_name
+
+    module = manager.modules_by_name["fake_module"]
+    assert isinstance(module, _FakeModule)
+    assert not module.enabled
+    assert manager.modules == [module]
+    assert manager.get("missing_module") is None
@@ -0,0 +1,50 @@
+import sys
+import subprocess
+
+import pytest
+
+from openpype.pipeline import colorspace
+
+
+class _HangingWorker(colorspace.OCIOQueryWorker):
+    response_timeout = 0.5
+
+    def start(self):
+        # Process which never responds
+        self._process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True
+        )
+        self.last_process = self._process
+        self._start_output_reader()
+
+
+def test_worker_is_killed_on_timeout():
+    worker = _HangingWorker()
+    with pytest.raises(RuntimeError):
+        worker.query("get_views", "config.ocio")
+
+    worker.last_process.wait(timeout=5)
+    assert not worker.is_running()
+
+
+def test_fallback_to_single_use_process(monkeypatch):
+    worker = _HangingWorker()
+    monkeypatch.setattr(colorspace.CashedData, "ocio_query_worker", worker)
+    monkeypatch.setattr(
+        colorspace,
+        "run_openpype_process",
+        lambda *args, **kwargs: _write_output(args)
+    )
+
+    assert colorspace.get_data_subprocess("config.ocio", "get_views") == {
+        "view": {}
+    }
+
+
+def _write_output(args):
+    out_path = args[args.index("--out_path") + 1]
+    with open(out_path, "w") as stream:
+        stream.write('{"view": {}}')
@@ -0,0 +1,88 @@
+import os
+import importlib.machinery
+
+from openpype.pipeline.plugin_discover import PluginModulesCache
+
+PLUGIN_CONTENT = """
+def get_value():
+    return {value}
+
+
+class CollectSomething(object):
+    enabled = True
+    value = {value}
+
+
+class CollectOther(CollectSomething):
+    pass
+"""
+
+
+def _write_plugin(dirpath, value):
+    filepath = os.path.join(str(dirpath), "collect_something.py")
+    with open(filepath, "w") as stream:
+        stream.write(PLUGIN_CONTENT.format(value=value))
+    return filepath
+
+
+def _get_plugin_class(cache, dirpath):
+    modules, crashed = cache.get_modules(str(dirpath))
+    assert not crashed
+    assert len(modules) == 1
+    return modules[0][1].CollectSomething
+
+
+def test_discoveries_return_new_classes(tmp_path, monkeypatch):
+    _write_plugin(tmp_path, 1)
+    cache = PluginModulesCache()
+    get_code = importlib.machinery.SourceFileLoader.get_code
+    calls = []
+
+    def _get_code(loader, name):
+        calls.append(name)
+        return get_code(loader, name)
+
+    monkeypatch.setattr(
+        importlib.machinery.SourceFileLoader, "get_code", _get_code
+    )
+
+    first_module = cache.get_modules(str(tmp_path))[0][0][1]
+    first_cls = first_module.CollectSomething
+    # e.g. settings disabled the plugin for one project
+    first_cls.enabled = False
+    # Subclass inherits values set on parent class of the same discovery
+    assert first_module.CollectOther.enabled is False
+
+    second_module = cache.get_modules(str(tmp_path))[0][0][1]
+    second_cls = second_module.CollectSomething
+    assert second_cls is not first_cls
+    assert second_cls.enabled is True
+    assert second_module.CollectOther.enabled is True
+    assert issubclass(second_module.CollectOther, second_cls)
+
+    # File was executed only once
+    assert calls == ["collect_something"]
+    assert second_module.get_value is first_module.get_value
+
+
+def test_changed_file_is_read_again(tmp_path):
+    filepath = _write_plugin(tmp_path, 1)
+    cache = PluginModulesCache()
+    assert _get_plugin_class(cache, tmp_path).value == 1
+
+    _write_plugin(tmp_path, 22)
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert _get_plugin_class(cache, tmp_path).value == 22
+
+
+def test_crashed_file_is_not_cached(tmp_path):
+    filepath = os.path.join(str(tmp_path), "broken_plugin.py")
+    with open(filepath, "w") as stream:
+        stream.write("raise RuntimeError('Environment is not ready')\n")
+
+    cache = PluginModulesCache()
+    for _ in range(2):
+        modules, crashed = cache.get_modules(str(tmp_path))
+        assert not modules
+        assert [item[0] for item in crashed] == [filepath]
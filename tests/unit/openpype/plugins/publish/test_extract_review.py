@@ -27,3 +27,93 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def _get_output_item(name, input_args=None, video_filters=None,
+                     audio_filters=None, output_args=None):
+    if input_args is None:
+        input_args = ["-y", "-i \"/tmp/input.mov\""]
+    if output_args is None:
+        output_args = ["-an", "\"/tmp/{}.mp4\"".format(name)]
+    return {
+        "output_name": name,
+        "ffmpeg_parts": (
+            input_args,
+            video_filters or [],
+            audio_filters or [],
+            output_args
+        ),
+    }
+
+
+def test_get_single_pass_key():
+    plugin = ExtractReview()
+    item = _get_output_item("h264", video_filters=["scale=1920:1080"])
+    assert plugin._get_single_pass_key(item) == tuple(
+        item["ffmpeg_parts"][0]
+    )
+
+    # Audio filters, multiple inputs, mapping and labeled filters
+    assert plugin._get_single_pass_key(
+        _get_output_item("audio", audio_filters=["adeclick"])
+    ) is None
+    assert plugin._get_single_pass_key(
+        _get_output_item("audio", output_args=["-af adeclick", "out.mp4"])
+    ) is None
+    assert plugin._get_single_pass_key(_get_output_item(
+        "inputs", input_args=["-i \"a.mov\"", "-i \"b.wav\""]
+    )) is None
+    assert plugin._get_single_pass_key(
+        _get_output_item("map", output_args=["-map 0:v", "out.mp4"])
+    ) is None
+    assert plugin._get_single_pass_key(
+        _get_output_item("label", video_filters=["[in]scale=10:10[out]"])
+    ) is None
+
+
+def test_group_output_items():
+    plugin = ExtractReview()
+    first = _get_output_item("first")
+    separate = _get_output_item("separate", audio_filters=["adeclick"])
+    second = _get_output_item("second")
+    other_input = _get_output_item(
+        "other", input_args=["-i \"/tmp/other.mov\""]
+    )
+
+    groups = plugin._group_output_items(
+        [first, separate, second, other_input]
+    )
+    assert groups == [[first, second], [separate], [other_input]]
+
+    plugin.single_pass_outputs = False
+    groups = plugin._group_output_items([first, second])
+    assert groups == [[first], [second]]
+
+
+def test_single_pass_ffmpeg_args():
+    plugin = ExtractReview()
+    plugin.ffmpeg_path = "ffmpeg"
+    items = [
+        _get_output_item(
+            "small",
+            video_filters=["scale=960:540"],
+            output_args=["-vf pad=960:600", "\"/tmp/small.mp4\""]
+        ),
+        _get_output_item("silent"),
+    ]
+
+    args = plugin._single_pass_ffmpeg_args(items)
+    assert args[:3] == ["ffmpeg", "-y", "-i \"/tmp/input.mov\""]
+    assert args[3:5] == [
+        "-filter_complex",
+        "\"[0:v]split=2[s0][s1];"
+        "[s0]scale=960:540,pad=960:600[v0];"
+        "[s1]null[v1]\"",
+    ]
+    # Audio of input is kept for outputs which don't disable it
+    assert args[5:] == [
+        "-map", "\"[v0]\"", "-map", "0:a?", "\"/tmp/small.mp4\"",
+        "-map", "\"[v1]\"", "-an", "\"/tmp/silent.mp4\"",
+    ]
+    # Filters of output items are not modified
+    assert items[0]["ffmpeg_parts"][1] == ["scale=960:540"]
@@ -0,0 +1,130 @@
+import pytest
+
+from openpype.settings import lib as settings_lib
+from openpype.settings.lib import ResolvedSettingsCache
+
+
+class _State(object):
+    def __init__(self):
+        self.saved_info = 1
+        self.resolve_count = 0
+        self.active_site = "studio"
+
+
+@pytest.fixture
+def settings_state(monkeypatch):
+    state = _State()
+
+    def _get_project_settings(project_name, clear_metadata, exclude_locals):
+        assert exclude_locals is True
+        state.resolve_count += 1
+        return {
+            "global": {
+                "sync_server": {"config": {"active_site": "studio"}}
+            }
+        }
+
+    monkeypatch.setattr(
+        settings_lib, "_get_project_settings", _get_project_settings
+    )
+    monkeypatch.setattr(
+        settings_lib,
+        "get_project_last_saved_info",
+        lambda project_name: (project_name, state.saved_info)
+    )
+    monkeypatch.setattr(
+        settings_lib,
+        "get_local_settings",
+        lambda: {
+            "projects": {
+                "test_project": {"active_site": state.active_site}
+            }
+        }
+    )
+    monkeypatch.setattr(
+        settings_lib, "_RESOLVED_SETTINGS_CACHE", ResolvedSettingsCache()
+    )
+    return state
+
+
+def _expire(cache):
+    for key, item in tuple(cache._items.items()):
+        cache._items[key] = (0, ) + item[1:]
+
+
+def _get_active_site():
+    settings = settings_lib._get_cached_project_settings("test_project")
+    return settings["global"]["sync_server"]["config"]["active_site"]
+
+
+def test_value_is_reused_within_lifetime(monkeypatch):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_LIFETIME", "100")
+    cache = ResolvedSettingsCache()
+    calls = []
+
+    def _create():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = cache.get_value("key", lambda: 1, _create)
+    first["value"] = "changed"
+    assert cache.get_value("key", lambda: 2, _create) == {"value": 1}
+    assert len(calls) == 1
+
+
+def test_stamp_is_checked_after_lifetime(monkeypatch):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_LIFETIME", "100")
+    cache = ResolvedSettingsCache()
+    stamp = {"value": 1}
+    calls = []
+
+    def _create():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    cache.get_value("key", lambda: stamp["value"], _create)
+    _expire(cache)
+    assert cache.get_value("key", lambda: stamp["value"], _create) == {
+        "value": 1
+    }
+
+    stamp["value"] = 2
+    _expire(cache)
+    assert cache.get_value("key", lambda: stamp["value"], _create) == {
+        "value": 2
+    }
+
+
+def test_disabled_cache(monkeypatch):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_LIFETIME", "0")
+    cache = ResolvedSettingsCache()
+    calls = []
+    for _ in range(2):
+        cache.get_value("key", lambda: 1, lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_local_settings_applied_on_each_call(monkeypatch, settings_state):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_LIFETIME", "100")
+
+    assert _get_active_site() == "studio"
+
+    # Local settings saved by other process
+    settings_state.active_site = "local_0"
+    assert _get_active_site() == "local_0"
+    assert settings_state.resolve_count == 1
+
+
+def test_project_override_save_resolves_again(monkeypatch, settings_state):
+    monkeypatch.setenv("OPENPYPE_SETTINGS_CACHE_LIFETIME", "100")
+    cache = settings_lib._RESOLVED_SETTINGS_CACHE
+
+    _get_active_site()
+    _expire(cache)
+    _get_active_site()
+    assert settings_state.resolve_count == 1
+
+    settings_state.saved_info = 2
+    _expire(cache)
+    _get_active_site()
+    assert settings_state.resolve_count == 2